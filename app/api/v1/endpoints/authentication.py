@@ -5,27 +5,24 @@ Uses dependency injection to follow Dependency Inversion Principle.
 The endpoint depends on IAuthenticationService abstraction, not concrete implementation.
 """
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 
-from app.db.firebase_admin import get_firebase_app
 from app.interfaces.authentication import IAuthenticationService
-from app.repositories.authentication import AuthenticationRepository
 from app.schemas.authentication import RegistrationRequest
-from app.services.authentication import AuthenticationService
 
 router = APIRouter(prefix="/authentication", tags=["Authentication"])
 
 
-def get_auth_service() -> IAuthenticationService:
+def get_auth_service(request: Request) -> IAuthenticationService:
     """
     Dependency provider for authentication service.
 
+    Returns the instance built at startup and stored on app.state.services.
+
     Returns:
         An implementation of IAuthenticationService.
     """
-    firebase_app = get_firebase_app()
-    repo = AuthenticationRepository()
-    return AuthenticationService(firebase_app, repo)
+    return request.app.state.services.auth
 
 
 @router.post("/register")
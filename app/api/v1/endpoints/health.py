@@ -5,11 +5,16 @@ Provides liveness and readiness probes for container orchestration
 and monitoring systems.
 """
 
+import asyncio
+import contextlib
 import logging
+from time import monotonic
+from typing import Any, Dict, Optional
 
-from fastapi import APIRouter, status
+import orjson
+from fastapi import APIRouter, Response, status
 
-from app.api.deps import SettingsDep
+from app.config.settings import settings
 from app.db.firebase_admin import get_firebase_app
 from app.db.firestore import check_firestore_connection
 from app.db.realtime_db import check_realtime_db_connection
@@ -19,6 +24,28 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["Health"])
 
+# Last readiness result and its serialized body, shared by all probes within the cache TTL
+_cache: Dict[str, Any] = {
+    "ts": 0.0,
+    "result": None,
+    "body": b"",
+    "ready_ts": 0.0,
+    "ready_result": None,
+}
+_cache_lock = asyncio.Lock()
+
+# Background task keeping `_cache` fresh, started from the application lifespan
+_refresher: Optional[asyncio.Task] = None
+
+# Settings are fixed once loaded, so resolve the values probes report up front
+_APP_VERSION = settings.app_version
+_ENV_VALUE = settings.environment_name
+
+# Liveness response never changes for the life of the process, so serialize it once
+_HEALTH_BODY = orjson.dumps(
+    HealthStatus(status="healthy", version=_APP_VERSION, environment=_ENV_VALUE).model_dump()
+)
+
 
 @router.get(
     "/health",
@@ -27,47 +54,40 @@ router = APIRouter(tags=["Health"])
     summary="Health Check",
     description="Basic liveness probe. Returns 200 if the service is running.",
 )
-async def health_check(settings: SettingsDep) -> HealthStatus:
+async def health_check() -> Response:
     """
     Basic health check endpoint.
 
     Returns application status, version, and environment.
     Used as a liveness probe for container orchestration.
+    The body is serialized once at import time, so probes resolve no
+    dependencies and do no validation or encoding.
     """
-    return HealthStatus(
-        status="healthy",
-        version=settings.app_version,
-        environment=settings.environment.value,
-    )
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
-@router.get(
-    "/health/ready",
-    status_code=status.HTTP_200_OK,
-    summary="Readiness Check",
-    description="Readiness probe checking Firestore and Realtime Database.",
-)
-async def readiness_check(settings: SettingsDep):
-    """
-    Readiness check endpoint.
-
-    Verifies that the application is ready to receive traffic by checking:
-    - Firestore connectivity
-    - Realtime Database connectivity (if configured)
-    - Firebase project details
-
-    Returns detailed status of each dependency.
-    """
+async def _run_readiness_checks() -> Dict[str, Any]:
+    """Check every dependency concurrently and build the readiness payload."""
     checks = {}
+    all_healthy = True
+    timeout = settings.readiness_check_timeout
 
-    # Check Firestore connection
-    firestore_healthy = await check_firestore_connection()
-    checks["firestore"] = "healthy" if firestore_healthy else "unhealthy"
-
-    # Check Realtime Database connection (only if configured)
+    # Check Firestore and Realtime Database (only if configured) concurrently,
+    # bounding each so a hung dependency can't exceed the probe timeout
+    probes = {"firestore": check_firestore_connection()}
     if settings.realtime_database_url:
-        rtdb_healthy = await check_realtime_db_connection()
-        checks["realtime_db"] = "healthy" if rtdb_healthy else "unhealthy"
+        probes["realtime_db"] = check_realtime_db_connection()
+
+    results = await asyncio.gather(
+        *(asyncio.wait_for(probe, timeout=timeout) for probe in probes.values()),
+        return_exceptions=True,
+    )
+    for name, result in zip(probes, results):
+        if isinstance(result, BaseException):
+            logger.error(f"Readiness check for {name} failed: {result!r}")
+        healthy = result is True
+        all_healthy &= healthy
+        checks[name] = "healthy" if healthy else "unhealthy"
 
     # Get Firebase project details
     firebase_info = {}
@@ -81,14 +101,107 @@ async def readiness_check(settings: SettingsDep):
         firebase_info["error"] = str(e)
 
     # Determine overall status
-    all_healthy = all(status == "healthy" for status in checks.values())
     overall_status = "ready" if all_healthy else "not_ready"
 
     if not all_healthy:
-        logger.warning(f"Readiness check failed: {checks}")
+        logger.warning("Readiness check failed: %s", checks)
 
     return {
         "status": overall_status,
         "checks": checks,
         "firebase": firebase_info,
     }
+
+
+async def _refresh_readiness() -> Dict[str, Any]:
+    """
+    Re-check dependencies and store the result in the readiness cache.
+
+    Callers must hold `_cache_lock`.
+    """
+    now = monotonic()
+    result = await _run_readiness_checks()
+
+    if result["status"] == "ready":
+        _cache["ready_ts"] = now
+        _cache["ready_result"] = result
+    elif (
+        _cache["ready_result"] is not None
+        and now - _cache["ready_ts"] < settings.readiness_stale_ttl
+    ):
+        logger.warning("Serving last known good readiness result")
+        result = _cache["ready_result"]
+
+    _cache["ts"] = now
+    _cache["result"] = result
+    _cache["body"] = orjson.dumps(result)
+    return result
+
+
+async def _refresh_periodically() -> None:
+    """Keep the readiness cache fresh so probes never wait on the databases."""
+    while True:
+        try:
+            async with _cache_lock:
+                await _refresh_readiness()
+        except Exception:
+            logger.exception("Background readiness refresh failed")
+        await asyncio.sleep(settings.readiness_refresh_interval)
+
+
+def start_readiness_refresher() -> None:
+    """Start the background readiness refresher if enabled and not already running."""
+    global _refresher
+
+    if _refresher is not None or settings.readiness_refresh_interval <= 0:
+        return
+
+    _refresher = asyncio.create_task(_refresh_periodically())
+
+
+async def stop_readiness_refresher() -> None:
+    """Cancel the background readiness refresher and wait for it to exit."""
+    global _refresher
+
+    if _refresher is None:
+        return
+
+    _refresher.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await _refresher
+    _refresher = None
+
+
+@router.get(
+    "/health/ready",
+    status_code=status.HTTP_200_OK,
+    summary="Readiness Check",
+    description="Readiness probe checking Firestore and Realtime Database.",
+)
+async def readiness_check() -> Response:
+    """
+    Readiness check endpoint.
+
+    Verifies that the application is ready to receive traffic by checking:
+    - Firestore connectivity
+    - Realtime Database connectivity (if configured)
+    - Firebase project details
+
+    When the background refresher is running, probes are answered from its
+    latest result without touching the databases. Otherwise results are
+    cached for `readiness_cache_ttl` seconds. Either way, if a re-check fails
+    the last ready result is served for up to `readiness_stale_ttl` seconds
+    so a transient blip doesn't flap the probe.
+
+    Returns detailed status of each dependency.
+    """
+    if _cache["result"] is None or (
+        _refresher is None and monotonic() - _cache["ts"] >= settings.readiness_cache_ttl
+    ):
+        async with _cache_lock:
+            # Another probe may have refreshed the cache while we waited
+            ttl = settings.readiness_cache_ttl
+            if _cache["result"] is None or monotonic() - _cache["ts"] >= ttl:
+                await _refresh_readiness()
+
+    return Response(content=_cache["body"], media_type="application/json")
@@ -4,24 +4,31 @@ Medical info API endpoints.
 Provides endpoints for getting and setting user medical info.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 
 from app.interfaces.medical_info import IMedicalInfoService
-from app.repositories.medical_info_repository import MedicalInfoRepository
 from app.schemas.medical_info import MedicalInfoRequest, MedicalInfoResponse
-from app.services.medical_info import MedicalInfoService
 
 router = APIRouter(prefix="/medical-info", tags=["Medical Info"])
 
 
-def get_medical_info_service() -> IMedicalInfoService:
+def get_medical_info_service(request: Request) -> IMedicalInfoService:
     """
     Dependency provider for medical info service.
 
-    Wires up: Firestore -> MedicalInfoRepository -> MedicalInfoService
+    Returns the instance built at startup and stored on app.state.services.
     """
-    repo = MedicalInfoRepository()
-    return MedicalInfoService(repo)
+    return request.app.state.services.medical_info
+
+
+def _medical_info_response(data: MedicalInfoResponse) -> Response:
+    """
+    Serialize a medical info payload straight to JSON bytes.
+
+    Returning a ready Response skips FastAPI's separate response_model
+    validation and jsonable_encoder walk; response_model is kept for the docs.
+    """
+    return Response(content=data.model_dump_json(), media_type="application/json")
 
 
 @router.get("/{user_id}", response_model=MedicalInfoResponse)
@@ -45,7 +52,8 @@ async def get_medical_info(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Medical info not found for user {user_id}",
         )
-    return result
+    # Stored data was written by this API, so it isn't re-validated
+    return _medical_info_response(MedicalInfoResponse.from_trusted(result))
 
 
 @router.post("/{user_id}", response_model=MedicalInfoResponse)
@@ -65,8 +73,10 @@ async def set_medical_info(
     Returns:
         Saved medical info.
     """
-    return await service.set_medical_info(
+    result = await service.set_medical_info(
         user_id=user_id,
         height=request.height,
         weight=request.weight,
     )
+    # Built from the validated request body, so it isn't re-validated
+    return _medical_info_response(MedicalInfoResponse.from_trusted(result))
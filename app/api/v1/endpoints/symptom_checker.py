@@ -4,28 +4,27 @@ Symptom Checker API endpoints.
 Provides endpoints for initializing and submitting symptom checker conversations.
 """
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 
 from app.interfaces.symptom_checker import ISymptomCheckerService
-from app.repositories.symptom_checker import SymptomCheckerRepository
 from app.schemas.symptom_checker import SymptomCheckerSubmitInput
-from app.services.symptom_checker import SymptomCheckerService
 
 router = APIRouter(prefix="/symptom-checker", tags=["Symptom Checker"])
 
 
-def get_symptom_checker_service() -> ISymptomCheckerService:
+def get_symptom_checker_service(request: Request) -> ISymptomCheckerService:
     """
     Dependency provider for symptom checker service.
 
-    Wires up: Firestore -> SymptomCheckerRepository -> SymptomCheckerService
+    Returns the instance built at startup and stored on app.state.services.
     """
-    repo = SymptomCheckerRepository()
-    return SymptomCheckerService(repo)
+    return request.app.state.services.symptom_checker
 
 
 @router.post("/init")
-def init_symptom_checker(service: ISymptomCheckerService = Depends(get_symptom_checker_service)):
+async def init_symptom_checker(
+    service: ISymptomCheckerService = Depends(get_symptom_checker_service),
+):
     """
     Initialize the symptom checker.
 
@@ -35,11 +34,11 @@ def init_symptom_checker(service: ISymptomCheckerService = Depends(get_symptom_c
     Returns:
         Dictionary with the new conversation_id.
     """
-    return service.init()
+    return await service.init()
 
 
 @router.post("/submit")
-def submit_symptom_checker(
+async def submit_symptom_checker(
     input_value: SymptomCheckerSubmitInput,
     service: ISymptomCheckerService = Depends(get_symptom_checker_service),
 ):
@@ -53,4 +52,4 @@ def submit_symptom_checker(
     Returns:
         Submission status response.
     """
-    return service.submit(input_value.conversation_id, input_value.symptoms)
+    return await service.submit(input_value.conversation_id, input_value.symptoms)
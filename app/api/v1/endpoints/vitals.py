@@ -4,25 +4,39 @@ Vitals API endpoints.
 Provides endpoints for updating user vitals.
 """
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 
-from app.db.realtime_db import get_realtime_client
 from app.interfaces.vitals import IVitalsService
-from app.repositories.vitals_repository import VitalsRepository
-from app.services.vitals import VitalsService
+from app.schemas.vitals import VitalsBulkUpdateRequest
 
 router = APIRouter(prefix="/vitals", tags=["Vitals"])
 
 
-def get_vitals_service() -> IVitalsService:
+def get_vitals_service(request: Request) -> IVitalsService:
     """
     Dependency provider for vitals service.
 
-    Wires up: get_realtime_client -> VitalsRepository -> VitalsService
+    Returns the instance built at startup and stored on app.state.services.
     """
-    rdb = get_realtime_client(base_path="medical_dashboard")
-    repo = VitalsRepository(rdb)
-    return VitalsService(repo)
+    return request.app.state.services.vitals
+
+
+@router.post("")
+async def bulk_update_vitals(
+    request: VitalsBulkUpdateRequest,
+    vitals_service: IVitalsService = Depends(get_vitals_service),
+):
+    """
+    Update several users' vitals with random values in one database write.
+
+    Args:
+        request: The user IDs to update.
+        vitals_service: Injected vitals service.
+
+    Returns:
+        Update status response with generated values per user.
+    """
+    return await vitals_service.bulk_update_vitals(user_ids=request.user_ids)
 
 
 @router.post("/{user_id}")
@@ -16,5 +16,4 @@ router.include_router(health.router)
 router.include_router(authentication.router)
 router.include_router(vitals.router)
 router.include_router(medical_info.router)
-
 router.include_router(symptom_checker.router)
@@ -8,9 +8,9 @@ Configuration is loaded from environment variables and .env files.
 from enum import Enum
 from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import Any, Tuple
 
-from pydantic import Field, field_validator
+from pydantic import Field, PrivateAttr, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -22,6 +22,11 @@ class Environment(str, Enum):
     PRODUCTION = "production"
 
 
+def _split_csv(value: str) -> Tuple[str, ...]:
+    """Split a comma-separated setting into stripped, non-empty items."""
+    return tuple(item.strip() for item in value.split(",") if item.strip())
+
+
 class Settings(BaseSettings):
     """
     Application settings loaded from environment variables.
@@ -89,24 +94,103 @@ class Settings(BaseSettings):
         default="localhost:9099",
         description="Firestore emulator host",
     )
+    firestore_keepalive_time_ms: int = Field(
+        default=30_000,
+        description="Milliseconds between gRPC keepalive pings on the Firestore channel",
+    )
+    firestore_keepalive_timeout_ms: int = Field(
+        default=10_000,
+        description="Milliseconds to wait for a keepalive ack before reconnecting",
+    )
+    firestore_batch_window_ms: int = Field(
+        default=0,
+        description="Milliseconds to coalesce symptom checker message writes (0 disables batching)",
+    )
 
     # Firebase Realtime Database
     realtime_database_url: str = Field(
         default="",
         description="Firebase Realtime Database URL (e.g., https://your-project.firebaseio.com)",
     )
+    blocking_pool_size: int = Field(
+        default=64,
+        description="Worker threads for blocking Firestore/Firebase SDK calls",
+    )
+    rtdb_batch_window_ms: int = Field(
+        default=0,
+        description="Milliseconds to coalesce Realtime Database writes (0 disables batching)",
+    )
+
+    # Health checks
+    readiness_cache_ttl: float = Field(
+        default=5.0,
+        description="Seconds a readiness check result is reused before re-checking dependencies",
+    )
+    readiness_stale_ttl: float = Field(
+        default=30.0,
+        description="Seconds a last-known-good readiness result is served when a re-check fails",
+    )
+    readiness_check_timeout: float = Field(
+        default=2.0,
+        description="Seconds each readiness dependency check may take before it is unhealthy",
+    )
+    readiness_refresh_interval: float = Field(
+        default=30.0,
+        description="Seconds between background readiness re-checks (0 disables the refresher)",
+    )
+
+    # Caching
+    repository_cache_ttl: float = Field(
+        default=0.0,
+        description="Seconds a Firestore document read is cached in-process (0 disables)",
+    )
+    repository_cache_size: int = Field(
+        default=10_000,
+        description="Maximum cached Firestore documents per repository",
+    )
+    token_cache_ttl: float = Field(
+        default=30.0,
+        description=(
+            "Seconds a verified ID token's claims are reused by /auth/me (0 disables); "
+            "a disabled user or revoked token can still be served for this long"
+        ),
+    )
+    token_cache_size: int = Field(
+        default=10_000,
+        description="Maximum cached verified ID tokens",
+    )
 
     # External Services
     agent_url: str = Field(
         default="http://0.0.0.0:8081",
         description="Symptom checker agent service URL",
     )
+    agent_timeout: float = Field(
+        default=30.0,
+        description="Seconds to wait for the symptom checker agent to respond",
+    )
+    agent_max_connections: int = Field(
+        default=100,
+        description="Maximum pooled connections to the symptom checker agent",
+    )
 
     # CORS
     cors_origins: str = Field(
         default="http://localhost:3000",
         description="Comma-separated list of allowed CORS origins",
     )
+    cors_allow_methods: str = Field(
+        default="GET,POST,PUT,PATCH,DELETE,OPTIONS",
+        description="Comma-separated list of allowed CORS methods",
+    )
+    cors_allow_headers: str = Field(
+        default="Authorization,Content-Type,X-Request-ID,X-Trace-ID",
+        description="Comma-separated list of allowed CORS request headers",
+    )
+    cors_allow_credentials: bool = Field(
+        default=True,
+        description="Allow credentialed (cookie) CORS requests",
+    )
 
     # Logging
     log_level: str = Field(
@@ -117,6 +201,10 @@ class Settings(BaseSettings):
         default=False,
         description="Use JSON format for logs",
     )
+    log_to_file: bool = Field(
+        default=True,
+        description="Also write JSON logs to logs/app.log when console logs are plain text",
+    )
 
     @field_validator("log_level")
     @classmethod
@@ -128,25 +216,59 @@ class Settings(BaseSettings):
             raise ValueError(f"Invalid log level: {v}. Must be one of {valid_levels}")
         return v_upper
 
+    # Derived values, computed once after validation
+    _cors_origins_list: Tuple[str, ...] = PrivateAttr(default=())
+    _cors_allow_methods_list: Tuple[str, ...] = PrivateAttr(default=())
+    _cors_allow_headers_list: Tuple[str, ...] = PrivateAttr(default=())
+    _environment_name: str = PrivateAttr(default="")
+    _is_development: bool = PrivateAttr(default=False)
+    _is_staging: bool = PrivateAttr(default=False)
+    _is_production: bool = PrivateAttr(default=False)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Precompute derived values so property reads are plain attribute lookups."""
+        self._cors_origins_list = _split_csv(self.cors_origins)
+        self._cors_allow_methods_list = _split_csv(self.cors_allow_methods)
+        self._cors_allow_headers_list = _split_csv(self.cors_allow_headers)
+        self._environment_name = str(self.environment.value)
+        self._is_development = self.environment == Environment.DEVELOPMENT
+        self._is_staging = self.environment == Environment.STAGING
+        self._is_production = self.environment == Environment.PRODUCTION
+
+    @property
+    def cors_origins_list(self) -> Tuple[str, ...]:
+        """CORS origins parsed from the comma-separated string."""
+        return self._cors_origins_list
+
+    @property
+    def cors_allow_methods_list(self) -> Tuple[str, ...]:
+        """CORS methods parsed from the comma-separated string."""
+        return self._cors_allow_methods_list
+
+    @property
+    def cors_allow_headers_list(self) -> Tuple[str, ...]:
+        """CORS request headers parsed from the comma-separated string."""
+        return self._cors_allow_headers_list
+
     @property
-    def cors_origins_list(self) -> List[str]:
-        """Parse CORS origins string into a list."""
-        return [origin.strip() for origin in self.cors_origins.split(",") if origin.strip()]
+    def environment_name(self) -> str:
+        """Environment as a plain string (e.g., "production") for logs and payloads."""
+        return self._environment_name
 
     @property
     def is_development(self) -> bool:
         """Check if running in development environment."""
-        return self.environment == Environment.DEVELOPMENT
+        return self._is_development
 
     @property
     def is_staging(self) -> bool:
         """Check if running in staging environment."""
-        return self.environment == Environment.STAGING
+        return self._is_staging
 
     @property
     def is_production(self) -> bool:
         """Check if running in production environment."""
-        return self.environment == Environment.PRODUCTION
+        return self._is_production
 
 
 def load_settings_for_environment(env: str | None = None) -> Settings:
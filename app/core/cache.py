@@ -0,0 +1,114 @@
+"""
+In-process caching helpers.
+
+Provides a small LRU cache with per-entry expiry for hot, rarely-changing
+reads such as user documents.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """
+    Bounded LRU cache whose entries expire after a fixed time-to-live.
+
+    Not thread-safe: intended for use from the event loop, where reads and
+    writes happen between awaits and so never interleave.
+
+    Read-through callers that await between missing the cache and storing the
+    result should use ``reserve``/``fill``: a ``pop`` or ``clear`` in between
+    (a concurrent write) voids the reservation, so the value read before the
+    write is never stored.
+
+    Example:
+        cache = TTLCache(maxsize=1000, ttl=60)
+        token = cache.reserve("user123")
+        profile = await load_profile("user123")
+        cache.fill("user123", token, profile)
+        cache.get("user123")
+    """
+
+    __slots__ = ("maxsize", "ttl", "_timer", "_data", "_fills")
+
+    def __init__(
+        self, maxsize: int, ttl: float, timer: Callable[[], float] = time.monotonic
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries; the least recently used is evicted.
+            ttl: Seconds an entry stays valid. 0 disables caching.
+            timer: Clock used for expiry (defaults to time.monotonic).
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._data: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+        # Outstanding reservations by key; invalidating a key discards its token
+        self._fills: Dict[Hashable, object] = {}
+
+    def get(self, key: Hashable, default: Optional[V] = None) -> Optional[V]:
+        """Return a live entry for key, or default if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if expires_at <= self._timer():
+            del self._data[key]
+            return default
+
+        self._data.move_to_end(key)
+        return value
+
+    def __setitem__(self, key: Hashable, value: V) -> None:
+        if self.ttl <= 0 or self.maxsize <= 0:
+            return
+
+        self._data[key] = (self._timer() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def reserve(self, key: Hashable) -> object:
+        """
+        Start a read-through fill of key and return the token to pass to fill().
+
+        Reservations that are never filled (e.g. the read failed) are dropped,
+        oldest first, once more than maxsize are outstanding.
+        """
+        token = object()
+        if self.ttl > 0 and self.maxsize > 0:
+            self._fills.pop(key, None)
+            self._fills[key] = token
+            if len(self._fills) > self.maxsize:
+                del self._fills[next(iter(self._fills))]
+        return token
+
+    def fill(self, key: Hashable, token: object, value: V) -> None:
+        """Store value for key unless key was invalidated since reserve() returned token."""
+        if self._fills.get(key) is token:
+            del self._fills[key]
+            self[key] = value
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key) is not None
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove key and return its value (expired or not), or default; voids fills in flight."""
+        self._fills.pop(key, None)
+        entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        """Remove all entries and void fills in flight."""
+        self._fills.clear()
+        self._data.clear()
@@ -0,0 +1,85 @@
+"""
+Helpers for running blocking code from async handlers.
+
+The Firebase Admin and Firestore SDKs used here are synchronous, so calls
+from coroutines are pushed to a shared thread pool to keep the event loop
+free. The pool size bounds how many SDK calls (and so concurrent gRPC
+requests on the client's channel) can be in flight at once.
+"""
+
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from app.config.settings import get_settings
+
+T = TypeVar("T")
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_blocking_executor() -> ThreadPoolExecutor:
+    """
+    Get or create the thread pool used for blocking SDK calls.
+
+    Returns:
+        ThreadPoolExecutor sized by the blocking_pool_size setting.
+    """
+    global _executor
+
+    if _executor is not None:
+        return _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=get_settings().blocking_pool_size,
+                thread_name_prefix="blocking-io",
+            )
+    return _executor
+
+
+def shutdown_blocking_executor() -> None:
+    """
+    Shut down the blocking-call thread pool, waiting for queued calls.
+
+    Should be called during application shutdown.
+    """
+    global _executor
+
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=True)
+            _executor = None
+
+
+async def run_blocking(func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    """
+    Run a blocking callable in the shared executor and await its result.
+
+    Behaves like asyncio.to_thread, copying the current contextvars into the
+    worker thread so request-scoped logging context is preserved. When no
+    context variables are set, the copy is skipped and the callable is
+    submitted directly.
+
+    Args:
+        func: Blocking callable to run.
+        *args: Positional arguments for func.
+        **kwargs: Keyword arguments for func.
+
+    Returns:
+        The value returned by func.
+    """
+    loop = asyncio.get_running_loop()
+    executor = get_blocking_executor()
+    if kwargs:
+        func = functools.partial(func, **kwargs)
+
+    ctx = contextvars.copy_context()
+    if not ctx:
+        return await loop.run_in_executor(executor, func, *args)
+    return await loop.run_in_executor(executor, ctx.run, func, *args)
@@ -7,7 +7,12 @@ Provides consistent error responses across the application.
 from typing import Any, Dict, Optional
 
 from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from fastapi.utils import is_body_allowed_for_status_code
+from starlette.exceptions import HTTPException as StarletteHTTPException
+from starlette.responses import Response
 
 
 class APIException(Exception):
@@ -191,9 +196,9 @@ def create_error_response(
     }
 
 
-async def api_exception_handler(request: Request, exc: APIException) -> JSONResponse:
+async def api_exception_handler(request: Request, exc: APIException) -> ORJSONResponse:
     """Handle APIException and return a JSON response."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content=create_error_response(
             status_code=exc.status_code,
@@ -205,14 +210,14 @@ async def api_exception_handler(request: Request, exc: APIException) -> JSONResp
     )
 
 
-async def generic_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def generic_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """Handle unexpected exceptions and return a JSON response."""
     import logging
 
     logger = logging.getLogger(__name__)
     logger.exception(f"Unhandled exception: {exc}")
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content=create_error_response(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -223,8 +228,31 @@ async def generic_exception_handler(request: Request, exc: Exception) -> JSONRes
     )
 
 
+async def http_exception_handler(request: Request, exc: StarletteHTTPException) -> Response:
+    """Handle framework HTTP errors (404, 405, ...) with the same body FastAPI uses."""
+    if not is_body_allowed_for_status_code(exc.status_code):
+        return Response(status_code=exc.status_code, headers=exc.headers)
+    return ORJSONResponse(
+        status_code=exc.status_code,
+        content={"detail": exc.detail},
+        headers=exc.headers,
+    )
+
+
+async def validation_exception_handler(
+    request: Request, exc: RequestValidationError
+) -> ORJSONResponse:
+    """Handle request validation errors with the same body FastAPI uses."""
+    return ORJSONResponse(
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        content={"detail": jsonable_encoder(exc.errors())},
+    )
+
+
 def register_exception_handlers(app: FastAPI) -> None:
     """Register all exception handlers with the FastAPI app."""
     app.add_exception_handler(APIException, api_exception_handler)
+    app.add_exception_handler(StarletteHTTPException, http_exception_handler)
+    app.add_exception_handler(RequestValidationError, validation_exception_handler)
     # Optionally catch all unhandled exceptions in production
     # app.add_exception_handler(Exception, generic_exception_handler)
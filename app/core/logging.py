@@ -4,6 +4,9 @@ Logging configuration for the application.
 Supports structured JSON logging for production and human-readable console
 logging for development. In development, also writes JSON logs to a file.
 
+Records are handed to a background listener thread through a queue, so
+formatting and I/O stay off the request path.
+
 Production logs include:
 - ISO 8601 timestamps with timezone
 - Service name and version
@@ -12,14 +15,20 @@ Production logs include:
 - File, line, and function for debugging
 """
 
+import atexit
 import contextvars
+import io
 import logging
+import queue
 import sys
+import threading
 import uuid
 from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+import orjson
 from pythonjsonlogger import jsonlogger
 
 from app.config.settings import get_settings
@@ -34,18 +43,35 @@ trace_id_ctx: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
 user_id_ctx: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("user_id", default=None)
 
 
+ContextTokens = List[Tuple[contextvars.ContextVar, contextvars.Token]]
+
+
 def set_request_context(
     request_id: Optional[str] = None,
     trace_id: Optional[str] = None,
     user_id: Optional[str] = None,
-) -> None:
-    """Set request-scoped context for logging."""
+) -> ContextTokens:
+    """
+    Set request-scoped context for logging.
+
+    Returns:
+        Tokens for the variables that were set; pass them to
+        reset_request_context once the request finishes.
+    """
+    tokens: ContextTokens = []
     if request_id:
-        request_id_ctx.set(request_id)
+        tokens.append((request_id_ctx, request_id_ctx.set(request_id)))
     if trace_id:
-        trace_id_ctx.set(trace_id)
+        tokens.append((trace_id_ctx, trace_id_ctx.set(trace_id)))
     if user_id:
-        user_id_ctx.set(user_id)
+        tokens.append((user_id_ctx, user_id_ctx.set(user_id)))
+    return tokens
+
+
+def reset_request_context(tokens: ContextTokens) -> None:
+    """Restore the context variables changed by set_request_context."""
+    for var, token in reversed(tokens):
+        var.reset(token)
 
 
 def generate_request_id() -> str:
@@ -53,13 +79,156 @@ def generate_request_id() -> str:
     return str(uuid.uuid4())[:8]
 
 
+# Records queued by the request path and drained by the listener thread
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_listener: Optional[QueueListener] = None
+
+
+class CachedMessageLogRecord(logging.LogRecord):
+    """
+    LogRecord that merges `msg % args` only once.
+
+    In development both the console and file handlers format every record;
+    caching the merged message means the %-interpolation runs a single time.
+    """
+
+    _cached_message: Optional[str] = None
+
+    def getMessage(self) -> str:
+        if self._cached_message is None:
+            self._cached_message = super().getMessage()
+        return self._cached_message
+
+
+class ContextFilter(logging.Filter):
+    """
+    Stamp request-scoped context onto each record in the logging thread.
+
+    Formatters may run in the listener thread, where the request's contextvars
+    aren't visible, so the values are captured here once per record. The
+    attributes are underscore-prefixed so JsonFormatter doesn't also merge
+    them as extra fields.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record._request_id = request_id_ctx.get()
+        record._trace_id = trace_id_ctx.get()
+        record._user_id = user_id_ctx.get()
+        return True
+
+
+class ContextQueueHandler(QueueHandler):
+    """
+    Queue handler that passes raw records to the listener thread.
+
+    Carries a ContextFilter so request context is captured before enqueueing.
+    Message merging and formatting are left to the listener's handlers,
+    keeping the enqueue path cheap.
+    """
+
+    def __init__(self, queue: "queue.SimpleQueue[logging.LogRecord]") -> None:
+        super().__init__(queue)
+        self.addFilter(ContextFilter())
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class BufferedFileHandler(logging.StreamHandler):
+    """
+    File handler that batches writes through a large userspace buffer.
+
+    Records are flushed to disk every `flush_interval` seconds by a background
+    thread, and immediately for records at or above `flush_level`, so routine
+    logs cost a buffered write rather than a syscall each.
+    """
+
+    def __init__(
+        self,
+        filename: Path,
+        flush_interval: float = 1.0,
+        flush_level: int = logging.WARNING,
+        buffer_size: int = 64 * 1024,
+    ) -> None:
+        raw = open(filename, "ab", buffering=0)
+        stream = io.TextIOWrapper(
+            io.BufferedWriter(raw, buffer_size=buffer_size),
+            encoding="utf-8",
+            write_through=False,
+            line_buffering=False,
+        )
+        super().__init__(stream)
+        self.flush_level = flush_level
+        self._stop_flushing = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically,
+            args=(flush_interval,),
+            name="log-file-flush",
+            daemon=True,
+        )
+        self._flusher.start()
+
+    def _flush_periodically(self, interval: float) -> None:
+        while not self._stop_flushing.wait(interval):
+            self.flush()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= self.flush_level:
+                self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def close(self) -> None:
+        self._stop_flushing.set()
+        self.acquire()
+        try:
+            if self.stream is not None:
+                self.stream.flush()
+                self.stream.close()
+                self.stream = None
+        finally:
+            self.release()
+        super().close()
+
+
+# Bound once to skip attribute lookups in the per-record formatter path
+_now = datetime.now
+_UTC = timezone.utc
+
+
+def _orjson_dumps(obj: Any, default: Any = None, **_: Any) -> str:
+    """
+    Serialize a log record with orjson.
+
+    Accepts (and ignores) the json.dumps-style keyword arguments that
+    JsonFormatter passes. Output is compact, UTF-8 and single-line, with
+    datetimes encoded natively as ISO 8601 with a trailing Z. Values orjson
+    can't encode (Decimal, sets, exceptions, ...) fall back to str so the
+    record is still written.
+    """
+    return orjson.dumps(
+        obj, default=default or str, option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+    ).decode()
+
+
 class ProductionJsonFormatter(jsonlogger.JsonFormatter):
     """Production-ready JSON formatter with comprehensive fields."""
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
-        kwargs.setdefault("json_indent", 2)
+        # One compact record per line for newline-delimited log consumers
+        kwargs.setdefault("json_serializer", _orjson_dumps)
         super().__init__(*args, **kwargs)
-        self.settings = get_settings()
+        # Service identification never changes, so resolve it once per formatter
+        settings = get_settings()
+        self._static = {
+            "service": settings.app_name,
+            "version": settings.app_version,
+            "environment": settings.environment_name,
+        }
 
     def add_fields(
         self,
@@ -69,25 +238,28 @@ class ProductionJsonFormatter(jsonlogger.JsonFormatter):
     ) -> None:
         super().add_fields(log_record, record, message_dict)
 
-        # ISO 8601 timestamp with timezone
-        log_record["timestamp"] = datetime.now(timezone.utc).isoformat()
+        # ISO 8601 timestamp with timezone (orjson encodes the datetime directly)
+        log_record["timestamp"] = _now(_UTC)
 
         # Standard fields
         log_record["level"] = record.levelname
         log_record["logger"] = record.name
 
         # Service identification
-        log_record["service"] = self.settings.app_name
-        log_record["version"] = self.settings.app_version
-        log_record["environment"] = self.settings.environment.value
-
-        # Request context (if available)
-        if request_id_ctx.get():
-            log_record["request_id"] = request_id_ctx.get()
-        if trace_id_ctx.get():
-            log_record["trace_id"] = trace_id_ctx.get()
-        if user_id_ctx.get():
-            log_record["user_id"] = user_id_ctx.get()
+        log_record.update(self._static)
+
+        # Request context (if available), stamped by ContextFilter. A dict
+        # lookup avoids getattr raising AttributeError for unstamped records.
+        get_extra = record.__dict__.get
+        request_id = get_extra("_request_id")
+        if request_id:
+            log_record["request_id"] = request_id
+        trace_id = get_extra("_trace_id")
+        if trace_id:
+            log_record["trace_id"] = trace_id
+        user_id = get_extra("_user_id")
+        if user_id:
+            log_record["user_id"] = user_id
 
         # Code location
         log_record["file"] = record.filename
@@ -111,8 +283,18 @@ def setup_logging(
                    If None, uses settings.
         json_format: Whether to use JSON format. If None, uses settings.
     """
+    global _listener
+
     settings = get_settings()
 
+    # Stop any listener from a previous call before reconfiguring
+    shutdown_logging()
+
+    # Format each record's message once, however many handlers emit it
+    # (left alone if something else already installed a custom factory)
+    if logging.getLogRecordFactory() is logging.LogRecord:
+        logging.setLogRecordFactory(CachedMessageLogRecord)
+
     # Use provided values or fall back to settings
     level = log_level or settings.log_level
     use_json = json_format if json_format is not None else settings.log_json_format
@@ -121,9 +303,10 @@ def setup_logging(
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
 
-    # Remove existing handlers
+    # Remove existing handlers (closing them flushes any buffered file output)
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+        handler.close()
 
     # Create console handler
     console_handler = logging.StreamHandler(sys.stdout)
@@ -139,18 +322,26 @@ def setup_logging(
         )
 
     console_handler.setFormatter(console_formatter)
-    root_logger.addHandler(console_handler)
+    handlers: list[logging.Handler] = [console_handler]
 
-    # In development, also write JSON logs to a file
-    if not use_json:
+    # With plain-text console logs, optionally also write JSON logs to a file.
+    # JSON console output already goes to stdout, so it is never duplicated.
+    if not use_json and settings.log_to_file:
         log_dir = Path("logs")
         log_dir.mkdir(exist_ok=True)
 
-        file_handler = logging.FileHandler(log_dir / "app.log")
+        file_handler = BufferedFileHandler(
+            log_dir / "app.log", flush_interval=1.0, flush_level=logging.WARNING
+        )
         file_handler.setLevel(level)
         file_formatter = ProductionJsonFormatter()
         file_handler.setFormatter(file_formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    # The listener thread owns the real handlers; the root logger only enqueues
+    _listener = QueueListener(_log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    root_logger.addHandler(ContextQueueHandler(_log_queue))
 
     # Reduce noise from third-party libraries
     logging.getLogger("google").setLevel(logging.WARNING)
@@ -160,11 +351,41 @@ def setup_logging(
     # Log startup message
     logger = logging.getLogger(__name__)
     logger.info(
-        f"Logging configured: level={level}, json_format={use_json}, "
-        f"environment={settings.environment.value}"
+        "Logging configured: level=%s, json_format=%s, environment=%s",
+        level,
+        use_json,
+        settings.environment_name,
     )
 
 
+def shutdown_logging() -> None:
+    """
+    Stop the listener thread after it drains the queue.
+
+    The listener's handlers are moved onto the root logger, so anything
+    logged afterwards (e.g. during interpreter exit) is still written.
+    """
+    global _listener
+
+    if _listener is None:
+        return
+
+    _listener.stop()
+
+    root_logger = logging.getLogger()
+    for handler in root_logger.handlers[:]:
+        if isinstance(handler, ContextQueueHandler):
+            root_logger.removeHandler(handler)
+    for handler in _listener.handlers:
+        handler.addFilter(ContextFilter())
+        root_logger.addHandler(handler)
+
+    _listener = None
+
+
+atexit.register(shutdown_logging)
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance with the given name.
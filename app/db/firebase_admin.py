@@ -7,45 +7,55 @@ Firestore and Realtime Database through a single credentials file.
 
 import logging
 import os
-from typing import Optional
-
-import firebase_admin
-from firebase_admin import credentials
+import threading
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
 
 from app.config.settings import get_settings
 
+if TYPE_CHECKING:
+    # The SDK pulls in google-auth, requests and cryptography; it is imported
+    # on first use so modules that never touch Firebase don't pay for it
+    import firebase_admin
+    from firebase_admin import credentials
+
 logger = logging.getLogger(__name__)
 
 # Global Firebase app instance
-_firebase_app: Optional[firebase_admin.App] = None
+_firebase_app: Optional["firebase_admin.App"] = None
+_firebase_lock = threading.Lock()
 
 
-def get_firebase_app() -> firebase_admin.App:
-    """
-    Get or initialize the Firebase Admin app singleton.
+@lru_cache(maxsize=4)
+def _parse_certificate(path: str, mtime_ns: int) -> "credentials.Certificate":
+    """Parse a service account file; mtime_ns in the key re-parses it after a change."""
+    from firebase_admin import credentials
 
-    The app is configured using the Firebase Admin SDK credentials JSON file.
-    This single initialization provides access to both Firestore and Realtime Database.
+    return credentials.Certificate(path)
 
-    Returns:
-        Firebase Admin App instance.
+
+def _load_certificate(path: str) -> "credentials.Certificate":
+    """
+    Load service account credentials, reusing the parsed file while it is unchanged.
 
     Raises:
-        ValueError: If credentials path is not configured.
-        Exception: If Firebase initialization fails.
+        FileNotFoundError: If the credentials file does not exist.
     """
-    global _firebase_app
+    return _parse_certificate(path, os.stat(path).st_mtime_ns)
 
-    if _firebase_app is not None:
-        return _firebase_app
+
+def _initialize_firebase_app() -> "firebase_admin.App":
+    """Resolve credentials and initialize the Firebase Admin app. Callers hold the lock."""
+    import firebase_admin
+    from firebase_admin import credentials
 
     settings = get_settings()
 
     try:
         # Check if already initialized (e.g., by another module)
-        _firebase_app = firebase_admin.get_app()
+        app = firebase_admin.get_app()
         logger.info("Using existing Firebase Admin app")
-        return _firebase_app
+        return app
     except ValueError:
         # App not initialized yet, proceed with initialization
         pass
@@ -56,20 +66,20 @@ def get_firebase_app() -> firebase_admin.App:
     # Priority 1: Service account credentials path from settings
     creds_path = settings.service_account_credentials_path
     if creds_path:
-        if os.path.exists(creds_path):
-            cred = credentials.Certificate(creds_path)
-            logger.info(f"Using service account credentials from: {creds_path}")
-        else:
-            raise ValueError(f"Service account credentials not found: {creds_path}")
+        try:
+            cred = _load_certificate(creds_path)
+        except FileNotFoundError:
+            raise ValueError(f"Service account credentials not found: {creds_path}") from None
+        logger.info(f"Using service account credentials from: {creds_path}")
 
     # Priority 2: Environment variable GOOGLE_APPLICATION_CREDENTIALS (fallback)
     elif os.environ.get("GOOGLE_APPLICATION_CREDENTIALS"):
         cred_path = os.environ["GOOGLE_APPLICATION_CREDENTIALS"]
-        if os.path.exists(cred_path):
-            cred = credentials.Certificate(cred_path)
-            logger.info(f"Using credentials from GOOGLE_APPLICATION_CREDENTIALS: {cred_path}")
-        else:
-            raise ValueError(f"Credentials file not found: {cred_path}")
+        try:
+            cred = _load_certificate(cred_path)
+        except FileNotFoundError:
+            raise ValueError(f"Credentials file not found: {cred_path}") from None
+        logger.info(f"Using credentials from GOOGLE_APPLICATION_CREDENTIALS: {cred_path}")
 
     # Priority 4: Application Default Credentials (for GCP environments)
     else:
@@ -85,8 +95,38 @@ def get_firebase_app() -> firebase_admin.App:
     # Note: project_id is automatically extracted from the service account JSON
 
     # Initialize Firebase Admin
-    _firebase_app = firebase_admin.initialize_app(cred, options)
-    logger.info(f"Firebase Admin initialized for project: {_firebase_app.project_id}")
+    app = firebase_admin.initialize_app(cred, options)
+    logger.info(f"Firebase Admin initialized for project: {app.project_id}")
+
+    return app
+
+
+def get_firebase_app() -> "firebase_admin.App":
+    """
+    Get or initialize the Firebase Admin app singleton.
+
+    The app is configured using the Firebase Admin SDK credentials JSON file.
+    This single initialization provides access to both Firestore and Realtime Database.
+
+    Returns:
+        Firebase Admin App instance.
+
+    Raises:
+        ValueError: If credentials path is not configured.
+        Exception: If Firebase initialization fails.
+    """
+    global _firebase_app
+
+    # Fast path: no lock once initialized
+    if _firebase_app is not None:
+        return _firebase_app
+
+    with _firebase_lock:
+        # Another thread may have finished initialization while we waited
+        if _firebase_app is not None:
+            return _firebase_app
+
+        _firebase_app = _initialize_firebase_app()
 
     return _firebase_app
 
@@ -99,7 +139,10 @@ def close_firebase_app() -> None:
     """
     global _firebase_app
 
-    if _firebase_app is not None:
-        firebase_admin.delete_app(_firebase_app)
-        _firebase_app = None
-        logger.info("Firebase Admin app closed")
+    with _firebase_lock:
+        if _firebase_app is not None:
+            import firebase_admin
+
+            firebase_admin.delete_app(_firebase_app)
+            _firebase_app = None
+            logger.info("Firebase Admin app closed")
@@ -7,49 +7,100 @@ Supports both production GCP credentials and local emulator.
 
 import logging
 import os
-from typing import Optional
-
-from google.cloud import firestore
-from google.cloud.firestore_v1 import Client
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Optional, Type
 
 from app.config.settings import get_settings
 
+if TYPE_CHECKING:
+    # google-cloud-firestore pulls in gRPC and protobuf; it is imported when
+    # the client is first built so unrelated entry points start faster
+    from google.cloud.firestore_v1 import AsyncClient, Client
+
 logger = logging.getLogger(__name__)
 
 # Global client instance
-_firestore_client: Optional[Client] = None
+_firestore_client: Optional["Client"] = None
+_async_firestore_client: Optional["AsyncClient"] = None
+_firestore_lock = threading.Lock()
+_env_configured = False
 
 
-def get_firestore_client() -> Client:
+def _configure_gcp_env() -> None:
     """
-    Get or create the Firestore client singleton.
+    Export emulator and credentials settings for the Google Cloud client.
 
-    The client is configured based on environment settings:
-    - In development with emulator: connects to local Firestore emulator
-    - In staging/production: uses GCP credentials
+    Runs once per process; the client reads these when it is constructed.
+    """
+    global _env_configured
 
-    Returns:
-        Firestore Client instance.
+    if _env_configured:
+        return
 
-    Raises:
-        Exception: If client cannot be initialized.
+    settings = get_settings()
+
+    # Configure for emulator if enabled
+    if settings.use_firestore_emulator:
+        os.environ["FIRESTORE_EMULATOR_HOST"] = settings.firestore_emulator_host
+        logger.info(f"Connecting to Firestore emulator at {settings.firestore_emulator_host}")
+
+    # Set credentials path if provided
+    if settings.service_account_credentials_path:
+        os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = settings.service_account_credentials_path
+
+    _env_configured = True
+
+
+def _channel_options() -> Dict[str, int]:
+    """gRPC options that keep the shared channel warm between bursts of requests."""
+    settings = get_settings()
+    return {
+        "grpc.keepalive_time_ms": settings.firestore_keepalive_time_ms,
+        "grpc.keepalive_timeout_ms": settings.firestore_keepalive_timeout_ms,
+        "grpc.keepalive_permit_without_calls": 1,
+        "grpc.http2.max_pings_without_data": 0,
+    }
+
+
+def _tuned_async_client_class() -> Type["AsyncClient"]:
     """
-    global _firestore_client
+    Build an AsyncClient subclass whose gRPC channel uses _channel_options.
+
+    google-cloud-firestore 2.14 hardcodes only a keepalive time when it creates
+    the channel and has no public hook for channel options, so this swaps in a
+    transport whose create_channel merges ours over the library's.
+    """
+    from google.cloud.firestore_v1 import AsyncClient
+    from google.cloud.firestore_v1.services.firestore import async_client as gapic_client
+    from google.cloud.firestore_v1.services.firestore.transports.grpc_asyncio import (
+        FirestoreGrpcAsyncIOTransport,
+    )
+
+    class TunedTransport(FirestoreGrpcAsyncIOTransport):
+        @classmethod
+        def create_channel(cls, host: str, **kwargs: Any):
+            options = dict(kwargs.pop("options", None) or ())
+            options.update(_channel_options())
+            return super().create_channel(host, options=list(options.items()), **kwargs)
+
+    class TunedAsyncClient(AsyncClient):
+        @property
+        def _firestore_api(self):
+            return self._firestore_api_helper(
+                TunedTransport, gapic_client.FirestoreAsyncClient, gapic_client
+            )
+
+    return TunedAsyncClient
 
-    if _firestore_client is not None:
-        return _firestore_client
+
+def _create_firestore_client(use_async: bool = False) -> "Client | AsyncClient":
+    """Configure the environment and build a Firestore client. Callers hold the lock."""
+    from google.cloud import firestore
 
     settings = get_settings()
 
     try:
-        # Configure for emulator if enabled
-        if settings.use_firestore_emulator:
-            os.environ["FIRESTORE_EMULATOR_HOST"] = settings.firestore_emulator_host
-            logger.info(f"Connecting to Firestore emulator at {settings.firestore_emulator_host}")
-
-        # Set credentials path if provided
-        if settings.service_account_credentials_path:
-            os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = settings.service_account_credentials_path
+        _configure_gcp_env()
 
         # Initialize client
         # Note: project_id is automatically extracted from the service account JSON
@@ -58,48 +109,132 @@ def get_firestore_client() -> Client:
         if settings.firestore_database_id and settings.firestore_database_id != "(default)":
             client_kwargs["database"] = settings.firestore_database_id
 
-        _firestore_client = firestore.Client(**client_kwargs)
+        client_class = _tuned_async_client_class() if use_async else firestore.Client
+        client = client_class(**client_kwargs)
 
-        logger.info(f"Firestore client initialized for project: {_firestore_client.project}")
+        logger.info(f"Firestore {client_class.__name__} initialized for project: {client.project}")
 
-        return _firestore_client
+        return client
 
     except Exception as e:
         logger.error(f"Failed to initialize Firestore client: {e}")
         raise
 
 
-def close_firestore_client() -> None:
+def get_firestore_client() -> "Client":
     """
-    Close the Firestore client connection.
+    Get or create the Firestore client singleton.
 
-    Should be called during application shutdown.
+    The client is configured based on environment settings:
+    - In development with emulator: connects to local Firestore emulator
+    - In staging/production: uses GCP credentials
+
+    Returns:
+        Firestore Client instance.
+
+    Raises:
+        Exception: If client cannot be initialized.
     """
     global _firestore_client
 
+    # Fast path: no lock once created
     if _firestore_client is not None:
-        _firestore_client.close()
-        _firestore_client = None
+        return _firestore_client
+
+    with _firestore_lock:
+        # Another thread may have created the client while we waited
+        if _firestore_client is not None:
+            return _firestore_client
+
+        _firestore_client = _create_firestore_client()
+
+    return _firestore_client
+
+
+def get_async_firestore_client() -> "AsyncClient":
+    """
+    Get or create the async Firestore client singleton.
+
+    Repositories use this client so Firestore RPCs are awaited on the event
+    loop instead of blocking it. Configuration matches get_firestore_client.
+
+    Returns:
+        Firestore AsyncClient instance.
+
+    Raises:
+        Exception: If client cannot be initialized.
+    """
+    global _async_firestore_client
+
+    # Fast path: no lock once created
+    if _async_firestore_client is not None:
+        return _async_firestore_client
+
+    with _firestore_lock:
+        # Another thread may have created the client while we waited
+        if _async_firestore_client is not None:
+            return _async_firestore_client
+
+        _async_firestore_client = _create_firestore_client(use_async=True)
+
+    return _async_firestore_client
+
+
+def init_firestore() -> "AsyncClient":
+    """
+    Configure the environment and create the async Firestore client eagerly.
+
+    Called from the application lifespan so credential loading and client
+    construction happen at startup instead of on the first request.
+
+    Returns:
+        Firestore AsyncClient instance.
+    """
+    _configure_gcp_env()
+    return get_async_firestore_client()
+
+
+async def close_firestore_client() -> None:
+    """
+    Close the Firestore client connections.
+
+    Should be awaited during application shutdown.
+    """
+    global _firestore_client, _async_firestore_client
+
+    with _firestore_lock:
+        client, _firestore_client = _firestore_client, None
+        async_client, _async_firestore_client = _async_firestore_client, None
+
+    if client is not None:
+        client.close()
         logger.info("Firestore client closed")
+    if async_client is not None:
+        # AsyncClient.close() is synchronous and leaves the grpc.aio channel
+        # open; close the transport it created, if any, on the event loop
+        api = async_client._firestore_api_internal
+        if api is not None:
+            await api.transport.close()
+        logger.info("Firestore async client closed")
 
 
 async def check_firestore_connection() -> bool:
     """
     Check if Firestore connection is healthy.
 
-    Performs a lightweight operation to verify connectivity.
+    Performs a single-document query against a reserved collection to verify
+    connectivity.
 
     Returns:
         True if connection is healthy, False otherwise.
     """
     try:
-        client = get_firestore_client()
-        # Perform a lightweight operation to check connectivity
-        # List collections with a limit of 1
-        collections = list(client.collections())
-        logger.debug(
-            f"Firestore connection check passed. Found {len(collections)} root collections."
-        )
+        client = get_async_firestore_client()
+        # A single bounded query proves the channel is up without enumerating
+        # every root collection
+        query = client.collection("_health").limit(1)
+        await query.get(timeout=get_settings().readiness_check_timeout)
+        logger.debug("Firestore connection check passed")
         return True
     except Exception as e:
         logger.error(f"Firestore connection check failed: {e}")
@@ -5,10 +5,13 @@ Provides access to Firebase Realtime Database through the Admin SDK.
 """
 
 import logging
-from typing import Any, Dict, Optional
+import threading
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
 
 from firebase_admin import db
 
+from app.core.concurrency import run_blocking
 from app.db.firebase_admin import get_firebase_app
 
 logger = logging.getLogger(__name__)
@@ -43,6 +46,15 @@ def get_db_reference(path: str) -> db.Reference:
     return db.reference(path)
 
 
+def _sync_check_realtime_db() -> None:
+    """Blocking part of the Realtime Database check; raises on failure."""
+    get_firebase_app()
+    # Try to read from root (returns None if empty, but verifies connection)
+    ref = db.reference()
+    # Just check if we can access the reference
+    _ = ref.path
+
+
 async def check_realtime_db_connection() -> bool:
     """
     Check if Realtime Database connection is healthy.
@@ -53,11 +65,7 @@ async def check_realtime_db_connection() -> bool:
         True if connection is healthy, False otherwise.
     """
     try:
-        get_firebase_app()
-        # Try to read from root (returns None if empty, but verifies connection)
-        ref = db.reference()
-        # Just check if we can access the reference
-        _ = ref.path
+        await run_blocking(_sync_check_realtime_db)
         logger.debug("Realtime Database connection check passed")
         return True
     except Exception as e:
@@ -65,12 +73,13 @@ async def check_realtime_db_connection() -> bool:
         return False
 
 
-def get_realtime_client(base_path: str = "") -> "RealtimeDBOperations":
+def get_realtime_client(base_path: str = "", batch_window_ms: int = 0) -> "RealtimeDBOperations":
     """
     Get a Realtime Database client (similar to get_firestore_client).
 
     Args:
         base_path: Base path for all operations (e.g., "medical_dashboard").
+        batch_window_ms: Coalesce writes for this many milliseconds (0 disables).
 
     Returns:
         RealtimeDBOperations instance.
@@ -79,7 +88,7 @@ def get_realtime_client(base_path: str = "") -> "RealtimeDBOperations":
         rdb = get_realtime_client("medical_dashboard")
         data = rdb.get("users/user123")
     """
-    return RealtimeDBOperations(base_path=base_path)
+    return RealtimeDBOperations(base_path=base_path, batch_window_ms=batch_window_ms)
 
 
 class RealtimeDBOperations:
@@ -87,22 +96,156 @@ class RealtimeDBOperations:
     Utility class for common Realtime Database operations.
 
     Provides a simple interface for CRUD operations on the Realtime Database.
+
+    With a non-zero ``batch_window_ms``, ``set``/``update``/``delete`` are
+    buffered and written as one multi-path ``update`` when the window expires,
+    the batch fills up, or ``flush``/``close`` is called. Each call is queued
+    as one unit, so the paths of a single ``update`` are always written by the
+    same (atomic) multi-path update. Reads and unbuffered writes flush first
+    so callers see their own writes and queued writes never land after newer
+    ones. If a timed flush fails, its writes stay queued and are retried on
+    the next window; until a flush succeeds, the next write retries
+    synchronously, so the failure is raised to a caller (as it is from reads
+    and ``close``).
     """
 
-    def __init__(self, base_path: str = ""):
+    __slots__ = (
+        "base_path",
+        "_base_ref",
+        "_child_ref",
+        "batch_window",
+        "max_batch_size",
+        "_pending",
+        "_pending_lock",
+        "_flush_lock",
+        "_flush_timer",
+        "_failed",
+    )
+
+    def __init__(self, base_path: str = "", batch_window_ms: int = 0, max_batch_size: int = 500):
         """
         Initialize with an optional base path.
 
         Args:
             base_path: Base path for all operations (e.g., "users").
+            batch_window_ms: Coalesce writes for this many milliseconds (0 disables).
+            max_batch_size: Flush immediately once this many paths are pending.
         """
         self.base_path = base_path.strip("/")
+        self._base_ref: Optional[db.Reference] = None
+        # References are immutable, so hot sub-paths can reuse a resolved child
+        self._child_ref = lru_cache(maxsize=1024)(self._resolve_child)
+
+        self.batch_window = batch_window_ms / 1000
+        self.max_batch_size = max_batch_size
+        self._pending: Dict[str, Any] = {}
+        # Guards _pending/_failed/_flush_timer; never held during network I/O
+        self._pending_lock = threading.Lock()
+        # Serializes flushes so batches are written in the order they were queued
+        self._flush_lock = threading.Lock()
+        # Operations run in worker threads (see run_blocking) with no event loop,
+        # so timed flushes use a daemon timer thread rather than an asyncio task
+        self._flush_timer: Optional[threading.Timer] = None
+        # Batches from a failed flush, written before anything queued since
+        self._failed: List[Dict[str, Any]] = []
+
+    @property
+    def base_ref(self) -> db.Reference:
+        """
+        Reference to base_path, resolved once on first use.
+
+        Resolution is deferred so the client can be built before Firebase is
+        initialized (e.g. at application startup).
+        """
+        if self._base_ref is None:
+            get_firebase_app()
+            self._base_ref = db.reference(self.base_path) if self.base_path else db.reference()
+        return self._base_ref
+
+    def _resolve_child(self, path: str) -> db.Reference:
+        path = path.strip("/")
+        return self.base_ref.child(path) if path else self.base_ref
 
     def _get_ref(self, path: str = "") -> db.Reference:
         """Get a reference combining base_path and the given path."""
-        get_firebase_app()
-        full_path = f"{self.base_path}/{path}".strip("/") if path else self.base_path
-        return db.reference(full_path) if full_path else db.reference()
+        return self._child_ref(path) if path else self.base_ref
+
+    def _enqueue(self, values: Dict[str, Any]) -> None:
+        """Buffer one unit of writes (paths relative to base_path), never split across flushes."""
+        while True:
+            with self._pending_lock:
+                # After a failed flush, retry it now so this caller sees the
+                # error instead of a success that may never be written. Multi-path
+                # updates reject overlapping paths, so also write out any pending
+                # ancestor/descendant of these paths first.
+                if not self._failed and not self._overlaps_pending_locked(values):
+                    self._pending.update(values)
+                    full = len(self._pending) >= self.max_batch_size
+                    if not full:
+                        self._arm_timer_locked()
+                    break
+            self.flush()
+
+        if full:
+            self.flush()
+
+    def _overlaps_pending_locked(self, values: Dict[str, Any]) -> bool:
+        """Whether a path nests in a pending path or vice versa. Callers hold _pending_lock."""
+        return any(
+            key.startswith(path + "/") or path.startswith(key + "/")
+            for path in values
+            for key in self._pending
+        )
+
+    def _arm_timer_locked(self) -> None:
+        """Schedule a timed flush if none is pending. Callers hold _pending_lock."""
+        if self._flush_timer is None:
+            self._flush_timer = threading.Timer(self.batch_window, self._flush_on_timer)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _flush_on_timer(self) -> None:
+        try:
+            self.flush()
+        except Exception as e:
+            logger.error(f"Error flushing batched writes under {self.base_path}, will retry: {e}")
+            with self._pending_lock:
+                if self._failed:
+                    self._arm_timer_locked()
+
+    def flush(self) -> None:
+        """Write any buffered changes now, in the order they were queued."""
+        if not self.batch_window:
+            return
+
+        with self._flush_lock:
+            with self._pending_lock:
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+                batches = self._failed
+                if self._pending:
+                    batches.append(self._pending)
+                self._failed, self._pending = [], {}
+
+            # Written outside _pending_lock so other writers can keep queueing
+            for i, batch in enumerate(batches):
+                try:
+                    self.base_ref.update(batch)
+                except Exception:
+                    with self._pending_lock:
+                        self._failed = batches[i:]
+                    raise
+
+    def close(self) -> None:
+        """Flush buffered changes; call during shutdown when batching is enabled."""
+        self.flush()
+
+    async def __aenter__(self) -> "RealtimeDBOperations":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await run_blocking(self.close)
 
     def get(self, path: str = "") -> Optional[Any]:
         """
@@ -115,11 +258,53 @@ class RealtimeDBOperations:
             Data at the path, or None if not found.
         """
         try:
+            self.flush()
             return self._get_ref(path).get()
         except Exception as e:
             logger.error(f"Error getting data at {path}: {e}")
             raise
 
+    def exists(self, path: str = "") -> bool:
+        """
+        Check whether data exists at the specified path.
+
+        Uses a shallow read, so only the top-level keys are downloaded
+        instead of the whole subtree.
+
+        Args:
+            path: Path relative to base_path.
+
+        Returns:
+            True if the path holds data.
+        """
+        try:
+            self.flush()
+            return self._get_ref(path).get(shallow=True) is not None
+        except Exception as e:
+            logger.error(f"Error checking data at {path}: {e}")
+            raise
+
+    def get_first(self, path: str = "", limit: int = 100) -> Dict[str, Any]:
+        """
+        Get the first children at the specified path, ordered by key.
+
+        The limit is applied server-side, so only limit children are downloaded.
+
+        Args:
+            path: Path relative to base_path.
+            limit: Maximum number of children.
+
+        Returns:
+            Dictionary of child key to value (empty if nothing is found).
+        """
+        try:
+            self.flush()
+            result = self._get_ref(path).order_by_key().limit_to_first(limit).get()
+            return result or {}
+        except Exception as e:
+            logger.error(f"Error getting first {limit} children at {path}: {e}")
+            raise
+
     def set(self, path: str, data: Any) -> None:
         """
         Set data at the specified path (overwrites existing data).
@@ -129,7 +314,12 @@ class RealtimeDBOperations:
             data: Data to set.
         """
         try:
-            self._get_ref(path).set(data)
+            if self.batch_window and path.strip("/"):
+                self._enqueue({path.strip("/"): data})
+            else:
+                # Queued writes under this path would otherwise overwrite it later
+                self.flush()
+                self._get_ref(path).set(data)
         except Exception as e:
             logger.error(f"Error setting data at {path}: {e}")
             raise
@@ -143,7 +333,13 @@ class RealtimeDBOperations:
             data: Dictionary of fields to update.
         """
         try:
-            self._get_ref(path).update(data)
+            if self.batch_window:
+                prefix = path.strip("/")
+                self._enqueue(
+                    {f"{prefix}/{key}" if prefix else key: value for key, value in data.items()}
+                )
+            else:
+                self._get_ref(path).update(data)
         except Exception as e:
             logger.error(f"Error updating data at {path}: {e}")
             raise
@@ -160,6 +356,7 @@ class RealtimeDBOperations:
             The auto-generated key.
         """
         try:
+            self.flush()
             ref = self._get_ref(path).push(data)
             return ref.key
         except Exception as e:
@@ -174,7 +371,12 @@ class RealtimeDBOperations:
             path: Path relative to base_path.
         """
         try:
-            self._get_ref(path).delete()
+            if self.batch_window and path.strip("/"):
+                # Writing null is a delete in a multi-path update
+                self._enqueue({path.strip("/"): None})
+            else:
+                self.flush()
+                self._get_ref(path).delete()
         except Exception as e:
             logger.error(f"Error deleting data at {path}: {e}")
             raise
@@ -199,6 +401,7 @@ class RealtimeDBOperations:
             Dictionary of matching records.
         """
         try:
+            self.flush()
             ref = self._get_ref(path)
             result = ref.order_by_child(child_key).equal_to(value).limit_to_first(limit).get()
             return result or {}
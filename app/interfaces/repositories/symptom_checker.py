@@ -10,13 +10,24 @@ class ISymptomCheckerRepository(ABC):
         pass
 
     @abstractmethod
-    def create_user_message(self, conversation_id: str, message: list[str]) -> None:
+    async def create_user_message(self, conversation_id: str, message: list[str]) -> None:
         """Create a user message in the conversation."""
         pass
 
     @abstractmethod
-    def create_agent_message(
+    async def create_agent_message(
         self, conversation_id: str, message: list[str], response_type: str
     ) -> None:
         """Create a bot message in the conversation."""
         pass
+
+    @abstractmethod
+    async def create_turn(
+        self,
+        conversation_id: str,
+        user_message: list[str],
+        agent_message: list[str],
+        response_type: str,
+    ) -> None:
+        """Create a user message and its agent reply in one write."""
+        pass
@@ -28,6 +28,16 @@ class IVitalsRepository(IRepository[Dict[str, Any]]):
         """
         pass
 
+    @abstractmethod
+    async def bulk_update_vitals(self, updates: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Update vitals for several users in one atomic write.
+
+        Args:
+            updates: Mapping of user ID to the vitals fields to update.
+        """
+        pass
+
     @abstractmethod
     async def get_user_vitals(self, user_id: str) -> Dict[str, Any]:
         """
@@ -5,7 +5,7 @@ Defines the contract for vitals operations.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 
 class IVitalsService(ABC):
@@ -27,3 +27,16 @@ class IVitalsService(ABC):
             Update status response with generated values.
         """
         pass
+
+    @abstractmethod
+    async def bulk_update_vitals(self, user_ids: List[str]) -> Dict[str, Any]:
+        """
+        Update vitals for several users with random values in one write.
+
+        Args:
+            user_ids: The users' IDs.
+
+        Returns:
+            Update status response with the generated values per user.
+        """
+        pass
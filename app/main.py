@@ -6,28 +6,89 @@ This module creates and configures the FastAPI application instance.
 
 import logging
 from contextlib import asynccontextmanager
+from types import SimpleNamespace
 from typing import AsyncGenerator
 
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
+from app.api.v1.endpoints.health import start_readiness_refresher, stop_readiness_refresher
 from app.api.v1.router import router as v1_router
 from app.config.settings import get_settings
+from app.core.concurrency import run_blocking, shutdown_blocking_executor
 from app.core.exceptions import register_exception_handlers
-from app.core.logging import setup_logging
-from app.db.firestore import close_firestore_client, get_firestore_client
+from app.core.logging import setup_logging, shutdown_logging
+from app.db.firebase_admin import get_firebase_app
+from app.db.firestore import close_firestore_client, init_firestore
+from app.db.realtime_db import get_realtime_client
+from app.repositories.authentication import AuthenticationRepository
+from app.repositories.base import BufferedBatchWriter
+from app.repositories.medical_info_repository import MedicalInfoRepository
+from app.repositories.symptom_checker import SymptomCheckerRepository
+from app.repositories.vitals_repository import VitalsRepository
+from app.services.authentication import AuthenticationService
+from app.services.medical_info import MedicalInfoService
+from app.services.symptom_checker import SymptomCheckerService
+from app.services.vitals import VitalsService
 
 logger = logging.getLogger(__name__)
 
 
+def init_services(app: FastAPI) -> None:
+    """
+    Build the shared service instances and attach them to app.state.services.
+
+    Endpoint providers read these instead of wiring a new
+    Repository -> Service chain on every request. Firestore repositories
+    share app.state.firestore, set up earlier in the lifespan; when that is
+    None they create the client on first use, so a failed startup attempt
+    doesn't break Firestore calls for the life of the process.
+    """
+    settings = get_settings()
+    firestore_client = app.state.firestore
+
+    try:
+        firebase_app = get_firebase_app()
+    except Exception as e:
+        logger.warning(f"Firebase app initialization warning: {e}")
+        # Don't fail startup - token verification falls back to the default app
+        firebase_app = None
+
+    # Kept on app.state so buffered vitals writes are flushed at shutdown
+    app.state.vitals_rtdb = get_realtime_client(
+        base_path="medical_dashboard", batch_window_ms=settings.rtdb_batch_window_ms
+    )
+
+    # Coalesces symptom checker message writes when enabled; flushed at shutdown
+    app.state.firestore_writer = (
+        BufferedBatchWriter(firestore_client, window_ms=settings.firestore_batch_window_ms)
+        if settings.firestore_batch_window_ms > 0
+        else None
+    )
+
+    app.state.services = SimpleNamespace(
+        auth=AuthenticationService(firebase_app, AuthenticationRepository(firestore_client)),
+        medical_info=MedicalInfoService(MedicalInfoRepository(firestore_client)),
+        # Owns one pooled agent HTTP client, closed in the lifespan shutdown
+        symptom_checker=SymptomCheckerService(
+            SymptomCheckerRepository(firestore_client, writer=app.state.firestore_writer)
+        ),
+        vitals=VitalsService(VitalsRepository(app.state.vitals_rtdb)),
+    )
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator:
     """
     Application lifespan manager.
 
     Handles startup and shutdown events:
-    - Startup: Initialize logging, connect to Firestore
-    - Shutdown: Close Firestore connection
+    - Startup: Initialize logging, connect to Firestore, build services,
+      start readiness refresher
+    - Shutdown: Stop readiness refresher, close agent HTTP client, flush batched
+      Realtime Database and Firestore writes, close Firestore connection, flush logs
     """
     # Startup
     settings = get_settings()
@@ -35,23 +96,37 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
 
     logger.info(
         f"Starting {settings.app_name} v{settings.app_version} "
-        f"in {settings.environment.value} mode"
+        f"in {settings.environment_name} mode"
     )
 
-    # Initialize Firestore client (validates connection)
+    # One async Firestore client for every repository (validates configuration)
     try:
-        get_firestore_client()
+        app.state.firestore = init_firestore()
         logger.info("Firestore client initialized successfully")
     except Exception as e:
         logger.warning(f"Firestore client initialization warning: {e}")
-        # Don't fail startup - allow health checks to report status
+        # Don't fail startup - allow health checks to report status; repositories
+        # retry creating the client on their next call
+        app.state.firestore = None
+
+    init_services(app)
+
+    # Keep readiness results warm so probes don't hit the databases
+    start_readiness_refresher()
 
     yield
 
     # Shutdown
     logger.info("Shutting down application...")
-    close_firestore_client()
+    await stop_readiness_refresher()
+    await app.state.services.symptom_checker.aclose()
+    await run_blocking(app.state.vitals_rtdb.close)
+    if app.state.firestore_writer is not None:
+        await app.state.firestore_writer.close()
+    await close_firestore_client()
+    shutdown_blocking_executor()
     logger.info("Application shutdown complete")
+    shutdown_logging()
 
 
 def create_application() -> FastAPI:
@@ -77,15 +152,7 @@ def create_application() -> FastAPI:
         redoc_url="/redoc" if settings.debug else None,
         openapi_url="/openapi.json" if settings.debug else None,
         lifespan=lifespan,
-    )
-
-    # Add CORS middleware
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=["*"],
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        default_response_class=ORJSONResponse,
     )
 
     # Add request context middleware for logging
@@ -93,22 +160,37 @@ def create_application() -> FastAPI:
 
     app.add_middleware(RequestContextMiddleware)
 
+    # Add CORS middleware last so it is outermost and answers preflight
+    # requests before any other middleware runs
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.cors_origins_list,
+        allow_credentials=settings.cors_allow_credentials,
+        allow_methods=settings.cors_allow_methods_list,
+        allow_headers=settings.cors_allow_headers_list,
+    )
+
     # Register exception handlers
     register_exception_handlers(app)
 
     # Include API routers
     app.include_router(v1_router, prefix=settings.api_prefix)
 
-    # Root endpoint (outside versioned API)
-    @app.get("/", tags=["Root"])
-    async def root():
-        """Root endpoint returning API info."""
-        return {
+    # Root endpoint (outside versioned API); the payload never changes, so
+    # serialize it once and serve the same bytes on every request
+    root_body = orjson.dumps(
+        {
             "name": settings.app_name,
             "version": settings.app_version,
-            "environment": settings.environment.value,
+            "environment": settings.environment_name,
             "docs": "/docs" if settings.debug else "Disabled in production",
         }
+    )
+
+    @app.get("/", tags=["Root"])
+    async def root() -> Response:
+        """Root endpoint returning API info."""
+        return Response(content=root_body, media_type="application/json")
 
     return app
 
@@ -5,27 +5,49 @@ Automatically injects request ID and trace ID into all logs
 generated during request processing.
 """
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-
-from app.core.logging import generate_request_id, set_request_context
-
-
-class RequestContextMiddleware(BaseHTTPMiddleware):
-    """Middleware to set request context for logging."""
-
-    async def dispatch(self, request: Request, call_next):
-        # Generate or extract request/trace IDs
-        request_id = request.headers.get("X-Request-ID") or generate_request_id()
-        trace_id = request.headers.get("X-Trace-ID") or generate_request_id()
-
-        # Set context for logging
-        set_request_context(request_id=request_id, trace_id=trace_id)
-
-        # Process request
-        response = await call_next(request)
-
-        # Add request ID to response headers for tracing
-        response.headers["X-Request-ID"] = request_id
-
-        return response
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.logging import generate_request_id, reset_request_context, set_request_context
+
+
+class RequestContextMiddleware:
+    """
+    Middleware to set request context for logging.
+
+    Implemented as plain ASGI rather than BaseHTTPMiddleware, so requests
+    aren't routed through an extra task and memory stream.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Generate or extract request/trace IDs (ASGI header names are lowercase)
+        request_id = None
+        trace_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                request_id = value.decode("latin-1")
+            elif name == b"x-trace-id":
+                trace_id = value.decode("latin-1")
+        request_id = request_id or generate_request_id()
+        trace_id = trace_id or generate_request_id()
+
+        # Set context for logging; reset afterwards so nothing outlives the request
+        tokens = set_request_context(request_id=request_id, trace_id=trace_id)
+
+        async def send_with_request_id(message: Message) -> None:
+            # Add request ID to response headers for tracing
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)["X-Request-ID"] = request_id
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            reset_request_context(tokens)
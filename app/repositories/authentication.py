@@ -1,11 +1,12 @@
 import logging
+from functools import cached_property
 from typing import Any, Dict, Optional
 
-from google.cloud.firestore_v1 import Client
+from google.cloud.firestore_v1 import AsyncClient
+from google.cloud.firestore_v1.async_collection import AsyncCollectionReference
 
-from app.core.exceptions import DatabaseError
-from app.db.firestore import get_firestore_client
 from app.interfaces.repositories.authentication import IAuthenticationRepository
+from app.repositories.base import FIRESTORE_TIMEOUT, LazyFirestoreClient, db_operation, write_retry
 
 logger = logging.getLogger(__name__)
 
@@ -13,25 +14,22 @@ logger = logging.getLogger(__name__)
 COLLECTION_NAME = "users"
 
 
-class AuthenticationRepository(IAuthenticationRepository):
+class AuthenticationRepository(LazyFirestoreClient, IAuthenticationRepository):
     """Concrete implementation of authentication repository."""
 
-    def __init__(self, db: Optional[Client] = None) -> None:
-        """Initialize the repository."""
-        self._db = db
+    def __init__(self, db: Optional[AsyncClient]) -> None:
+        """Initialize the repository with the shared async Firestore client (None: lazy)."""
+        super().__init__(db)
 
-    @property
-    def db(self) -> Client:
-        """Get Firestore client."""
-        if self._db is None:
-            self._db = get_firestore_client()
-        return self._db
+    @cached_property
+    def users(self) -> AsyncCollectionReference:
+        """Get the users collection reference (built once per repository)."""
+        return self.db.collection(COLLECTION_NAME)
 
+    @db_operation("register user")
     async def register_user(self, uid: str, data: Dict[str, Any]) -> None:
         """Register a new user with the User Data."""
-        try:
-            logger.info(f"Registering user with data: {data}")
-            self.db.collection(COLLECTION_NAME).document(uid).set(data, merge=True)
-        except Exception as e:
-            logger.error(f"Error registering user: {e}")
-            raise DatabaseError(detail=f"Failed to register user: {e}") from e
+        logger.info("Registering user with data: %s", data)
+        await self.users.document(uid).set(
+            data, merge=True, retry=write_retry(data), timeout=FIRESTORE_TIMEOUT
+        )
@@ -4,22 +4,303 @@ Base repository class for Firestore operations.
 Provides common CRUD operations that can be extended by specific repositories.
 """
 
+import asyncio
+import functools
+import inspect
 import logging
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar
-
-from google.cloud.firestore_v1 import Client, DocumentSnapshot
-from pydantic import BaseModel
-
-from app.core.exceptions import DatabaseError, NotFoundError
-from app.db.firestore import get_firestore_client
+from functools import cached_property, lru_cache
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from google.api_core import exceptions as gax
+from google.api_core.retry_async import AsyncRetry, if_exception_type
+from google.cloud.firestore_v1 import AsyncClient, DocumentSnapshot, transforms
+from google.cloud.firestore_v1.async_batch import AsyncWriteBatch
+from google.cloud.firestore_v1.async_collection import AsyncCollectionReference
+from google.cloud.firestore_v1.async_document import AsyncDocumentReference
+from google.cloud.firestore_v1.base_query import BaseQuery, FieldFilter
+from google.cloud.firestore_v1.field_path import FieldPath
+from pydantic import BaseModel, TypeAdapter
+
+from app.config.settings import get_settings
+from app.core.cache import TTLCache
+from app.core.concurrency import run_blocking
+from app.core.exceptions import APIException, DatabaseError, NotFoundError
+from app.db import firestore as firestore_db
 
 logger = logging.getLogger(__name__)
 
 # Type variable for Pydantic models
 T = TypeVar("T", bound=BaseModel)
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Firestore allows at most 500 writes per batch
+MAX_BATCH_SIZE = 500
+
+# Field path for ordering and paginating by document ID ("__name__")
+DOCUMENT_ID = FieldPath.document_id()
+
+# Projection for existence checks: the snapshot carries no field data
+EXISTENCE_MASK = [DOCUMENT_ID]
+
+# List pages with more documents than this are converted off the event loop
+OFFLOAD_CONVERSION_THRESHOLD = 200
+
+# Retry transient Firestore RPC failures with a short exponential backoff. Retries
+# stop after 5s and each attempt is bounded by FIRESTORE_TIMEOUT, so an outage
+# surfaces as DatabaseError within about 10s instead of a hung request. Only
+# idempotent writes (sets, deletes, batched sets) are retried; updates and
+# merges go through write_retry.
+FIRESTORE_RETRY = AsyncRetry(
+    predicate=if_exception_type(gax.ServiceUnavailable, gax.DeadlineExceeded, gax.Aborted),
+    initial=0.1,
+    maximum=2.0,
+    multiplier=2.0,
+    deadline=5.0,
+)
+
+# Per-attempt RPC timeout in seconds (the client default is about 60s)
+FIRESTORE_TIMEOUT = 5.0
+
+# Field transforms that apply again when a write is retried after a lost ack
+FIELD_TRANSFORMS = (
+    transforms.Sentinel,
+    transforms.Increment,
+    transforms.Maximum,
+    transforms.Minimum,
+    transforms.ArrayUnion,
+    transforms.ArrayRemove,
+)
+
+
+def _has_transform(data: Dict[str, Any]) -> bool:
+    for value in data.values():
+        if isinstance(value, dict):
+            if _has_transform(value):
+                return True
+        elif isinstance(value, FIELD_TRANSFORMS) and value is not transforms.DELETE_FIELD:
+            return True
+    return False
+
+
+def write_retry(data: Dict[str, Any]) -> Optional[AsyncRetry]:
+    """
+    Retry policy for an update or merge of data.
+
+    A write carrying field transforms (Increment, ArrayUnion, server
+    timestamps, ...) is not idempotent, so it is sent once without retries.
+    """
+    return None if _has_transform(data) else FIRESTORE_RETRY
+
+
+def db_operation(action: str) -> Callable[[F], F]:
+    """
+    Wrap an async repository method so failures surface as DatabaseError.
+
+    Works on coroutine methods and on async generators (streaming reads).
+    API exceptions raised inside the method (e.g. NotFoundError) pass
+    through unchanged; anything else is logged and re-raised as
+    DatabaseError("Failed to <action>: ...").
+
+    Example:
+        @db_operation("get document")
+        async def get_by_id(self, doc_id: str) -> Optional[T]:
+            ...
+    """
+
+    def decorator(fn: F) -> F:
+        fn_logger = logging.getLogger(fn.__module__)
+
+        if inspect.isasyncgenfunction(fn):
+
+            @functools.wraps(fn)
+            async def stream_wrapper(*args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+                try:
+                    async for item in fn(*args, **kwargs):
+                        yield item
+                except APIException:
+                    raise
+                except Exception as e:
+                    fn_logger.error("Failed to %s: %s", action, e)
+                    raise DatabaseError(detail=f"Failed to {action}: {e}") from e
+
+            return stream_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return await fn(*args, **kwargs)
+            except APIException:
+                raise
+            except Exception as e:
+                fn_logger.error("Failed to %s: %s", action, e)
+                raise DatabaseError(detail=f"Failed to {action}: {e}") from e
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+class LazyFirestoreClient:
+    """
+    Mixin holding the shared async Firestore client behind a ``db`` property.
+
+    The lifespan passes app.state.firestore, which is None when the client
+    couldn't be created at startup. Each access then retries creating it, so
+    Firestore calls recover once the client can be built instead of failing
+    for the life of the process.
+    """
+
+    __slots__ = ("_db",)
+
+    def __init__(self, db: Optional[AsyncClient]) -> None:
+        self._db = db
+
+    @property
+    def db(self) -> AsyncClient:
+        """The async Firestore client, created on first use if startup couldn't."""
+        if self._db is None:
+            self._db = firestore_db.get_async_firestore_client()
+        return self._db
 
 
-class BaseRepository(Generic[T]):
+class BufferedBatchWriter(LazyFirestoreClient):
+    """
+    Coalesce document writes into batched commits.
+
+    ``set`` adds the write to the current WriteBatch, which is committed when
+    the window expires, the batch reaches max_batch_size, or ``flush``/``close``
+    is called. Writes are committed in the order they were queued. ``set``
+    returns once the batch holding its write is committed and raises that
+    batch's commit error, so every caller sees failures as with a direct write.
+
+    Example:
+        writer = BufferedBatchWriter(db, window_ms=50)
+        await writer.set(doc_ref, {"content": "..."})
+        await writer.close()
+    """
+
+    __slots__ = (
+        "window",
+        "max_batch_size",
+        "_batch",
+        "_size",
+        "_committed",
+        "_flush_task",
+        "_commits",
+    )
+
+    def __init__(
+        self,
+        db: Optional[AsyncClient],
+        window_ms: int = 50,
+        max_batch_size: int = MAX_BATCH_SIZE,
+    ) -> None:
+        """
+        Initialize the writer.
+
+        Args:
+            db: Shared async Firestore client, or None to create it on first use.
+            window_ms: Milliseconds to hold writes before committing them.
+            max_batch_size: Commit immediately once this many writes are queued.
+        """
+        super().__init__(db)
+        self.window = window_ms / 1000
+        self.max_batch_size = max_batch_size
+        self._batch: Optional[AsyncWriteBatch] = None
+        self._size = 0
+        # Resolved when the current batch commits; every set() in it awaits this
+        self._committed: Optional[asyncio.Future] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        # In-flight commits, each in its own task so no caller's cancellation can stop one
+        self._commits: Set[asyncio.Task] = set()
+
+    async def set(self, doc_ref: AsyncDocumentReference, data: Dict[str, Any]) -> None:
+        """Queue a set of data on doc_ref and wait until its batch is committed."""
+        if self._batch is None:
+            self._batch = self.db.batch()
+            self._committed = asyncio.get_running_loop().create_future()
+        committed = self._committed
+        self._batch.set(doc_ref, data)
+        self._size += 1
+
+        if self._size >= self.max_batch_size:
+            self._start_commit()
+        elif self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_after_window())
+
+        # Shielded so one cancelled caller doesn't cancel the batch for the rest
+        await asyncio.shield(committed)
+
+    async def _flush_after_window(self) -> None:
+        await asyncio.sleep(self.window)
+        # Detach first so _start_commit() doesn't cancel the task it is running in
+        self._flush_task = None
+        self._start_commit()
+
+    def _start_commit(self) -> Optional[asyncio.Future]:
+        """Commit the current batch in a new task; returns the future its waiters await."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        if self._batch is None:
+            return None
+
+        batch, committed = self._batch, self._committed
+        self._batch, self._committed, self._size = None, None, 0
+        task = asyncio.create_task(self._commit(batch, committed))
+        self._commits.add(task)
+        task.add_done_callback(self._commits.discard)
+        return committed
+
+    @staticmethod
+    async def _commit(batch: AsyncWriteBatch, committed: asyncio.Future) -> None:
+        """Commit batch and resolve committed with the outcome."""
+        try:
+            await batch.commit(retry=FIRESTORE_RETRY, timeout=FIRESTORE_TIMEOUT)
+        except asyncio.CancelledError:
+            committed.cancel()
+            raise
+        except Exception as e:
+            committed.set_exception(e)
+        else:
+            committed.set_result(None)
+
+    async def flush(self) -> None:
+        """
+        Commit any queued writes now and wait for every in-flight commit.
+
+        Raises the commit error of the batch queued when flush was called.
+        """
+        committed = self._start_commit()
+        if self._commits:
+            await asyncio.wait(set(self._commits))
+        if committed is not None:
+            await committed
+
+    async def close(self) -> None:
+        """Commit queued writes; call during shutdown."""
+        await self.flush()
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model_class: Type[BaseModel]) -> TypeAdapter:
+    """Build the List[model_class] validator once per model."""
+    return TypeAdapter(List[model_class])
+
+
+class BaseRepository(LazyFirestoreClient, Generic[T]):
     """
     Base repository providing common Firestore CRUD operations.
 
@@ -29,30 +310,32 @@ class BaseRepository(Generic[T]):
         class UserRepository(BaseRepository[User]):
             collection_name = "users"
             model_class = User
+            summary_fields = ["name", "updated_at"]
     """
 
     collection_name: str = ""
     model_class: Type[T]
+    # When set, list reads (get_all/query) fetch only these fields
+    summary_fields: Optional[List[str]] = None
 
-    def __init__(self, db: Optional[Client] = None) -> None:
+    def __init__(self, db: Optional[AsyncClient]) -> None:
         """
         Initialize the repository.
 
         Args:
-            db: Firestore client. If None, uses the global client.
+            db: Shared async Firestore client (app.state.firestore), or None
+                to create it on first use.
         """
-        self._db = db
-
-    @property
-    def db(self) -> Client:
-        """Get the Firestore client."""
-        if self._db is None:
-            self._db = get_firestore_client()
-        return self._db
-
-    @property
-    def collection(self):
-        """Get the Firestore collection reference."""
+        super().__init__(db)
+        settings = get_settings()
+        # Found documents by ID; writes through this repository invalidate
+        self._cache: TTLCache[T] = TTLCache(
+            maxsize=settings.repository_cache_size, ttl=settings.repository_cache_ttl
+        )
+
+    @cached_property
+    def collection(self) -> AsyncCollectionReference:
+        """Get the Firestore collection reference (built once per repository)."""
         return self.db.collection(self.collection_name)
 
     def _doc_to_model(self, doc: DocumentSnapshot) -> Optional[T]:
@@ -70,24 +353,89 @@ class BaseRepository(Generic[T]):
 
         data = doc.to_dict()
         data["id"] = doc.id
-        return self.model_class(**data)
+        return self.model_class.model_validate(data)
+
+    def _project(self, query: Any) -> Any:
+        """Restrict a list query to summary_fields, if the repository defines them."""
+        if self.summary_fields:
+            return query.select(self.summary_fields)
+        return query
+
+    def _page_query(self, limit: int, start_after: Optional[str]) -> Any:
+        """Build the (projected) query for one page ordered by document ID."""
+        query = self._project(self.collection.order_by(DOCUMENT_ID).limit(limit))
+        if start_after:
+            query = query.start_after({DOCUMENT_ID: start_after})
+        return query
+
+    def _doc_to_list_item(self, doc: DocumentSnapshot) -> T:
+        """
+        Convert a list-query document to a model.
+
+        Projected documents lack the unselected fields, so they are built
+        without validation via model_construct.
+        """
+        if not self.summary_fields:
+            return self._doc_to_model(doc)
+
+        data = doc.to_dict()
+        data["id"] = doc.id
+        return self.model_class.model_construct(**data)
 
+    async def _collect(self, query: Any) -> List[T]:
+        """
+        Stream a query and convert the documents to models.
+
+        Snapshots are gathered while the stream is received. Pages larger than
+        OFFLOAD_CONVERSION_THRESHOLD are converted in the blocking-call pool so
+        validating them doesn't hold the event loop for the whole page.
+        """
+        stream = query.stream(retry=FIRESTORE_RETRY, timeout=FIRESTORE_TIMEOUT)
+        docs = [doc async for doc in stream if doc.exists]
+        if len(docs) > OFFLOAD_CONVERSION_THRESHOLD:
+            return await run_blocking(self._docs_to_list_items, docs)
+        return self._docs_to_list_items(docs)
+
+    def _docs_to_list_items(self, docs: List[DocumentSnapshot]) -> List[T]:
+        if self.summary_fields:
+            return [self._doc_to_list_item(doc) for doc in docs]
+
+        # Validate the whole page in one call to the compiled list validator
+        rows = []
+        for doc in docs:
+            data = doc.to_dict()
+            data["id"] = doc.id
+            rows.append(data)
+        return _list_adapter(self.model_class).validate_python(rows)
+
+    @db_operation("get document")
     async def get_by_id(self, doc_id: str) -> Optional[T]:
         """
         Get a document by ID.
 
+        Found documents are served from an in-process TTL cache; each hit
+        returns a copy, so callers may modify the result.
+
         Args:
             doc_id: Document ID.
 
         Returns:
             Model instance or None if not found.
         """
-        try:
-            doc = self.collection.document(doc_id).get()
-            return self._doc_to_model(doc)
-        except Exception as e:
-            logger.error(f"Error getting document {doc_id}: {e}")
-            raise DatabaseError(f"Failed to get document: {e}")
+        cached = self._cache.get(doc_id)
+        if cached is not None:
+            return cached.model_copy()
+
+        # A write landing while the read is in flight voids the token, so the
+        # pre-write document is not cached
+        token = self._cache.reserve(doc_id)
+        doc = await self.collection.document(doc_id).get(
+            retry=FIRESTORE_RETRY, timeout=FIRESTORE_TIMEOUT
+        )
+        model = self._doc_to_model(doc)
+        if model is not None:
+            self._cache.fill(doc_id, token, model.model_copy())
+        return model
 
     async def get_by_id_or_raise(self, doc_id: str) -> T:
         """
@@ -107,23 +455,47 @@ class BaseRepository(Generic[T]):
             raise NotFoundError(f"{self.collection_name} with ID {doc_id} not found")
         return result
 
-    async def get_all(self, limit: int = 100) -> List[T]:
+    @db_operation("get documents")
+    async def get_all(self, limit: int = 100, start_after: Optional[str] = None) -> List[T]:
         """
-        Get all documents in the collection.
+        Get one page of documents in the collection, ordered by document ID.
+
+        Pass the ID of the last document from the previous page as start_after
+        to fetch the next page; each page reads at most limit documents.
+        Only summary_fields are returned when the repository defines them.
 
         Args:
             limit: Maximum number of documents to return.
+            start_after: Document ID to resume after (exclusive).
 
         Returns:
             List of model instances.
         """
-        try:
-            docs = self.collection.limit(limit).stream()
-            return [self._doc_to_model(doc) for doc in docs if doc.exists]
-        except Exception as e:
-            logger.error(f"Error getting all documents: {e}")
-            raise DatabaseError(f"Failed to get documents: {e}")
+        return await self._collect(self._page_query(limit, start_after))
+
+    @db_operation("stream documents")
+    async def iter_all(
+        self, limit: int = 100, start_after: Optional[str] = None
+    ) -> AsyncIterator[T]:
+        """
+        Stream one page of documents, yielding each model as it arrives.
 
+        Same page as get_all, but nothing is buffered, so callers such as
+        NDJSON responses can start sending before the last document is read.
+
+        Args:
+            limit: Maximum number of documents to yield.
+            start_after: Document ID to resume after (exclusive).
+
+        Yields:
+            Model instances in document ID order.
+        """
+        query = self._page_query(limit, start_after)
+        async for doc in query.stream(retry=FIRESTORE_RETRY, timeout=FIRESTORE_TIMEOUT):
+            if doc.exists:
+                yield self._doc_to_list_item(doc)
+
+    @db_operation("create document")
     async def create(self, data: Dict[str, Any], doc_id: Optional[str] = None) -> str:
         """
         Create a new document.
@@ -135,17 +507,44 @@ class BaseRepository(Generic[T]):
         Returns:
             Document ID.
         """
-        try:
-            if doc_id:
-                self.collection.document(doc_id).set(data)
-                return doc_id
-            else:
-                _, doc_ref = self.collection.add(data)
-                return doc_ref.id
-        except Exception as e:
-            logger.error(f"Error creating document: {e}")
-            raise DatabaseError(f"Failed to create document: {e}")
+        # document(None) assigns the ID client-side, so a retried set() after a
+        # lost response rewrites the same document instead of failing like add()
+        doc_ref = self.collection.document(doc_id)
+        await doc_ref.set(data, retry=FIRESTORE_RETRY, timeout=FIRESTORE_TIMEOUT)
+        self._cache.pop(doc_ref.id)
+        return doc_ref.id
+
+    @db_operation("bulk create documents")
+    async def bulk_create(self, items: List[Tuple[Optional[str], Dict[str, Any]]]) -> List[str]:
+        """
+        Create many documents using batched writes.
+
+        Writes are committed in batches of up to MAX_BATCH_SIZE operations,
+        so each batch costs one round-trip instead of one per document.
+
+        Args:
+            items: (doc_id, data) pairs. A None doc_id lets Firestore generate one.
 
+        Returns:
+            Document IDs in the same order as items.
+        """
+        collection = self.collection
+        doc_ids: List[str] = []
+        for start in range(0, len(items), MAX_BATCH_SIZE):
+            batch = self.db.batch()
+            batch_ids = []
+            for doc_id, data in items[start : start + MAX_BATCH_SIZE]:
+                # document(None) assigns an auto-generated ID
+                doc_ref = collection.document(doc_id)
+                batch.set(doc_ref, data)
+                batch_ids.append(doc_ref.id)
+            await batch.commit(retry=FIRESTORE_RETRY, timeout=FIRESTORE_TIMEOUT)
+            for doc_id in batch_ids:
+                self._cache.pop(doc_id)
+            doc_ids.extend(batch_ids)
+        return doc_ids
+
+    @db_operation("update document")
     async def update(self, doc_id: str, data: Dict[str, Any]) -> None:
         """
         Update an existing document.
@@ -154,12 +553,12 @@ class BaseRepository(Generic[T]):
             doc_id: Document ID.
             data: Fields to update.
         """
-        try:
-            self.collection.document(doc_id).update(data)
-        except Exception as e:
-            logger.error(f"Error updating document {doc_id}: {e}")
-            raise DatabaseError(f"Failed to update document: {e}")
+        await self.collection.document(doc_id).update(
+            data, retry=write_retry(data), timeout=FIRESTORE_TIMEOUT
+        )
+        self._cache.pop(doc_id)
 
+    @db_operation("delete document")
     async def delete(self, doc_id: str) -> None:
         """
         Delete a document.
@@ -167,12 +566,12 @@ class BaseRepository(Generic[T]):
         Args:
             doc_id: Document ID.
         """
-        try:
-            self.collection.document(doc_id).delete()
-        except Exception as e:
-            logger.error(f"Error deleting document {doc_id}: {e}")
-            raise DatabaseError(f"Failed to delete document: {e}")
+        await self.collection.document(doc_id).delete(
+            retry=FIRESTORE_RETRY, timeout=FIRESTORE_TIMEOUT
+        )
+        self._cache.pop(doc_id)
 
+    @db_operation("query documents")
     async def query(
         self,
         field: str,
@@ -183,6 +582,8 @@ class BaseRepository(Generic[T]):
         """
         Query documents by a field condition.
 
+        Only summary_fields are returned when the repository defines them.
+
         Args:
             field: Field name to query.
             operator: Comparison operator (==, <, >, <=, >=, !=, in, etc.).
@@ -192,26 +593,64 @@ class BaseRepository(Generic[T]):
         Returns:
             List of matching model instances.
         """
-        try:
-            docs = self.collection.where(field, operator, value).limit(limit).stream()
-            return [self._doc_to_model(doc) for doc in docs if doc.exists]
-        except Exception as e:
-            logger.error(f"Error querying documents: {e}")
-            raise DatabaseError(f"Failed to query documents: {e}")
+        query = self._project(
+            self.collection.where(filter=FieldFilter(field, operator, value)).limit(limit)
+        )
+        return await self._collect(query)
 
+    @db_operation("query document group")
+    async def query_group(
+        self,
+        field: str,
+        operator: str,
+        value: Any,
+        limit: int = 100,
+        order_by: Optional[str] = None,
+        descending: bool = False,
+    ) -> List[T]:
+        """
+        Query every collection named collection_name, across all parents.
+
+        Useful for subcollections (e.g. messages under each conversation):
+        one collection-group RPC replaces a query per parent document.
+        Filters combined with order_by need a collection-group composite index.
+
+        Args:
+            field: Field name to query.
+            operator: Comparison operator (==, <, >, <=, >=, !=, in, etc.).
+            value: Value to compare against.
+            limit: Maximum number of documents to return.
+            order_by: Optional field to sort by.
+            descending: Sort order_by newest/largest first.
+
+        Returns:
+            List of matching model instances.
+        """
+        query = self.db.collection_group(self.collection_name).where(
+            filter=FieldFilter(field, operator, value)
+        )
+        if order_by:
+            direction = BaseQuery.DESCENDING if descending else BaseQuery.ASCENDING
+            query = query.order_by(order_by, direction=direction)
+        return await self._collect(self._project(query.limit(limit)))
+
+    @db_operation("check document existence")
     async def exists(self, doc_id: str) -> bool:
         """
         Check if a document exists.
 
+        Only the document name is fetched, not its fields.
+
         Args:
             doc_id: Document ID.
 
         Returns:
             True if document exists, False otherwise.
         """
-        try:
-            doc = self.collection.document(doc_id).get()
-            return doc.exists
-        except Exception as e:
-            logger.error(f"Error checking document existence {doc_id}: {e}")
-            raise DatabaseError(f"Failed to check document existence: {e}")
+        if doc_id in self._cache:
+            return True
+
+        doc = await self.collection.document(doc_id).get(
+            field_paths=EXISTENCE_MASK, retry=FIRESTORE_RETRY, timeout=FIRESTORE_TIMEOUT
+        )
+        return doc.exists
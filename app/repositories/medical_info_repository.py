@@ -5,22 +5,36 @@ Handles medical info data operations in Firestore.
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+from functools import cached_property
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 from google.cloud import firestore
-from google.cloud.firestore_v1 import Client
+from google.cloud.firestore_v1 import AsyncClient
+from google.cloud.firestore_v1.async_collection import AsyncCollectionReference
 
-from app.core.exceptions import DatabaseError
-from app.db.firestore import get_firestore_client
+from app.config.settings import get_settings
+from app.core.cache import TTLCache
 from app.interfaces.repositories.medical_info import IMedicalInfoRepository
+from app.repositories.base import (
+    DOCUMENT_ID,
+    EXISTENCE_MASK,
+    FIRESTORE_RETRY,
+    FIRESTORE_TIMEOUT,
+    LazyFirestoreClient,
+    db_operation,
+    write_retry,
+)
 
 logger = logging.getLogger(__name__)
 
 # Collection name for medical info (separate from Firebase Auth users)
 COLLECTION_NAME = "medical_info"
 
+# Server-side timestamp sentinel shared by every write
+SERVER_TS = firestore.SERVER_TIMESTAMP
 
-class MedicalInfoRepository(IMedicalInfoRepository):
+
+class MedicalInfoRepository(LazyFirestoreClient, IMedicalInfoRepository):
     """
     Concrete implementation of medical info repository.
 
@@ -28,89 +42,108 @@ class MedicalInfoRepository(IMedicalInfoRepository):
     Collection: medical_info/{user_id}
     """
 
-    def __init__(self, db: Optional[Client] = None) -> None:
-        """Initialize the repository."""
-        self._db = db
+    # get_all returns list summaries; get_by_id still reads the full profile
+    summary_fields: List[str] = ["height", "weight", "updated_at"]
 
-    @property
-    def db(self) -> Client:
-        """Get Firestore client."""
-        if self._db is None:
-            self._db = get_firestore_client()
-        return self._db
+    def __init__(self, db: Optional[AsyncClient]) -> None:
+        """Initialize the repository with the shared async Firestore client (None: lazy)."""
+        super().__init__(db)
+        settings = get_settings()
+        # Medical profiles by user ID; writes through this repository invalidate
+        self._cache: TTLCache[Dict[str, Any]] = TTLCache(
+            maxsize=settings.repository_cache_size, ttl=settings.repository_cache_ttl
+        )
 
-    async def get_by_id(self, id: str) -> Optional[Dict[str, Any]]:
-        """Get medical info by user ID."""
-        try:
-            doc = self.db.collection(COLLECTION_NAME).document(id).get()
-            if doc.exists:
-                return doc.to_dict()
-            return None
-        except Exception as e:
-            logger.error(f"Error getting medical info for {id}: {e}")
-            raise DatabaseError(detail=f"Failed to get medical info: {e}") from e
-
-    async def get_all(self, limit: int = 100) -> List[Dict[str, Any]]:
-        """Get all medical info records."""
-        try:
-            docs = self.db.collection(COLLECTION_NAME).limit(limit).stream()
-            results = []
-            for doc in docs:
-                data = doc.to_dict()
-                if data:
-                    data["user_id"] = doc.id
-                    results.append(data)
-            return results
-        except Exception as e:
-            logger.error(f"Error getting all medical info: {e}")
-            raise DatabaseError(detail=f"Failed to get medical info: {e}") from e
+    @cached_property
+    def collection(self) -> AsyncCollectionReference:
+        """Get the medical_info collection reference (built once per repository)."""
+        return self.db.collection(COLLECTION_NAME)
 
+    @db_operation("get medical info")
+    async def get_by_id(self, id: str) -> Optional[Dict[str, Any]]:
+        """Get medical info by user ID (cached; hits return a copy)."""
+        cached = self._cache.get(id)
+        if cached is not None:
+            return dict(cached)
+
+        # A write landing while the read is in flight voids the token, so the
+        # pre-write profile is not cached
+        token = self._cache.reserve(id)
+        doc = await self.collection.document(id).get(
+            retry=FIRESTORE_RETRY, timeout=FIRESTORE_TIMEOUT
+        )
+        if doc.exists:
+            data = doc.to_dict()
+            self._cache.fill(id, token, dict(data))
+            return data
+        return None
+
+    @db_operation("get medical info")
+    async def get_all(
+        self, limit: int = 100, start_after: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Get a page of medical info summaries ordered by user ID, after start_after."""
+        return [data async for data in self.iter_all(limit, start_after)]
+
+    @db_operation("stream medical info")
+    async def iter_all(
+        self, limit: int = 100, start_after: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream the same page as get_all, yielding each summary as it arrives."""
+        query = self.collection.select(self.summary_fields).order_by(DOCUMENT_ID).limit(limit)
+        if start_after:
+            query = query.start_after({DOCUMENT_ID: start_after})
+        async for doc in query.stream(retry=FIRESTORE_RETRY, timeout=FIRESTORE_TIMEOUT):
+            data = doc.to_dict()
+            if data:
+                data["user_id"] = doc.id
+                yield data
+
+    @db_operation("create medical info")
     async def create(self, data: Dict[str, Any], id: Optional[str] = None) -> str:
         """Create/set medical info for a user."""
-        try:
-            if not id:
-                raise ValueError("User ID is required")
-            # Add timestamps
-            data_with_timestamps = {
-                **data,
-                "created_at": firestore.SERVER_TIMESTAMP,
-                "updated_at": firestore.SERVER_TIMESTAMP,
-            }
-            self.db.collection(COLLECTION_NAME).document(id).set(data_with_timestamps, merge=True)
-            return id
-        except Exception as e:
-            logger.error(f"Error creating medical info: {e}")
-            raise DatabaseError(detail=f"Failed to create medical info: {e}") from e
-
+        if not id:
+            raise ValueError("User ID is required")
+        # Add timestamps
+        data_with_timestamps = {**data, "created_at": SERVER_TS, "updated_at": SERVER_TS}
+        await self.collection.document(id).set(
+            data_with_timestamps,
+            merge=True,
+            retry=write_retry(data_with_timestamps),
+            timeout=FIRESTORE_TIMEOUT,
+        )
+        self._cache.pop(id)
+        return id
+
+    @db_operation("update medical info")
     async def update(self, id: str, data: Dict[str, Any]) -> None:
-        """Update medical info for a user."""
-        try:
-            # Add updated_at timestamp
-            data_with_timestamp = {
-                **data,
-                "updated_at": firestore.SERVER_TIMESTAMP,
-            }
-            self.db.collection(COLLECTION_NAME).document(id).update(data_with_timestamp)
-        except Exception as e:
-            logger.error(f"Error updating medical info for {id}: {e}")
-            raise DatabaseError(detail=f"Failed to update medical info: {e}") from e
-
+        """Update medical info for a user. An empty update is a no-op."""
+        if not data:
+            return
+
+        # Add updated_at timestamp
+        data_with_timestamp = {**data, "updated_at": SERVER_TS}
+        await self.collection.document(id).update(
+            data_with_timestamp, retry=write_retry(data_with_timestamp), timeout=FIRESTORE_TIMEOUT
+        )
+        self._cache.pop(id)
+
+    @db_operation("delete medical info")
     async def delete(self, id: str) -> None:
         """Delete medical info for a user."""
-        try:
-            self.db.collection(COLLECTION_NAME).document(id).delete()
-        except Exception as e:
-            logger.error(f"Error deleting medical info for {id}: {e}")
-            raise DatabaseError(detail=f"Failed to delete medical info: {e}") from e
+        await self.collection.document(id).delete(retry=FIRESTORE_RETRY, timeout=FIRESTORE_TIMEOUT)
+        self._cache.pop(id)
 
+    @db_operation("check medical info")
     async def exists(self, id: str) -> bool:
-        """Check if medical info exists for a user."""
-        try:
-            doc = self.db.collection(COLLECTION_NAME).document(id).get()
-            return doc.exists
-        except Exception as e:
-            logger.error(f"Error checking medical info for {id}: {e}")
-            raise DatabaseError(detail=f"Failed to check medical info: {e}") from e
+        """Check if medical info exists for a user (fetches no profile fields)."""
+        if id in self._cache:
+            return True
+
+        doc = await self.collection.document(id).get(
+            field_paths=EXISTENCE_MASK, retry=FIRESTORE_RETRY, timeout=FIRESTORE_TIMEOUT
+        )
+        return doc.exists
 
     async def get_user_medical_info(self, user_id: str) -> Optional[Dict[str, Any]]:
         """Get medical info for a specific user."""
@@ -6,10 +6,12 @@ for the Realtime Database's JSON tree structure.
 """
 
 import logging
+from functools import cached_property
 from typing import Any, Dict, Generic, List, Optional, Type, TypeVar
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
+from app.core.concurrency import run_blocking
 from app.core.exceptions import DatabaseError, NotFoundError
 from app.db.realtime_db import RealtimeDBOperations
 
@@ -38,6 +40,11 @@ class RealtimeBaseRepository(Generic[T]):
         """Initialize the repository with database operations."""
         self._db = RealtimeDBOperations(self.base_path)
 
+    @cached_property
+    def _list_adapter(self) -> TypeAdapter:
+        """List[model_class] validator, built once per repository."""
+        return TypeAdapter(List[self.model_class])
+
     def _dict_to_model(self, key: str, data: Dict[str, Any]) -> T:
         """
         Convert a dictionary to a Pydantic model.
@@ -50,7 +57,7 @@ class RealtimeBaseRepository(Generic[T]):
             Pydantic model instance.
         """
         data["id"] = key
-        return self.model_class(**data)
+        return self.model_class.model_validate(data)
 
     async def get_by_id(self, record_id: str) -> Optional[T]:
         """
@@ -63,7 +70,7 @@ class RealtimeBaseRepository(Generic[T]):
             Model instance or None if not found.
         """
         try:
-            data = self._db.get(record_id)
+            data = await run_blocking(self._db.get, record_id)
             if data is None:
                 return None
             return self._dict_to_model(record_id, data)
@@ -91,10 +98,10 @@ class RealtimeBaseRepository(Generic[T]):
 
     async def get_all(self, limit: int = 100) -> List[T]:
         """
-        Get all records in the path.
+        Get the first records in the path, ordered by key.
 
-        Note: Realtime Database doesn't have native limit on get(),
-        so we fetch all and slice in Python for simplicity.
+        The limit is applied by the Realtime Database query, so only limit
+        records are downloaded; the page is validated in one call.
 
         Args:
             limit: Maximum number of records to return.
@@ -103,16 +110,9 @@ class RealtimeBaseRepository(Generic[T]):
             List of model instances.
         """
         try:
-            data = self._db.get()
-            if data is None:
-                return []
-
-            records = []
-            for key, value in list(data.items())[:limit]:
-                if isinstance(value, dict):
-                    records.append(self._dict_to_model(key, value))
-
-            return records
+            data = await run_blocking(self._db.get_first, limit=limit)
+            rows = [{**value, "id": key} for key, value in data.items() if isinstance(value, dict)]
+            return self._list_adapter.validate_python(rows)
         except Exception as e:
             logger.error(f"Error getting all records: {e}")
             raise DatabaseError(f"Failed to get records: {e}")
@@ -133,10 +133,10 @@ class RealtimeBaseRepository(Generic[T]):
             data = {k: v for k, v in data.items() if k != "id"}
 
             if record_id:
-                self._db.set(record_id, data)
+                await run_blocking(self._db.set, record_id, data)
                 return record_id
             else:
-                return self._db.push("", data)
+                return await run_blocking(self._db.push, "", data)
         except Exception as e:
             logger.error(f"Error creating record: {e}")
             raise DatabaseError(f"Failed to create record: {e}")
@@ -152,7 +152,7 @@ class RealtimeBaseRepository(Generic[T]):
         try:
             # Remove 'id' from data if present
             data = {k: v for k, v in data.items() if k != "id"}
-            self._db.update(record_id, data)
+            await run_blocking(self._db.update, record_id, data)
         except Exception as e:
             logger.error(f"Error updating record {record_id}: {e}")
             raise DatabaseError(f"Failed to update record: {e}")
@@ -165,7 +165,7 @@ class RealtimeBaseRepository(Generic[T]):
             record_id: Record ID/key.
         """
         try:
-            self._db.delete(record_id)
+            await run_blocking(self._db.delete, record_id)
         except Exception as e:
             logger.error(f"Error deleting record {record_id}: {e}")
             raise DatabaseError(f"Failed to delete record: {e}")
@@ -191,7 +191,7 @@ class RealtimeBaseRepository(Generic[T]):
             List of matching model instances.
         """
         try:
-            data = self._db.query_by_child("", field, value, limit)
+            data = await run_blocking(self._db.query_by_child, "", field, value, limit)
             if not data:
                 return []
 
@@ -215,8 +215,7 @@ class RealtimeBaseRepository(Generic[T]):
             True if record exists, False otherwise.
         """
         try:
-            data = self._db.get(record_id)
-            return data is not None
+            return await run_blocking(self._db.exists, record_id)
         except Exception as e:
             logger.error(f"Error checking record existence {record_id}: {e}")
             raise DatabaseError(f"Failed to check record existence: {e}")
@@ -1,12 +1,25 @@
+import asyncio
 import logging
-from typing import Optional
+from functools import cached_property
+from typing import Any, Dict, Optional
 
 from google.cloud import firestore
-from google.cloud.firestore_v1 import Client
+from google.cloud.firestore_v1 import AsyncClient
+from google.cloud.firestore_v1.async_collection import AsyncCollectionReference
+from google.cloud.firestore_v1.async_document import AsyncDocumentReference
 
-from app.core.exceptions import DatabaseError
-from app.db.firestore import get_firestore_client
+from app.config.settings import get_settings
+from app.core.cache import TTLCache
+from app.core.exceptions import NotFoundError
 from app.interfaces.repositories.symptom_checker import ISymptomCheckerRepository
+from app.repositories.base import (
+    EXISTENCE_MASK,
+    FIRESTORE_RETRY,
+    FIRESTORE_TIMEOUT,
+    BufferedBatchWriter,
+    LazyFirestoreClient,
+    db_operation,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -14,73 +27,148 @@ logger = logging.getLogger(__name__)
 COLLECTION_NAME = "conversations"
 SUB_COLLECTION_NAME = "messages"
 
+# Server-side timestamp sentinel shared by every write
+SERVER_TS = firestore.SERVER_TIMESTAMP
 
-class SymptomCheckerRepository(ISymptomCheckerRepository):
+
+class SymptomCheckerRepository(LazyFirestoreClient, ISymptomCheckerRepository):
     """Concrete implementation of symptom checker repository."""
 
-    def __init__(self, db: Optional[Client] = None) -> None:
-        """Initialize the repository."""
-        self._db = db
+    def __init__(
+        self, db: Optional[AsyncClient], writer: Optional[BufferedBatchWriter] = None
+    ) -> None:
+        """
+        Initialize the repository.
 
-    @property
-    def db(self) -> Client:
-        """Get Firestore client."""
-        if self._db is None:
-            self._db = get_firestore_client()
-        return self._db
+        Args:
+            db: Shared async Firestore client (app.state.firestore), or None
+                to create it on first use.
+            writer: Optional batch writer; when given, single messages are
+                coalesced into batched commits instead of written one by one.
+        """
+        super().__init__(db)
+        self.writer = writer
+        settings = get_settings()
+        # Conversation IDs known to exist, so message writes skip the parent check
+        self._known_conversations: TTLCache[bool] = TTLCache(
+            maxsize=settings.repository_cache_size, ttl=settings.repository_cache_ttl
+        )
 
-    def start_conversation(self) -> str:
-        """Start a new conversation and return its ID."""
-        try:
-            new_conversation_ref = self.db.collection(COLLECTION_NAME).document()
-            new_conversation_ref.set(
-                {"created_at": firestore.SERVER_TIMESTAMP, "title": "Symptom Checker Conversation"}
-            )
-            return new_conversation_ref.id
-        except Exception as e:
-            logger.error(f"Error starting conversation: {e}")
-            raise DatabaseError(detail=f"Failed to start conversation: {e}") from e
+    @cached_property
+    def conversations(self) -> AsyncCollectionReference:
+        """Get the conversations collection reference (built once per repository)."""
+        return self.db.collection(COLLECTION_NAME)
 
-    def create_user_message(self, conversation_id: str, message: list[str]) -> None:
-        """Add a user message to the conversation."""
-        try:
-            conversation_ref = self.db.collection(COLLECTION_NAME).document(conversation_id)
-            if not conversation_ref:
-                raise DatabaseError(
+    async def _existing_conversation(self, conversation_id: str) -> AsyncDocumentReference:
+        """
+        Return the conversation reference, checking the parent exists on a cache miss.
+
+        Raises:
+            NotFoundError: If the conversation does not exist.
+        """
+        conversation_ref = self.conversations.document(conversation_id)
+        if conversation_id not in self._known_conversations:
+            snapshot = await conversation_ref.get(
+                field_paths=EXISTENCE_MASK, retry=FIRESTORE_RETRY, timeout=FIRESTORE_TIMEOUT
+            )
+            if not snapshot.exists:
+                raise NotFoundError(
                     detail=f"Conversation with ID {conversation_id} does not exist."
                 )
-            message_ref = conversation_ref.collection(SUB_COLLECTION_NAME).document()
-            message_ref.set(
-                {
-                    "actor": "user",
-                    "type": "symptoms",
-                    "content": message,
-                    "created_at": firestore.SERVER_TIMESTAMP,
-                }
-            )
-        except Exception as e:
-            logger.error(f"Error adding user message: {e}")
-            raise DatabaseError(detail=f"Failed to add user message: {e}") from e
+            self._known_conversations[conversation_id] = True
+        return conversation_ref
+
+    async def _write_message(
+        self, message_ref: AsyncDocumentReference, data: Dict[str, Any]
+    ) -> None:
+        """Write a message directly, or queue it on the batch writer when configured."""
+        if self.writer is not None:
+            await self.writer.set(message_ref, data)
+        else:
+            await message_ref.set(data, retry=FIRESTORE_RETRY, timeout=FIRESTORE_TIMEOUT)
 
-    def create_agent_message(
+    @db_operation("start conversation")
+    async def start_conversation(self) -> str:
+        """Start a new conversation and return its ID."""
+        new_conversation_ref = self.conversations.document()
+        await new_conversation_ref.set(
+            {"created_at": SERVER_TS, "title": "Symptom Checker Conversation"},
+            retry=FIRESTORE_RETRY,
+            timeout=FIRESTORE_TIMEOUT,
+        )
+        self._known_conversations[new_conversation_ref.id] = True
+        return new_conversation_ref.id
+
+    @db_operation("add user message")
+    async def create_user_message(self, conversation_id: str, message: list[str]) -> None:
+        """Add a user message to the conversation."""
+        conversation_ref = await self._existing_conversation(conversation_id)
+        message_ref = conversation_ref.collection(SUB_COLLECTION_NAME).document()
+        await self._write_message(
+            message_ref,
+            {
+                "actor": "user",
+                "type": "symptoms",
+                "content": message,
+                "created_at": SERVER_TS,
+            },
+        )
+
+    @db_operation("add agent message")
+    async def create_agent_message(
         self, conversation_id: str, message: list[str], response_type: str
     ) -> None:
         """Add an agent message to the conversation."""
-        try:
-            conversation_ref = self.db.collection(COLLECTION_NAME).document(conversation_id)
-            if not conversation_ref:
-                raise DatabaseError(
-                    detail=f"Conversation with ID {conversation_id} does not exist."
-                )
-            message_ref = conversation_ref.collection(SUB_COLLECTION_NAME).document()
-            message_ref.set(
+        conversation_ref = await self._existing_conversation(conversation_id)
+        message_ref = conversation_ref.collection(SUB_COLLECTION_NAME).document()
+        await self._write_message(
+            message_ref,
+            {
+                "actor": "agent",
+                "type": response_type,
+                "content": message,
+                "created_at": SERVER_TS,
+            },
+        )
+
+    @db_operation("add conversation turn")
+    async def create_turn(
+        self,
+        conversation_id: str,
+        user_message: list[str],
+        agent_message: list[str],
+        response_type: str,
+    ) -> None:
+        """Add a user message and the agent's reply in a single batched commit."""
+        conversation_ref = await self._existing_conversation(conversation_id)
+        messages_ref = conversation_ref.collection(SUB_COLLECTION_NAME)
+        writes = [
+            (
+                messages_ref.document(),
+                {
+                    "actor": "user",
+                    "type": "symptoms",
+                    "content": user_message,
+                    "created_at": SERVER_TS,
+                },
+            ),
+            (
+                messages_ref.document(),
                 {
                     "actor": "agent",
                     "type": response_type,
-                    "content": message,
-                    "created_at": firestore.SERVER_TIMESTAMP,
-                }
-            )
-        except Exception as e:
-            logger.error(f"Error adding agent message: {e}")
-            raise DatabaseError(detail=f"Failed to add agent message: {e}") from e
+                    "content": agent_message,
+                    "created_at": SERVER_TS,
+                },
+            ),
+        ]
+        if self.writer is not None:
+            # Queued back to back, so both join the writer's current batch
+            # (unless the first write fills it)
+            await asyncio.gather(*(self.writer.set(ref, data) for ref, data in writes))
+            return
+
+        batch = self.db.batch()
+        for ref, data in writes:
+            batch.set(ref, data)
+        await batch.commit(retry=FIRESTORE_RETRY, timeout=FIRESTORE_TIMEOUT)
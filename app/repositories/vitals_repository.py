@@ -5,8 +5,10 @@ Handles vitals data operations in Firebase Realtime Database.
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from typing import Any, Coroutine, Dict, List, Optional
 
+from app.core.concurrency import run_blocking
 from app.core.exceptions import DatabaseError
 from app.db.realtime_db import RealtimeDBOperations
 from app.interfaces.repositories.vitals import IVitalsRepository
@@ -14,6 +16,10 @@ from app.interfaces.repositories.vitals import IVitalsRepository
 # Realtime Database server timestamp sentinel
 RDB_SERVER_TIMESTAMP = {".sv": "timestamp"}
 
+# Timestamp fields merged into every create/update payload
+CREATE_TIMESTAMPS = {"created_at": RDB_SERVER_TIMESTAMP, "updated_at": RDB_SERVER_TIMESTAMP}
+UPDATE_TIMESTAMPS = {"updated_at": RDB_SERVER_TIMESTAMP}
+
 logger = logging.getLogger(__name__)
 
 
@@ -37,7 +43,7 @@ class VitalsRepository(IVitalsRepository):
     async def get_by_id(self, id: str) -> Optional[Dict[str, Any]]:
         """Get vitals record by user ID."""
         try:
-            return self.rdb.get(f"users/{id}/vitals")
+            return await run_blocking(self.rdb.get, f"users/{id}/vitals")
         except Exception as e:
             logger.error(f"Error getting vitals for {id}: {e}")
             raise DatabaseError(detail=f"Failed to get vitals: {e}") from e
@@ -45,47 +51,37 @@ class VitalsRepository(IVitalsRepository):
     async def get_all(self, limit: int = 100) -> List[Dict[str, Any]]:
         """Get all vitals records."""
         try:
-            data = self.rdb.get("users")
-            if not data:
-                return []
-
-            results = []
-            for user_id, user_data in list(data.items())[:limit]:
-                if isinstance(user_data, dict) and "vitals" in user_data:
-                    vitals = user_data["vitals"]
-                    vitals["user_id"] = user_id
-                    results.append(vitals)
-            return results
+            # Only the first limit users are downloaded, not the whole tree
+            data = await run_blocking(self.rdb.get_first, "users", limit=limit)
+            # islice keeps the limit without materializing a list of items
+            return [
+                {**user_data["vitals"], "user_id": user_id}
+                for user_id, user_data in islice(data.items(), limit)
+                if isinstance(user_data, dict) and "vitals" in user_data
+            ]
         except Exception as e:
             logger.error(f"Error getting all vitals: {e}")
             raise DatabaseError(detail=f"Failed to get vitals: {e}") from e
 
     async def create(self, data: Dict[str, Any], id: Optional[str] = None) -> str:
-        """Create vitals record for a user."""
+        """Create vitals record for a user. Takes ownership of data (timestamps are added to it)."""
         try:
             if not id:
                 raise ValueError("User ID is required for vitals")
-            # Add timestamps
-            data_with_timestamps = {
-                **data,
-                "created_at": RDB_SERVER_TIMESTAMP,
-                "updated_at": RDB_SERVER_TIMESTAMP,
-            }
-            self.rdb.set(f"users/{id}/vitals", data_with_timestamps)
+            # Add timestamps in place; callers build data per write, so no copy is needed
+            data.update(CREATE_TIMESTAMPS)
+            await run_blocking(self.rdb.set, f"users/{id}/vitals", data)
             return id
         except Exception as e:
             logger.error(f"Error creating vitals: {e}")
             raise DatabaseError(detail=f"Failed to create vitals: {e}") from e
 
     async def update(self, id: str, data: Dict[str, Any]) -> None:
-        """Update vitals record for a user."""
+        """Update vitals record for a user. Takes ownership of data (updated_at is added to it)."""
         try:
-            # Add updated_at timestamp
-            data_with_timestamp = {
-                **data,
-                "updated_at": RDB_SERVER_TIMESTAMP,
-            }
-            self.rdb.update(f"users/{id}/vitals", data_with_timestamp)
+            # Add updated_at timestamp in place
+            data.update(UPDATE_TIMESTAMPS)
+            await run_blocking(self.rdb.update, f"users/{id}/vitals", data)
         except Exception as e:
             logger.error(f"Error updating vitals for {id}: {e}")
             raise DatabaseError(detail=f"Failed to update vitals: {e}") from e
@@ -93,7 +89,7 @@ class VitalsRepository(IVitalsRepository):
     async def delete(self, id: str) -> None:
         """Delete vitals record for a user."""
         try:
-            self.rdb.delete(f"users/{id}/vitals")
+            await run_blocking(self.rdb.delete, f"users/{id}/vitals")
         except Exception as e:
             logger.error(f"Error deleting vitals for {id}: {e}")
             raise DatabaseError(detail=f"Failed to delete vitals: {e}") from e
@@ -101,15 +97,38 @@ class VitalsRepository(IVitalsRepository):
     async def exists(self, id: str) -> bool:
         """Check if vitals exist for a user."""
         try:
-            data = self.rdb.get(f"users/{id}/vitals")
-            return data is not None
+            return await run_blocking(self.rdb.exists, f"users/{id}/vitals")
         except Exception as e:
             logger.error(f"Error checking vitals existence for {id}: {e}")
             raise DatabaseError(detail=f"Failed to check vitals: {e}") from e
 
-    async def update_user_vitals(self, user_id: str, vitals_data: Dict[str, Any]) -> None:
+    async def bulk_update_vitals(self, updates: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Update vitals for several users with one multi-path update.
+
+        Each field is written at users/{user_id}/vitals/{field}, so like
+        update() existing fields that aren't in the update are kept.
+        """
+        try:
+            paths: Dict[str, Any] = {}
+            for user_id, data in updates.items():
+                prefix = f"{user_id}/vitals"
+                for field, value in data.items():
+                    paths[f"{prefix}/{field}"] = value
+                paths[f"{prefix}/updated_at"] = RDB_SERVER_TIMESTAMP
+            if paths:
+                await run_blocking(self.rdb.update, "users", paths)
+        except Exception as e:
+            logger.error(f"Error updating vitals for {len(updates)} users: {e}")
+            raise DatabaseError(detail=f"Failed to update vitals: {e}") from e
+
+    def update_user_vitals(
+        self, user_id: str, vitals_data: Dict[str, Any]
+    ) -> Coroutine[Any, Any, None]:
         """Update vitals for a specific user."""
-        await self.update(user_id, vitals_data)
+        # Returns update()'s coroutine rather than awaiting it, so each vitals
+        # write still runs one coroutine instead of two
+        return self.update(user_id, vitals_data)
 
     async def get_user_vitals(self, user_id: str) -> Dict[str, Any]:
         """Get vitals for a specific user."""
@@ -5,20 +5,34 @@ These schemas provide standardized response formats and base models.
 """
 
 from datetime import datetime
-from typing import Generic, List, Optional, TypeVar
+from typing import Any, Dict, Generic, List, Optional, Type, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 # Type variable for generic response data
 T = TypeVar("T")
+S = TypeVar("S", bound="BaseSchema")
 
 
 class BaseSchema(BaseModel):
     """Base schema with common configuration."""
 
-    class Config:
-        from_attributes = True
-        populate_by_name = True
+    model_config = ConfigDict(
+        from_attributes=True,
+        populate_by_name=True,
+        extra="ignore",
+        validate_assignment=False,
+    )
+
+    @classmethod
+    def from_trusted(cls: Type[S], data: Dict[str, Any]) -> S:
+        """
+        Build an instance from data this app wrote itself, skipping validation.
+
+        Use for database reads and service-built payloads; inbound API payloads
+        must still go through normal validation. Keys that aren't fields are dropped.
+        """
+        return cls.model_construct(**data)
 
 
 class TimestampMixin(BaseModel):
@@ -77,6 +91,8 @@ class ErrorResponse(BaseModel):
 class HealthStatus(BaseModel):
     """Health check response schema."""
 
+    model_config = ConfigDict(extra="forbid")
+
     status: str = Field(..., description="Health status (healthy/unhealthy)")
     version: str = Field(..., description="Application version")
     environment: str = Field(..., description="Current environment")
@@ -85,5 +101,7 @@ class HealthStatus(BaseModel):
 class ReadinessStatus(BaseModel):
     """Readiness check response schema."""
 
+    model_config = ConfigDict(extra="forbid")
+
     status: str = Field(..., description="Readiness status")
     checks: dict = Field(..., description="Individual component check results")
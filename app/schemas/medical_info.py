@@ -4,7 +4,9 @@ Medical info schemas.
 Pydantic models for medical info request/response validation.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.schemas.common import BaseSchema
 
 
 class MedicalInfoRequest(BaseModel):
@@ -14,9 +16,11 @@ class MedicalInfoRequest(BaseModel):
     weight: float = Field(..., gt=0, description="Weight in kg")
 
 
-class MedicalInfoResponse(BaseModel):
+class MedicalInfoResponse(BaseSchema):
     """Response schema for medical info."""
 
+    model_config = ConfigDict(extra="forbid")
+
     user_id: str
     height: float
     weight: float
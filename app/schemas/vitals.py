@@ -2,13 +2,25 @@
 Vitals schemas for request/response validation.
 """
 
-from pydantic import Field
+from typing import Annotated, List
+
+from pydantic import Field, StringConstraints
 
 from app.schemas.common import BaseSchema
 
+# Each ID becomes one database path segment, so reject empty IDs and path/key characters
+UserId = Annotated[str, StringConstraints(min_length=1, pattern=r"^[^./#$\[\]]+$")]
+
 
 class VitalUpdateRequest(BaseSchema):
     """Request schema for updating user vitals."""
 
     heartrate: int = Field(..., ge=0, le=300, description="Heart rate in bpm")
     blood_pressure: int = Field(..., ge=0, le=300, description="Systolic blood pressure in mmHg")
+
+
+class VitalsBulkUpdateRequest(BaseSchema):
+    """Request schema for updating several users' vitals at once."""
+
+    # A Realtime Database multi-path update is a single request; keep it bounded
+    user_ids: List[UserId] = Field(..., min_length=1, max_length=500, description="User IDs")
@@ -8,12 +8,18 @@ Implements authentication business logic following SOLID principles:
 - Dependency Inversion: Firebase app is injected via constructor
 """
 
+import hashlib
 import logging
+import time
+from typing import Any, Callable, Dict, Optional, Set
 
 import firebase_admin
 from firebase_admin import auth
 from firebase_admin._auth_utils import InvalidIdTokenError
 
+from app.config.settings import get_settings
+from app.core.cache import TTLCache
+from app.core.concurrency import run_blocking
 from app.core.exceptions import (
     APIException,
     AuthenticationError,
@@ -25,6 +31,12 @@ from app.interfaces.repositories.authentication import IAuthenticationRepository
 
 logger = logging.getLogger(__name__)
 
+# Cached claims are only served while the token stays valid for this many seconds
+TOKEN_EXPIRY_MARGIN = 10
+
+# Custom claims assigned to every registered user
+REGISTRATION_CLAIMS = {"role": "family_head", "version": "1.0"}
+
 
 class AuthenticationService(IAuthenticationService):
     """
@@ -33,15 +45,73 @@ class AuthenticationService(IAuthenticationService):
     Handles user registration and other authentication operations.
     """
 
-    def __init__(self, firebase_app: firebase_admin.App, repo: IAuthenticationRepository) -> None:
+    def __init__(
+        self,
+        firebase_app: firebase_admin.App,
+        repo: IAuthenticationRepository,
+        token_verifier: Optional[Callable[..., Dict[str, Any]]] = None,
+    ) -> None:
         """
         Initialize the authentication service.
 
         Args:
             firebase_app: Initialized Firebase Admin app instance.
+            repo: Authentication repository.
+            token_verifier: Stand-in for auth.verify_id_token (e.g. a stub in tests).
         """
         self._app = firebase_app
         self.repo = repo
+        self._token_verifier = token_verifier
+        settings = get_settings()
+        # Decoded claims keyed by a digest of the token (the raw token is never kept).
+        # Nothing here learns that a user was disabled or a token revoked, so
+        # token_cache_ttl bounds how long get_me can return such claims.
+        self._verified_tokens: TTLCache[Dict[str, Any]] = TTLCache(
+            maxsize=settings.token_cache_size, ttl=settings.token_cache_ttl
+        )
+        # Token digests cached per UID, so a user's claims can be evicted together
+        self._user_tokens: TTLCache[Set[bytes]] = TTLCache(
+            maxsize=settings.token_cache_size, ttl=settings.token_cache_ttl
+        )
+        # UIDs whose registration claims this process has already set
+        self._claims_set: TTLCache[bool] = TTLCache(
+            maxsize=settings.token_cache_size, ttl=settings.token_cache_ttl
+        )
+
+    def _verify_token(self, token: str, **kwargs: Any) -> Dict[str, Any]:
+        """Verify an ID token (blocking) with the injected verifier or firebase_admin's."""
+        verify = self._token_verifier or auth.verify_id_token
+        return verify(token, app=self._app, **kwargs)
+
+    async def _verify_cached(self, token: str) -> Dict[str, Any]:
+        """
+        Verify token, reusing recently decoded claims for the same token.
+
+        Hits are only served while the token has more than TOKEN_EXPIRY_MARGIN
+        seconds left, so an expired token is always re-verified (and rejected).
+        """
+        key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        decoded = self._verified_tokens.get(key)
+        if (
+            decoded is not None
+            and decoded.get("exp", 0) > time.time() + TOKEN_EXPIRY_MARGIN
+            # Only while still indexed under its user, so _forget_user evicts it
+            and key in self._user_tokens.get(decoded.get("uid"), ())
+        ):
+            return dict(decoded)
+
+        decoded = await run_blocking(self._verify_token, token)
+        self._verified_tokens[key] = dict(decoded)
+        uid = decoded.get("uid")
+        tokens = self._user_tokens.get(uid) or set()
+        tokens.add(key)
+        self._user_tokens[uid] = tokens
+        return decoded
+
+    def _forget_user(self, uid: str) -> None:
+        """Evict the cached claims of every token of uid (e.g. after its claims change)."""
+        for key in self._user_tokens.pop(uid) or ():
+            self._verified_tokens.pop(key)
 
     async def register(self, token: str):
         """
@@ -62,12 +132,20 @@ class AuthenticationService(IAuthenticationService):
         try:
             logger.info("Processing registration request")
 
-            decoded = auth.verify_id_token(token, app=self._app, check_revoked=True)
+            # verify_id_token is blocking (key fetch + revocation lookup)
+            decoded = await run_blocking(self._verify_token, token, check_revoked=True)
             uid = decoded["uid"]
 
-            custom_claims = {"role": "family_head", "version": "1.0"}
+            custom_claims = REGISTRATION_CLAIMS
 
-            auth.set_custom_user_claims(uid, custom_claims)
+            # A retried registration skips the Admin API call if the claims are
+            # already on the token or were set by this process recently
+            already_set = all(decoded.get(k) == v for k, v in custom_claims.items())
+            if not already_set and not self._claims_set.get(uid):
+                await run_blocking(auth.set_custom_user_claims, uid, custom_claims)
+                self._claims_set[uid] = True
+                # Cached tokens carry the old claims
+                self._forget_user(uid)
 
             user_data = {
                 **decoded,
@@ -75,7 +153,7 @@ class AuthenticationService(IAuthenticationService):
             }
             await self.repo.register_user(uid, user_data)
 
-            logger.info(f"User registered successfully: {uid}")
+            logger.info("User registered successfully: %s", uid)
             return {
                 "detail": "User registered successfully",
                 "uid": uid,
@@ -84,12 +162,12 @@ class AuthenticationService(IAuthenticationService):
         except InvalidIdTokenError as e:
             error_msg = str(e).lower()
             if "expired" in error_msg:
-                logger.warning(f"Expired token received: {e}")
+                logger.warning("Expired token received: %s", e)
                 raise TokenExpiredError(
                     detail="The provided token has expired. Please re-authenticate."
                 ) from e
             else:
-                logger.warning(f"Invalid token received: {e}")
+                logger.warning("Invalid token received: %s", e)
                 raise InvalidTokenError(detail=f"Invalid token: {e}") from e
 
         except auth.UserNotFoundError as e:
@@ -109,6 +187,9 @@ class AuthenticationService(IAuthenticationService):
         """
         Get the current user's information from the token.
 
+        Claims of a recently verified token are reused for up to token_cache_ttl
+        seconds, so revocation or a disabled account shows up within that window.
+
         Args:
             token: Firebase ID token to decode.
 
@@ -123,20 +204,20 @@ class AuthenticationService(IAuthenticationService):
         try:
             logger.info("Processing get_me request")
 
-            decoded = auth.verify_id_token(token, app=self._app)
+            decoded = await self._verify_cached(token)
 
-            logger.info(f"Token decoded successfully for user: {decoded.get('uid')}")
+            logger.info("Token decoded successfully for user: %s", decoded.get("uid"))
             return decoded
 
         except InvalidIdTokenError as e:
             error_msg = str(e).lower()
             if "expired" in error_msg:
-                logger.warning(f"Expired token received: {e}")
+                logger.warning("Expired token received: %s", e)
                 raise TokenExpiredError(
                     detail="The provided token has expired. Please re-authenticate."
                 ) from e
             else:
-                logger.warning(f"Invalid token received: {e}")
+                logger.warning("Invalid token received: %s", e)
                 raise InvalidTokenError(detail=f"Invalid token: {e}") from e
 
         except APIException:
@@ -36,7 +36,7 @@ class MedicalInfoService(IMedicalInfoService):
             Medical info dict or None if not found.
         """
         try:
-            logger.info(f"Getting medical info for user: {user_id}")
+            logger.info("Getting medical info for user: %s", user_id)
             data = await self.repo.get_user_medical_info(user_id)
             if data:
                 data["user_id"] = user_id
@@ -60,7 +60,7 @@ class MedicalInfoService(IMedicalInfoService):
             The saved medical info.
         """
         try:
-            logger.info(f"Setting medical info for user: {user_id}")
+            logger.info("Setting medical info for user: %s", user_id)
 
             medical_data = {
                 "height": height,
@@ -69,7 +69,7 @@ class MedicalInfoService(IMedicalInfoService):
 
             await self.repo.set_user_medical_info(user_id, medical_data)
 
-            logger.info(f"Medical info saved for user: {user_id}")
+            logger.info("Medical info saved for user: %s", user_id)
             return {
                 "user_id": user_id,
                 "height": height,
@@ -1,7 +1,8 @@
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import httpx
+import orjson
 
 from app.config.settings import get_settings
 from app.core.exceptions import APIException, DatabaseError
@@ -14,12 +15,41 @@ logger = logging.getLogger(__name__)
 class SymptomCheckerService(ISymptomCheckerService):
     """Concrete implementation of symptom checker service."""
 
-    def __init__(self, repo: SymptomCheckerRepository) -> None:
-        """Initialize the service with repository."""
-        self.repo = repo
-        self.agent_url = get_settings().agent_url
+    def __init__(
+        self,
+        repo: SymptomCheckerRepository,
+        http_client: Optional[httpx.AsyncClient] = None,
+        agent_url: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize the service.
 
-    def init(self) -> Dict[str, Any]:
+        Args:
+            repo: Symptom checker repository.
+            http_client: Agent HTTP client. When omitted, the service creates a
+                pooled keep-alive client of its own and closes it in aclose().
+            agent_url: Base URL of the agent. Defaults to the configured AGENT_URL.
+        """
+        settings = get_settings()
+        self.repo = repo
+        self.agent_url = agent_url or settings.agent_url
+        # Joined once here rather than on every submit()
+        self.process_url = f"{self.agent_url}/process"
+        self._owns_client = http_client is None
+        self.http_client = http_client or httpx.AsyncClient(
+            timeout=settings.agent_timeout,
+            limits=httpx.Limits(
+                max_connections=settings.agent_max_connections,
+                max_keepalive_connections=settings.agent_max_connections,
+            ),
+        )
+
+    async def aclose(self) -> None:
+        """Close the agent HTTP client if this service created it."""
+        if self._owns_client:
+            await self.http_client.aclose()
+
+    async def init(self) -> Dict[str, Any]:
         """Start a new symptom checker conversation.
 
         Returns:
@@ -30,8 +60,8 @@ class SymptomCheckerService(ISymptomCheckerService):
         """
         try:
             logger.info("Initializing new symptom checker conversation")
-            conversation_id = self.repo.start_conversation()
-            logger.info(f"Symptom checker conversation started: {conversation_id}")
+            conversation_id = await self.repo.start_conversation()
+            logger.info("Symptom checker conversation started: %s", conversation_id)
             return {"conversation_id": conversation_id}
         except APIException:
             raise
@@ -39,7 +69,7 @@ class SymptomCheckerService(ISymptomCheckerService):
             logger.exception(f"Error initializing symptom checker: {e}")
             raise DatabaseError(detail=f"Failed to initialize symptom checker: {e}") from e
 
-    def submit(self, conversation_id: str, symptoms: list[str]) -> Dict[str, Any]:
+    async def submit(self, conversation_id: str, symptoms: list[str]) -> Dict[str, Any]:
         """Submit and get Symptom from Agent.
 
         Args:
@@ -54,25 +84,22 @@ class SymptomCheckerService(ISymptomCheckerService):
             DatabaseError: If database operation fails.
         """
         try:
-            logger.info(f"Submitting symptoms for conversation: {conversation_id}")
-            self.repo.create_user_message(conversation_id, symptoms)
+            logger.info("Submitting symptoms for conversation: %s", conversation_id)
             payload = {"conversation_id": conversation_id, "selections": symptoms}
-            with httpx.Client(timeout=None) as client:
-                response = client.post(f"{self.agent_url}/process", json=payload)
+            response = await self.http_client.post(self.process_url, json=payload)
             if response.status_code != 200:
                 raise APIException(detail="Failed to get response from agent.")
 
-            agent_response = response.json()
+            agent_response = orjson.loads(response.content)
             message = agent_response.get("content")
             response_type = agent_response.get("message_type")
-            message = ["DING", "DONG"]
-            response_type = "choice"
 
             if not message or not response_type:
                 raise APIException(detail="Invalid response from agent.")
 
-            self.repo.create_agent_message(conversation_id, message, response_type)
-            logger.info(f"Symptoms submitted successfully for conversation: {conversation_id}")
+            # Both messages of the turn are written together once the agent replies
+            await self.repo.create_turn(conversation_id, symptoms, message, response_type)
+            logger.info("Symptoms submitted successfully for conversation: %s", conversation_id)
             return {"detail": "Symptoms submitted successfully."}
         except APIException:
             raise
@@ -9,7 +9,7 @@ Implements vitals business logic following SOLID principles:
 import logging
 import random
 import time
-from typing import Any, Dict
+from typing import Any, Dict, List, Tuple
 
 from app.core.exceptions import DatabaseError
 from app.interfaces.repositories.vitals import IVitalsRepository
@@ -17,6 +17,34 @@ from app.interfaces.vitals import IVitalsService
 
 logger = logging.getLogger(__name__)
 
+# Bits per generated reading
+VITALS_BITS = 10
+VITALS_MASK = (1 << VITALS_BITS) - 1
+
+
+def _generate_vitals(timestamp: int) -> Tuple[int, int, Dict[str, Any]]:
+    """Generate random heartrate/blood pressure readings and their stored vitals record."""
+    # One 20-bit draw split into two 10-bit readings (1-1024) instead of two randint calls
+    bits = random.getrandbits(2 * VITALS_BITS)  # nosec B311 - demo data only
+    heartrate = (bits & VITALS_MASK) + 1
+    blood_pressure = (bits >> VITALS_BITS) + 1
+
+    vitals_data = {
+        "heart_rate": {
+            "value": heartrate,
+            "unit": "bpm",
+            "status": "Low" if heartrate < 60 else "Normal",
+            "updated_at": timestamp,
+        },
+        "blood_pressure": {
+            "systolic": blood_pressure,
+            "unit": "mmHg",
+            "status": "Watch" if blood_pressure > 130 else "Normal",
+            "updated_at": timestamp,
+        },
+    }
+    return heartrate, blood_pressure, vitals_data
+
 
 class VitalsService(IVitalsService):
     """
@@ -39,7 +67,7 @@ class VitalsService(IVitalsService):
         Update user vitals in the database with random values.
 
         Business Logic:
-        - Generates random heartrate and blood_pressure (1-1000)
+        - Generates random heartrate and blood_pressure (1-1024)
         - Calculates status based on values
         - Delegates storage to repository
 
@@ -53,32 +81,15 @@ class VitalsService(IVitalsService):
             DatabaseError: If database operation fails.
         """
         try:
-            logger.info(f"Updating vitals for user: {user_id}")
+            logger.info("Updating vitals for user: %s", user_id)
 
             # Business logic: generate values and calculate status
-            timestamp = int(time.time())
-            heartrate = random.randint(1, 1000)  # nosec B311 - demo data only
-            blood_pressure = random.randint(1, 1000)  # nosec B311 - demo data only
-
-            vitals_data = {
-                "heart_rate": {
-                    "value": heartrate,
-                    "unit": "bpm",
-                    "status": "Low" if heartrate < 60 else "Normal",
-                    "updated_at": timestamp,
-                },
-                "blood_pressure": {
-                    "systolic": blood_pressure,
-                    "unit": "mmHg",
-                    "status": "Watch" if blood_pressure > 130 else "Normal",
-                    "updated_at": timestamp,
-                },
-            }
+            heartrate, blood_pressure, vitals_data = _generate_vitals(int(time.time()))
 
             # Delegate to repository for data access
             await self.repo.update_user_vitals(user_id, vitals_data)
 
-            logger.info(f"Vitals updated successfully for user: {user_id}")
+            logger.info("Vitals updated successfully for user: %s", user_id)
             return {
                 "status": "updated",
                 "user_id": user_id,
@@ -91,3 +102,40 @@ class VitalsService(IVitalsService):
         except Exception as e:
             logger.exception(f"Error updating vitals for user {user_id}: {e}")
             raise DatabaseError(detail=f"Failed to update vitals: {e}") from e
+
+    async def bulk_update_vitals(self, user_ids: List[str]) -> Dict[str, Any]:
+        """
+        Update vitals for several users with random values in one database write.
+
+        Args:
+            user_ids: The users' IDs.
+
+        Returns:
+            Update status response with the generated values per user.
+
+        Raises:
+            DatabaseError: If database operation fails.
+        """
+        try:
+            logger.info("Updating vitals for %d users", len(user_ids))
+
+            timestamp = int(time.time())
+            updates: Dict[str, Dict[str, Any]] = {}
+            results = []
+            for user_id in dict.fromkeys(user_ids):
+                heartrate, blood_pressure, updates[user_id] = _generate_vitals(timestamp)
+                results.append(
+                    {"user_id": user_id, "heartrate": heartrate, "blood_pressure": blood_pressure}
+                )
+
+            # One multi-path update instead of a round-trip per user
+            await self.repo.bulk_update_vitals(updates)
+
+            logger.info("Vitals updated successfully for %d users", len(results))
+            return {"status": "updated", "results": results}
+
+        except DatabaseError:
+            raise
+        except Exception as e:
+            logger.exception(f"Error updating vitals for {len(user_ids)} users: {e}")
+            raise DatabaseError(detail=f"Failed to update vitals: {e}") from e
@@ -5,17 +5,31 @@ Provides common fixtures for testing the FastAPI application.
 """
 
 import os
-from typing import Generator
-from unittest.mock import MagicMock, patch
+from typing import AsyncGenerator, Generator
+from unittest.mock import AsyncMock, MagicMock
 
+import httpx
+import orjson
 import pytest
+import pytest_asyncio
 from fastapi.testclient import TestClient
+from pytest_asyncio import is_async_test
 
 # Set test environment before importing app
 os.environ["ENVIRONMENT"] = "development"
 os.environ["DEBUG"] = "true"
 os.environ["USE_FIRESTORE_EMULATOR"] = "true"
 os.environ["SERVICE_ACCOUNT_CREDENTIALS_PATH"] = ""  # Empty for tests (mocked)
+os.environ["READINESS_REFRESH_INTERVAL"] = "0"  # Check on demand so tests stay deterministic
+os.environ["LOG_TO_FILE"] = "false"  # Keep test runs from appending to logs/app.log
+
+
+def pytest_collection_modifyitems(items):
+    """Run every async test on one session-wide event loop instead of a loop per test."""
+    session_loop = pytest.mark.asyncio(scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
 
 
 @pytest.fixture(scope="session")
@@ -31,6 +45,19 @@ def mock_firestore_client():
     return mock_client
 
 
+@pytest.fixture(scope="session")
+def mock_async_firestore_client():
+    """
+    Mock async Firestore client for testing.
+
+    Returns a MagicMock whose query reads are awaitable.
+    """
+    mock_client = MagicMock()
+    mock_client.project = "test-project"
+    mock_client.collection.return_value.limit.return_value.get = AsyncMock(return_value=[])
+    return mock_client
+
+
 @pytest.fixture(scope="session")
 def mock_firebase_app():
     """
@@ -40,22 +67,27 @@ def mock_firebase_app():
     """
     mock_app = MagicMock()
     mock_app.project_id = "test-project"
+    mock_app.name = "[DEFAULT]"
     return mock_app
 
 
 @pytest.fixture(scope="session")
-def app(mock_firestore_client, mock_firebase_app):
+def app(mock_firestore_client, mock_async_firestore_client, mock_firebase_app):
     """
     Create a test application instance.
 
-    Patches the Firestore client and Firebase Admin to use mocks.
+    Patches the Firestore clients and Firebase Admin to use mocks.
     """
-    with patch("app.db.firestore.get_firestore_client", return_value=mock_firestore_client):
-        with patch("app.db.firebase_admin.get_firebase_app", return_value=mock_firebase_app):
-            from app.main import create_application
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("app.db.firestore.get_firestore_client", lambda: mock_firestore_client)
+        mp.setattr(
+            "app.db.firestore.get_async_firestore_client", lambda: mock_async_firestore_client
+        )
+        mp.setattr("app.db.firebase_admin.get_firebase_app", lambda: mock_firebase_app)
+        from app.main import create_application
 
-            test_app = create_application()
-            yield test_app
+        test_app = create_application()
+        yield test_app
 
 
 @pytest.fixture(scope="session")
@@ -63,11 +95,125 @@ def client(app) -> Generator:
     """
     Create a test client for the FastAPI application.
 
+    Readiness probes are stubbed to report healthy without touching Firestore
+    or the Realtime Database; tests that exercise a failing check patch over
+    the stub.
+
     Yields:
         TestClient instance for making HTTP requests.
     """
-    with TestClient(app) as test_client:
-        yield test_client
+
+    async def healthy():
+        return True
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("app.api.v1.endpoints.health.check_firestore_connection", healthy)
+        mp.setattr("app.api.v1.endpoints.health.check_realtime_db_connection", healthy)
+        with TestClient(app) as test_client:
+            yield test_client
+
+
+@pytest_asyncio.fixture(scope="session")
+async def aclient(app, client) -> AsyncGenerator:
+    """
+    Create an async HTTP client for the FastAPI application.
+
+    Requests are dispatched in-process on the test's event loop, so several can
+    be awaited together with asyncio.gather. Depends on client so the app's
+    lifespan (and app.state.services) is already started.
+
+    Yields:
+        httpx.AsyncClient bound to the app.
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as async_client:
+        yield async_client
+
+
+class FakeAgent:
+    """Stand-in symptom checker agent served through an httpx.MockTransport."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Answer 200 with a text message and forget recorded requests."""
+        self.status_code = 200
+        self.payload = {"content": ["Result"], "message_type": "text"}
+        self.requests = []
+
+    @property
+    def payload(self):
+        """JSON body the agent answers with."""
+        return self._payload
+
+    @payload.setter
+    def payload(self, value):
+        # Serialized once here, not on every request the fake answers
+        self._payload = value
+        self._body = orjson.dumps(value)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        """Record the request and answer with the configured status and payload."""
+        self.requests.append(request)
+        return httpx.Response(self.status_code, content=self._body)
+
+
+@pytest.fixture(scope="session")
+def _fake_agent():
+    """The session's single FakeAgent; use fake_agent to get it reset."""
+    return FakeAgent()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def agent_http_client(_fake_agent) -> AsyncGenerator:
+    """
+    Create an agent HTTP client whose requests are answered by the fake agent.
+
+    Yields:
+        httpx.AsyncClient using a MockTransport, shared by the session.
+    """
+    transport = httpx.MockTransport(_fake_agent.handle)
+    async with httpx.AsyncClient(transport=transport) as http_client:
+        yield http_client
+
+
+@pytest.fixture
+def fake_agent(_fake_agent):
+    """
+    Reset the fake agent for a test.
+
+    Set status_code and payload to change the next responses; requests
+    holds every httpx.Request the agent received.
+    """
+    _fake_agent.reset()
+    return _fake_agent
+
+
+@pytest.fixture(autouse=True)
+def reset_dependency_overrides(request):
+    """
+    Clear FastAPI dependency overrides after each test that uses the app.
+
+    The app and client are built once per session, so overrides must not
+    leak from one test into the next.
+    """
+    yield
+    if "app" in request.fixturenames:
+        request.getfixturevalue("app").dependency_overrides.clear()
+
+
+@pytest.fixture
+def firebase_verify_ok(monkeypatch):
+    """
+    Make firebase_admin.auth.verify_id_token accept any token for the test.
+
+    Returns:
+        The decoded claims every verification returns.
+    """
+    decoded = {"uid": "user123", "email": "test@example.com", "name": "Test User"}
+    monkeypatch.setattr("firebase_admin.auth.verify_id_token", lambda *args, **kwargs: decoded)
+    return decoded
 
 
 @pytest.fixture
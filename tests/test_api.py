@@ -2,6 +2,10 @@
 Tests for API endpoints (root and docs).
 """
 
+from unittest.mock import MagicMock
+
+import pytest
+
 
 class TestRootEndpoints:
     """Test suite for root API endpoints."""
@@ -49,3 +53,79 @@ class TestAPIPrefix:
         response = client.get("/api/v1/nonexistent")
 
         assert response.status_code == 404
+
+    def test_invalid_path_returns_detail_body(self, client):
+        """Test framework errors keep FastAPI's {"detail": ...} body."""
+        response = client.get("/api/v1/nonexistent")
+
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == {"detail": "Not Found"}
+
+    @pytest.mark.parametrize("status_code", [101, 204, 205, 304])
+    async def test_bodiless_status_has_no_body(self, status_code):
+        """Test framework errors with a bodiless status code are sent without a body."""
+        from starlette.exceptions import HTTPException as StarletteHTTPException
+
+        from app.core.exceptions import http_exception_handler
+
+        response = await http_exception_handler(MagicMock(), StarletteHTTPException(status_code))
+
+        assert response.status_code == status_code
+        assert response.body == b""
+
+    def test_routes_are_registered_once(self, app):
+        """Test no path/method pair is registered twice (each router included once)."""
+        from fastapi.routing import APIRoute
+
+        seen = [
+            (route.path, method)
+            for route in app.routes
+            if isinstance(route, APIRoute)
+            for method in route.methods
+        ]
+
+        assert len(seen) == len(set(seen))
+
+
+class TestRequestContextMiddleware:
+    """Test suite for the request context middleware."""
+
+    def test_response_echoes_incoming_request_id(self, client):
+        """Test a caller-supplied X-Request-ID is returned unchanged."""
+        response = client.get("/api/v1/health", headers={"X-Request-ID": "req-abc123"})
+
+        assert response.headers["X-Request-ID"] == "req-abc123"
+
+    def test_response_gets_generated_request_id(self, client):
+        """Test a request ID is generated when the caller doesn't send one."""
+        response = client.get("/api/v1/health")
+
+        assert response.headers["X-Request-ID"]
+        assert len(response.headers.get_list("X-Request-ID")) == 1
+
+
+class TestCORS:
+    """Test suite for CORS configuration."""
+
+    def test_preflight_allows_configured_origin(self, client):
+        """Test a preflight from a configured origin is answered."""
+        response = client.options(
+            "/api/v1/health",
+            headers={
+                "Origin": "http://localhost:3000",
+                "Access-Control-Request-Method": "GET",
+                "Access-Control-Request-Headers": "Authorization",
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.headers["access-control-allow-origin"] == "http://localhost:3000"
+
+    def test_preflight_rejects_unknown_origin(self, client):
+        """Test a preflight from an unlisted origin is rejected."""
+        response = client.options(
+            "/api/v1/health",
+            headers={"Origin": "https://evil.example", "Access-Control-Request-Method": "GET"},
+        )
+
+        assert response.status_code == 400
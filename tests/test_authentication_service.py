@@ -2,119 +2,135 @@
 Unit tests for Authentication Service.
 """
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import time
+from unittest.mock import MagicMock
 
 import pytest
+from firebase_admin import auth
+from firebase_admin._auth_utils import InvalidIdTokenError
+
+from app.core.exceptions import (
+    APIException,
+    AuthenticationError,
+    InvalidTokenError,
+    TokenExpiredError,
+)
+from app.services.authentication import AuthenticationService
+
+
+class FakeAuthenticationRepository:
+    """In-memory authentication repository that records calls (cheaper than an AsyncMock)."""
+
+    def __init__(self):
+        self.error = None
+        self.calls = []
+
+    async def register_user(self, uid, data):
+        self.calls.append((uid, data))
+        if self.error:
+            raise self.error
 
 
 class TestAuthenticationService:
     """Test suite for AuthenticationService."""
 
     @pytest.fixture
-    def mock_firebase_app(self):
-        """Mock Firebase Admin app."""
-        mock = MagicMock()
-        mock.project_id = "test-project"
-        return mock
+    def auth_repo(self):
+        """Fake authentication repository."""
+        return FakeAuthenticationRepository()
 
     @pytest.fixture
-    def mock_auth_repo(self):
-        """Mock authentication repository."""
-        mock = AsyncMock()
-        mock.register_user.return_value = None
-        return mock
+    def mock_verifier(self):
+        """Stub token verifier injected into the service."""
+        return MagicMock()
 
     @pytest.fixture
-    def auth_service(self, mock_firebase_app, mock_auth_repo):
+    def auth_service(self, mock_firebase_app, auth_repo, mock_verifier):
         """Create an AuthenticationService with mocked dependencies."""
-        from app.services.authentication import AuthenticationService
+        return AuthenticationService(mock_firebase_app, auth_repo, mock_verifier)
 
-        return AuthenticationService(mock_firebase_app, mock_auth_repo)
+    @pytest.fixture
+    def mock_set_claims(self, monkeypatch):
+        """Replace set_custom_user_claims with a MagicMock for the test."""
+        mock = MagicMock()
+        monkeypatch.setattr("firebase_admin.auth.set_custom_user_claims", mock)
+        return mock
 
-    @pytest.mark.asyncio
-    async def test_register_success(self, auth_service, mock_auth_repo):
+    async def test_register_success(self, auth_service, auth_repo, mock_set_claims, mock_verifier):
         """Test successful user registration."""
         mock_token = "valid_token"
         mock_uid = "user123"
         mock_decoded = {"uid": mock_uid, "email": "test@example.com"}
 
-        with patch("firebase_admin.auth.verify_id_token", return_value=mock_decoded):
-            with patch("firebase_admin.auth.set_custom_user_claims") as mock_set_claims:
-                result = await auth_service.register(mock_token)
+        mock_verifier.return_value = mock_decoded
 
-                assert result["detail"] == "User registered successfully"
-                assert result["uid"] == mock_uid
-                mock_auth_repo.register_user.assert_called_once()
-                mock_set_claims.assert_called_once_with(
-                    mock_uid, {"role": "family_head", "version": "1.0"}
-                )
+        result = await auth_service.register(mock_token)
 
-    @pytest.mark.asyncio
-    async def test_register_invalid_token(self, auth_service):
-        """Test registration with invalid token raises InvalidTokenError."""
-        from firebase_admin._auth_utils import InvalidIdTokenError
+        assert result["detail"] == "User registered successfully"
+        assert result["uid"] == mock_uid
+        assert len(auth_repo.calls) == 1
+        mock_set_claims.assert_called_once_with(mock_uid, {"role": "family_head", "version": "1.0"})
 
-        mock_token = "invalid_token"
+    async def test_register_retry_skips_claims_update(
+        self, auth_service, auth_repo, mock_set_claims, mock_verifier
+    ):
+        """Test that a repeated registration sets custom claims only once."""
+        mock_decoded = {"uid": "user123", "email": "test@example.com"}
 
-        with patch(
-            "firebase_admin.auth.verify_id_token",
-            side_effect=InvalidIdTokenError("Invalid token"),
-        ):
-            from app.core.exceptions import InvalidTokenError
+        mock_verifier.return_value = mock_decoded
 
-            with pytest.raises(InvalidTokenError):
-                await auth_service.register(mock_token)
+        await auth_service.register("valid_token")
+        await auth_service.register("valid_token")
 
-    @pytest.mark.asyncio
-    async def test_register_expired_token(self, auth_service):
-        """Test registration with expired token raises TokenExpiredError."""
-        from firebase_admin._auth_utils import InvalidIdTokenError
+        mock_set_claims.assert_called_once()
+        assert len(auth_repo.calls) == 2
 
-        mock_token = "expired_token"
+    async def test_register_claims_already_on_token(
+        self, auth_service, mock_set_claims, mock_verifier
+    ):
+        """Test that claims already present on the token are not set again."""
+        mock_decoded = {"uid": "user123", "role": "family_head", "version": "1.0"}
 
-        with patch(
-            "firebase_admin.auth.verify_id_token",
-            side_effect=InvalidIdTokenError("Token has expired"),
-        ):
-            from app.core.exceptions import TokenExpiredError
+        mock_verifier.return_value = mock_decoded
 
-            with pytest.raises(TokenExpiredError):
-                await auth_service.register(mock_token)
+        await auth_service.register("valid_token")
 
-    @pytest.mark.asyncio
-    async def test_register_user_not_found(self, auth_service):
-        """Test registration when user not found raises AuthenticationError."""
-        from firebase_admin import auth
+        mock_set_claims.assert_not_called()
 
-        mock_token = "valid_token"
-
-        with patch(
-            "firebase_admin.auth.verify_id_token",
-            side_effect=auth.UserNotFoundError("User not found"),
-        ):
-            from app.core.exceptions import AuthenticationError
+    @pytest.mark.parametrize(
+        "verify_error, expected",
+        [
+            (InvalidIdTokenError("Invalid token"), InvalidTokenError),
+            (InvalidIdTokenError("Token has expired"), TokenExpiredError),
+            (auth.UserNotFoundError("User not found"), AuthenticationError),
+            (Exception("Unexpected error"), APIException),
+        ],
+        ids=["invalid", "expired", "user-not-found", "unexpected"],
+    )
+    async def test_register_verification_errors(
+        self, auth_service, mock_verifier, verify_error, expected
+    ):
+        """Test that token verification failures during registration map to API errors."""
+        mock_verifier.side_effect = verify_error
 
-            with pytest.raises(AuthenticationError):
-                await auth_service.register(mock_token)
+        with pytest.raises(expected):
+            await auth_service.register("some_token")
 
-    @pytest.mark.asyncio
-    async def test_register_repository_error(self, auth_service, mock_auth_repo):
+    async def test_register_repository_error(
+        self, auth_service, auth_repo, mock_set_claims, mock_verifier
+    ):
         """Test registration when repository fails raises APIException."""
         mock_token = "valid_token"
         mock_uid = "user123"
         mock_decoded = {"uid": mock_uid, "email": "test@example.com"}
 
-        with patch("firebase_admin.auth.verify_id_token", return_value=mock_decoded):
-            with patch("firebase_admin.auth.set_custom_user_claims"):
-                mock_auth_repo.register_user.side_effect = Exception("Database error")
-
-                from app.core.exceptions import APIException
+        mock_verifier.return_value = mock_decoded
+        auth_repo.error = Exception("Database error")
 
-                with pytest.raises(APIException):
-                    await auth_service.register(mock_token)
+        with pytest.raises(APIException):
+            await auth_service.register(mock_token)
 
-    @pytest.mark.asyncio
-    async def test_get_me_success(self, auth_service):
+    async def test_get_me_success(self, auth_service, mock_verifier):
         """Test successful get_me request."""
         mock_token = "valid_token"
         mock_decoded = {
@@ -123,54 +139,57 @@ class TestAuthenticationService:
             "name": "Test User",
         }
 
-        with patch("firebase_admin.auth.verify_id_token", return_value=mock_decoded):
-            result = await auth_service.get_me(mock_token)
-
-            assert result["uid"] == "user123"
-            assert result["email"] == "test@example.com"
-
-    @pytest.mark.asyncio
-    async def test_get_me_invalid_token(self, auth_service):
-        """Test get_me with invalid token raises InvalidTokenError."""
-        from firebase_admin._auth_utils import InvalidIdTokenError
-
-        mock_token = "invalid_token"
+        mock_verifier.return_value = mock_decoded
 
-        with patch(
-            "firebase_admin.auth.verify_id_token",
-            side_effect=InvalidIdTokenError("Invalid token"),
-        ):
-            from app.core.exceptions import InvalidTokenError
+        result = await auth_service.get_me(mock_token)
 
-            with pytest.raises(InvalidTokenError):
-                await auth_service.get_me(mock_token)
+        assert result["uid"] == "user123"
+        assert result["email"] == "test@example.com"
 
-    @pytest.mark.asyncio
-    async def test_get_me_expired_token(self, auth_service):
-        """Test get_me with expired token raises TokenExpiredError."""
-        from firebase_admin._auth_utils import InvalidIdTokenError
+    async def test_get_me_reuses_verified_token(self, auth_service, mock_verifier):
+        """Test that repeated get_me calls with one unexpired token verify it once."""
+        mock_decoded = {"uid": "user123", "exp": time.time() + 3600}
+        mock_verifier.return_value = mock_decoded
 
-        mock_token = "expired_token"
+        first = await auth_service.get_me("valid_token")
+        second = await auth_service.get_me("valid_token")
 
-        with patch(
-            "firebase_admin.auth.verify_id_token",
-            side_effect=InvalidIdTokenError("Token has expired"),
-        ):
-            from app.core.exceptions import TokenExpiredError
+        assert first == second == mock_decoded
+        mock_verifier.assert_called_once()
 
-            with pytest.raises(TokenExpiredError):
-                await auth_service.get_me(mock_token)
+    async def test_register_claims_evict_cached_get_me(
+        self, auth_service, mock_verifier, mock_set_claims
+    ):
+        """Test that setting registration claims makes get_me re-verify the user's tokens."""
+        mock_verifier.return_value = {"uid": "user123", "exp": time.time() + 3600}
+        await auth_service.get_me("valid_token")
 
-    @pytest.mark.asyncio
-    async def test_get_me_unexpected_error(self, auth_service):
-        """Test get_me with unexpected error raises APIException."""
-        mock_token = "valid_token"
-
-        with patch(
-            "firebase_admin.auth.verify_id_token",
-            side_effect=Exception("Unexpected error"),
-        ):
-            from app.core.exceptions import APIException
-
-            with pytest.raises(APIException):
-                await auth_service.get_me(mock_token)
+        await auth_service.register("valid_token")
+        mock_verifier.return_value = {
+            "uid": "user123",
+            "exp": time.time() + 3600,
+            "role": "family_head",
+        }
+        result = await auth_service.get_me("valid_token")
+
+        mock_set_claims.assert_called_once()
+        assert result["role"] == "family_head"
+        assert mock_verifier.call_count == 3
+
+    @pytest.mark.parametrize(
+        "verify_error, expected",
+        [
+            (InvalidIdTokenError("Invalid token"), InvalidTokenError),
+            (InvalidIdTokenError("Token has expired"), TokenExpiredError),
+            (Exception("Unexpected error"), APIException),
+        ],
+        ids=["invalid", "expired", "unexpected"],
+    )
+    async def test_get_me_verification_errors(
+        self, auth_service, mock_verifier, verify_error, expected
+    ):
+        """Test that token verification failures during get_me map to API errors."""
+        mock_verifier.side_effect = verify_error
+
+        with pytest.raises(expected):
+            await auth_service.get_me("some_token")
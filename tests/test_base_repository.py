@@ -0,0 +1,77 @@
+"""
+Unit tests for the base Firestore repository.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from google.cloud import firestore
+from pydantic import BaseModel
+
+from app.repositories.base import FIRESTORE_RETRY, FIRESTORE_TIMEOUT, BaseRepository
+
+
+class Item(BaseModel):
+    """Minimal document model."""
+
+    id: str
+
+
+class ItemRepository(BaseRepository[Item]):
+    """Repository over a test collection."""
+
+    collection_name = "items"
+    model_class = Item
+
+
+class TestBaseRepository:
+    """Test suite for BaseRepository."""
+
+    async def test_create_without_id_uses_retryable_set(self):
+        """Test that an auto-ID create writes with set() on a client-side ID, not add()."""
+        db = MagicMock()
+        collection = db.collection.return_value
+        doc_ref = collection.document.return_value
+        doc_ref.id = "generated-id"
+        doc_ref.set = AsyncMock()
+
+        doc_id = await ItemRepository(db).create({"name": "item"})
+
+        assert doc_id == "generated-id"
+        collection.document.assert_called_once_with(None)
+        collection.add.assert_not_called()
+        doc_ref.set.assert_awaited_once_with(
+            {"name": "item"}, retry=FIRESTORE_RETRY, timeout=FIRESTORE_TIMEOUT
+        )
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"count": firestore.Increment(1)},
+            {"tags": firestore.ArrayUnion(["a"])},
+            {"meta": {"updated_at": firestore.SERVER_TIMESTAMP}},
+        ],
+    )
+    async def test_update_with_transforms_is_not_retried(self, data):
+        """Test that an update carrying field transforms is sent without a retry policy."""
+        db = MagicMock()
+        doc_ref = db.collection.return_value.document.return_value
+        doc_ref.update = AsyncMock()
+
+        await ItemRepository(db).update("item-1", data)
+
+        doc_ref.update.assert_awaited_once_with(data, retry=None, timeout=FIRESTORE_TIMEOUT)
+
+    async def test_plain_update_is_retried(self):
+        """Test that an update of plain values keeps the retry policy."""
+        db = MagicMock()
+        doc_ref = db.collection.return_value.document.return_value
+        doc_ref.update = AsyncMock()
+
+        await ItemRepository(db).update("item-1", {"name": "item", "old": firestore.DELETE_FIELD})
+
+        doc_ref.update.assert_awaited_once_with(
+            {"name": "item", "old": firestore.DELETE_FIELD},
+            retry=FIRESTORE_RETRY,
+            timeout=FIRESTORE_TIMEOUT,
+        )
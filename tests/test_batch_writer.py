@@ -0,0 +1,116 @@
+"""
+Unit tests for the buffered Firestore batch writer.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+
+class TestBufferedBatchWriter:
+    """Test suite for BufferedBatchWriter."""
+
+    @pytest.fixture
+    def db(self):
+        """Async Firestore client mock whose batches share one commit mock."""
+        client = MagicMock()
+        client.batch.return_value.commit = AsyncMock()
+        return client
+
+    async def test_writes_coalesce_into_one_commit(self, db):
+        """Writes queued within the window are committed together."""
+        from app.repositories.base import BufferedBatchWriter
+
+        writer = BufferedBatchWriter(db, window_ms=10)
+        await asyncio.gather(writer.set("ref-a", {"n": 1}), writer.set("ref-b", {"n": 2}))
+
+        db.batch.assert_called_once()
+        assert db.batch.return_value.set.call_count == 2
+        db.batch.return_value.commit.assert_awaited_once()
+
+    async def test_full_batch_commits_immediately(self, db):
+        """Reaching max_batch_size commits without waiting for the window."""
+        from app.repositories.base import BufferedBatchWriter
+
+        writer = BufferedBatchWriter(db, window_ms=60_000, max_batch_size=2)
+        await asyncio.gather(writer.set("ref-a", {"n": 1}), writer.set("ref-b", {"n": 2}))
+
+        db.batch.return_value.commit.assert_awaited_once()
+
+    async def test_close_flushes_pending_writes(self, db):
+        """close() commits anything still queued."""
+        from app.repositories.base import BufferedBatchWriter
+
+        writer = BufferedBatchWriter(db, window_ms=60_000)
+        pending = asyncio.create_task(writer.set("ref-a", {"n": 1}))
+        await asyncio.sleep(0)
+        db.batch.return_value.commit.assert_not_awaited()
+
+        await writer.close()
+        await pending
+
+        db.batch.return_value.commit.assert_awaited_once()
+
+    async def test_set_waits_for_commit(self, db):
+        """set() returns only after the batch holding its write is committed."""
+        from app.repositories.base import BufferedBatchWriter
+
+        writer = BufferedBatchWriter(db, window_ms=10)
+        await writer.set("ref-a", {"n": 1})
+
+        db.batch.return_value.commit.assert_awaited_once()
+
+    async def test_failed_commit_raises_to_every_writer(self, db):
+        """A failed timed commit is raised from each set() in the batch."""
+        from app.repositories.base import BufferedBatchWriter
+
+        db.batch.return_value.commit.side_effect = RuntimeError("unavailable")
+        writer = BufferedBatchWriter(db, window_ms=10)
+
+        results = await asyncio.gather(
+            writer.set("ref-a", {"n": 1}),
+            writer.set("ref-b", {"n": 2}),
+            return_exceptions=True,
+        )
+
+        assert [type(r) for r in results] == [RuntimeError, RuntimeError]
+        db.batch.return_value.commit.assert_awaited_once()
+
+    async def test_failed_commit_raises_from_flush(self, db):
+        """flush() raises the commit error as well as resolving the waiters."""
+        from app.repositories.base import BufferedBatchWriter
+
+        db.batch.return_value.commit.side_effect = RuntimeError("unavailable")
+        writer = BufferedBatchWriter(db, window_ms=60_000)
+        pending = asyncio.create_task(writer.set("ref-a", {"n": 1}))
+        await asyncio.sleep(0)
+
+        with pytest.raises(RuntimeError):
+            await writer.flush()
+        with pytest.raises(RuntimeError):
+            await pending
+
+    async def test_cancelled_trigger_does_not_fail_other_writers(self, db):
+        """Cancelling the caller that filled the batch leaves its commit running."""
+        from app.repositories.base import BufferedBatchWriter
+
+        release = asyncio.Event()
+
+        async def slow_commit(**kwargs):
+            await release.wait()
+
+        db.batch.return_value.commit.side_effect = slow_commit
+        writer = BufferedBatchWriter(db, window_ms=60_000, max_batch_size=2)
+        waiter = asyncio.create_task(writer.set("ref-a", {"n": 1}))
+        trigger = asyncio.create_task(writer.set("ref-b", {"n": 2}))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        trigger.cancel()
+        release.set()
+
+        assert await waiter is None
+        with pytest.raises(asyncio.CancelledError):
+            await trigger
+        db.batch.return_value.commit.assert_awaited_once()
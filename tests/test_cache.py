@@ -0,0 +1,100 @@
+"""
+Unit tests for the in-process TTL cache.
+"""
+
+
+class FakeClock:
+    """Manually advanced clock for expiry tests."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLCache:
+    """Test suite for TTLCache."""
+
+    def test_get_returns_value_until_expired(self):
+        """Entries are served until their TTL elapses."""
+        from app.core.cache import TTLCache
+
+        clock = FakeClock()
+        cache = TTLCache(maxsize=10, ttl=60, timer=clock)
+        cache["user123"] = {"height": 175}
+
+        clock.now = 59
+        assert cache.get("user123") == {"height": 175}
+        assert "user123" in cache
+
+        clock.now = 60
+        assert cache.get("user123") is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        """The least recently used entry is evicted past maxsize."""
+        from app.core.cache import TTLCache
+
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache["a"] = 1
+        cache["b"] = 2
+        cache.get("a")
+        cache["c"] = 3
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_pop_invalidates(self):
+        """pop removes an entry and tolerates missing keys."""
+        from app.core.cache import TTLCache
+
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache["a"] = 1
+
+        assert cache.pop("a") == 1
+        assert cache.pop("a") is None
+        assert cache.get("a") is None
+
+    def test_zero_ttl_disables_caching(self):
+        """A TTL of 0 stores nothing."""
+        from app.core.cache import TTLCache
+
+        cache = TTLCache(maxsize=10, ttl=0)
+        cache["a"] = 1
+
+        assert len(cache) == 0
+
+    def test_fill_stores_reserved_value(self):
+        """A reservation that is not invalidated stores the filled value."""
+        from app.core.cache import TTLCache
+
+        cache = TTLCache(maxsize=10, ttl=60)
+        token = cache.reserve("a")
+        cache.fill("a", token, 1)
+
+        assert cache.get("a") == 1
+
+    def test_pop_voids_reservation(self):
+        """A value read before an invalidation is not stored by fill."""
+        from app.core.cache import TTLCache
+
+        cache = TTLCache(maxsize=10, ttl=60)
+        token = cache.reserve("a")
+        cache.pop("a")
+        cache.fill("a", token, "stale")
+
+        assert cache.get("a") is None
+
+    def test_unfilled_reservations_are_bounded(self):
+        """Reservations that are never filled don't grow past maxsize."""
+        from app.core.cache import TTLCache
+
+        cache = TTLCache(maxsize=2, ttl=60)
+        first = cache.reserve("a")
+        cache.reserve("b")
+        cache.reserve("c")
+        cache.fill("a", first, 1)
+
+        assert cache.get("a") is None
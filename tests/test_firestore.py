@@ -0,0 +1,35 @@
+"""
+Unit tests for the Firestore client lifecycle.
+"""
+
+from google.auth.credentials import AnonymousCredentials
+from google.cloud.firestore_v1 import AsyncClient
+from grpc import ChannelConnectivity
+
+
+class TestCloseFirestoreClient:
+    """Test suite for close_firestore_client."""
+
+    async def test_closes_async_grpc_channel(self, monkeypatch):
+        """The async client's gRPC channel is shut down, not just the client dropped."""
+        from app.db import firestore as firestore_db
+
+        client = AsyncClient(project="test-project", credentials=AnonymousCredentials())
+        channel = client._firestore_api.transport.grpc_channel
+        monkeypatch.setattr(firestore_db, "_async_firestore_client", client)
+
+        await firestore_db.close_firestore_client()
+
+        assert channel.get_state() == ChannelConnectivity.SHUTDOWN
+        assert firestore_db._async_firestore_client is None
+
+    async def test_unused_async_client_closes_without_a_channel(self, monkeypatch):
+        """Closing a client that never made an RPC doesn't create a channel."""
+        from app.db import firestore as firestore_db
+
+        client = AsyncClient(project="test-project", credentials=AnonymousCredentials())
+        monkeypatch.setattr(firestore_db, "_async_firestore_client", client)
+
+        await firestore_db.close_firestore_client()
+
+        assert client._firestore_api_internal is None
@@ -2,6 +2,22 @@
 Tests for health check endpoints.
 """
 
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.api.v1.endpoints import health
+from app.config.settings import settings
+
+
+@pytest.fixture
+def reset_readiness_cache():
+    """Clear the cached readiness result before and after a test."""
+    health._cache.update(ts=0.0, result=None, body=b"", ready_ts=0.0, ready_result=None)
+    yield
+    health._cache.update(ts=0.0, result=None, body=b"", ready_ts=0.0, ready_result=None)
+
 
 class TestHealthEndpoints:
     """Test suite for health check endpoints."""
@@ -33,3 +49,42 @@ class TestHealthEndpoints:
         assert "status" in data
         assert "checks" in data
         assert "firestore" in data["checks"]
+        assert data["checks"]["firestore"] == "healthy"
+
+    def test_readiness_check_is_cached(self, client, reset_readiness_cache, monkeypatch):
+        """Test readiness results are reused within the cache TTL."""
+        mock_check = AsyncMock(return_value=True)
+        monkeypatch.setattr(health, "check_firestore_connection", mock_check)
+
+        first = client.get("/api/v1/health/ready")
+        second = client.get("/api/v1/health/ready")
+
+        assert first.json() == second.json()
+        assert mock_check.await_count == 1
+
+    def test_readiness_check_times_out_hung_dependency(
+        self, client, reset_readiness_cache, monkeypatch
+    ):
+        """Test a dependency check exceeding the timeout is reported unhealthy."""
+
+        async def hang():
+            await asyncio.sleep(1)
+            return True
+
+        monkeypatch.setattr(settings, "readiness_check_timeout", 0.01)
+        monkeypatch.setattr(health, "check_firestore_connection", hang)
+
+        response = client.get("/api/v1/health/ready")
+
+        assert response.status_code == 200
+        assert response.json()["checks"]["firestore"] == "unhealthy"
+
+    async def test_background_refresh_populates_cache(self, reset_readiness_cache, monkeypatch):
+        """Test a background refresh stores the readiness result for probes."""
+        monkeypatch.setattr(health, "check_firestore_connection", AsyncMock(return_value=True))
+
+        async with health._cache_lock:
+            result = await health._refresh_readiness()
+
+        assert result["checks"]["firestore"] == "healthy"
+        assert health._cache["result"] is result
@@ -0,0 +1,25 @@
+"""
+Tests for JSON log formatting.
+"""
+
+import logging
+from decimal import Decimal
+
+import orjson
+
+from app.core.logging import ProductionJsonFormatter
+
+
+class TestProductionJsonFormatter:
+    """Test suite for ProductionJsonFormatter."""
+
+    def test_non_json_extra_is_logged_as_string(self):
+        """Test that an extra orjson can't encode is written as str instead of dropped."""
+        record = logging.LogRecord("test", logging.INFO, __file__, 1, "weighed", None, None)
+        record.weight = Decimal("70.5")
+
+        line = ProductionJsonFormatter().format(record)
+
+        data = orjson.loads(line)
+        assert data["message"] == "weighed"
+        assert data["weight"] == "70.5"
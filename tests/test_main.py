@@ -0,0 +1,45 @@
+"""
+Tests for application startup wiring.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.exceptions import DatabaseError
+from app.main import init_services
+
+
+class TestInitServices:
+    """Test suite for init_services."""
+
+    async def test_repositories_recover_after_firestore_init_failure(self, monkeypatch):
+        """Test that a failed startup client is created on a later call, not kept as None."""
+        doc = MagicMock(exists=True)
+        doc.to_dict.return_value = {"height": 180.0, "weight": 75.0}
+        client = MagicMock()
+        client.collection.return_value.document.return_value.get = AsyncMock(return_value=doc)
+        attempts = [RuntimeError("Firestore unavailable"), client]
+
+        def get_async_firestore_client():
+            result = attempts.pop(0)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        monkeypatch.setattr(
+            "app.db.firestore.get_async_firestore_client", get_async_firestore_client
+        )
+        monkeypatch.setattr("app.main.get_firebase_app", MagicMock)
+        app = SimpleNamespace(state=SimpleNamespace(firestore=None))
+
+        init_services(app)
+        repo = app.state.services.medical_info.repo
+
+        try:
+            with pytest.raises(DatabaseError):
+                await repo.get_by_id("user123")
+            assert await repo.get_by_id("user123") == {"height": 180.0, "weight": 75.0}
+        finally:
+            await app.state.services.symptom_checker.aclose()
@@ -2,13 +2,17 @@
 Tests for medical info API endpoints.
 """
 
-from unittest.mock import patch
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.core.exceptions import DatabaseError
 
 
 class TestMedicalInfoEndpoints:
     """Test suite for medical info endpoints."""
 
-    def test_get_medical_info_success(self, client):
+    def test_get_medical_info_success(self, client, monkeypatch):
         """Test successful retrieval of medical info."""
         user_id = "user123"
         mock_medical_info = {
@@ -17,35 +21,58 @@ class TestMedicalInfoEndpoints:
             "weight": 70.0,
         }
 
-        with patch(
+        monkeypatch.setattr(
+            "app.services.medical_info.MedicalInfoService.get_medical_info",
+            AsyncMock(return_value=mock_medical_info),
+        )
+
+        response = client.get(f"/api/v1/medical-info/{user_id}")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["user_id"] == user_id
+        assert data["height"] == 175.5
+        assert data["weight"] == 70.0
+
+    def test_get_medical_info_omits_stored_metadata(self, client, monkeypatch):
+        """Test that stored fields outside the response schema are not returned."""
+        user_id = "user123"
+        mock_medical_info = {
+            "user_id": user_id,
+            "height": 175.5,
+            "weight": 70.0,
+            "created_at": "2024-01-01T00:00:00Z",
+            "updated_at": "2024-01-02T00:00:00Z",
+        }
+
+        monkeypatch.setattr(
             "app.services.medical_info.MedicalInfoService.get_medical_info",
-            return_value=mock_medical_info,
-        ):
-            response = client.get(f"/api/v1/medical-info/{user_id}")
+            AsyncMock(return_value=mock_medical_info),
+        )
+
+        response = client.get(f"/api/v1/medical-info/{user_id}")
 
-            assert response.status_code == 200
-            data = response.json()
-            assert data["user_id"] == user_id
-            assert data["height"] == 175.5
-            assert data["weight"] == 70.0
+        assert response.status_code == 200
+        assert response.json() == {"user_id": user_id, "height": 175.5, "weight": 70.0}
 
-    def test_get_medical_info_not_found(self, client):
+    def test_get_medical_info_not_found(self, client, monkeypatch):
         """Test 404 when medical info not found."""
         user_id = "nonexistent_user"
 
-        with patch(
+        monkeypatch.setattr(
             "app.services.medical_info.MedicalInfoService.get_medical_info",
-            return_value=None,
-        ):
-            response = client.get(f"/api/v1/medical-info/{user_id}")
+            AsyncMock(return_value=None),
+        )
+
+        response = client.get(f"/api/v1/medical-info/{user_id}")
 
-            assert response.status_code == 404
-            data = response.json()
-            # FastAPI's HTTPException returns a detail field
-            assert "detail" in data
-            assert "not found" in data["detail"].lower()
+        assert response.status_code == 404
+        data = response.json()
+        # FastAPI's HTTPException returns a detail field
+        assert "detail" in data
+        assert "not found" in data["detail"].lower()
 
-    def test_set_medical_info_success(self, client):
+    def test_set_medical_info_success(self, client, monkeypatch):
         """Test successful setting of medical info."""
         user_id = "user123"
         request_data = {
@@ -58,20 +85,21 @@ class TestMedicalInfoEndpoints:
             "weight": 75.5,
         }
 
-        with patch(
+        monkeypatch.setattr(
             "app.services.medical_info.MedicalInfoService.set_medical_info",
-            return_value=mock_response,
-        ):
-            response = client.post(
-                f"/api/v1/medical-info/{user_id}",
-                json=request_data,
-            )
-
-            assert response.status_code == 200
-            data = response.json()
-            assert data["user_id"] == user_id
-            assert data["height"] == 180.0
-            assert data["weight"] == 75.5
+            AsyncMock(return_value=mock_response),
+        )
+
+        response = client.post(
+            f"/api/v1/medical-info/{user_id}",
+            json=request_data,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["user_id"] == user_id
+        assert data["height"] == 180.0
+        assert data["weight"] == 75.5
 
     def test_set_medical_info_invalid_data(self, client):
         """Test validation error with invalid medical info data."""
@@ -116,7 +144,7 @@ class TestMedicalInfoEndpoints:
 
         assert response.status_code == 422
 
-    def test_set_medical_info_service_error(self, client):
+    def test_set_medical_info_service_error(self, client, monkeypatch):
         """Test error handling when service raises a DatabaseError."""
         user_id = "user123"
         request_data = {
@@ -124,37 +152,38 @@ class TestMedicalInfoEndpoints:
             "weight": 70.0,
         }
 
-        from app.core.exceptions import DatabaseError
-
-        with patch(
+        monkeypatch.setattr(
             "app.services.medical_info.MedicalInfoService.set_medical_info",
-            side_effect=DatabaseError(detail="Database error"),
-        ):
-            response = client.post(
-                f"/api/v1/medical-info/{user_id}",
-                json=request_data,
-            )
+            AsyncMock(side_effect=DatabaseError(detail="Database error")),
+        )
+
+        response = client.post(
+            f"/api/v1/medical-info/{user_id}",
+            json=request_data,
+        )
 
-            # DatabaseError is handled by exception handlers
-            assert response.status_code == 500
+        # DatabaseError is handled by exception handlers
+        assert response.status_code == 500
 
-    def test_medical_info_different_users(self, client):
-        """Test medical info operations for different users."""
-        users = [
+    @pytest.mark.parametrize(
+        "user",
+        [
             {"user_id": "user1", "height": 170.0, "weight": 65.0},
             {"user_id": "user2", "height": 180.0, "weight": 80.0},
             {"user_id": "user3", "height": 165.0, "weight": 55.0},
-        ]
-
-        for user in users:
-            with patch(
-                "app.services.medical_info.MedicalInfoService.get_medical_info",
-                return_value=user,
-            ):
-                response = client.get(f"/api/v1/medical-info/{user['user_id']}")
-
-                assert response.status_code == 200
-                data = response.json()
-                assert data["user_id"] == user["user_id"]
-                assert data["height"] == user["height"]
-                assert data["weight"] == user["weight"]
+        ],
+    )
+    def test_medical_info_different_users(self, client, monkeypatch, user):
+        """Test medical info operations for different users."""
+        monkeypatch.setattr(
+            "app.services.medical_info.MedicalInfoService.get_medical_info",
+            AsyncMock(return_value=user),
+        )
+
+        response = client.get(f"/api/v1/medical-info/{user['user_id']}")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["user_id"] == user["user_id"]
+        assert data["height"] == user["height"]
+        assert data["weight"] == user["weight"]
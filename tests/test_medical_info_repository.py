@@ -0,0 +1,51 @@
+"""
+Unit tests for the medical info repository cache.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from app.core.cache import TTLCache
+from app.repositories.medical_info_repository import MedicalInfoRepository
+
+
+def _snapshot(data):
+    """Existing Firestore document snapshot holding data."""
+    doc = MagicMock(exists=True)
+    doc.to_dict.return_value = dict(data)
+    return doc
+
+
+class TestMedicalInfoRepositoryCache:
+    """Test suite for MedicalInfoRepository's read cache."""
+
+    async def test_read_in_flight_during_update_is_not_cached(self):
+        """Test that a read racing an update doesn't cache the pre-update profile."""
+        read_started = asyncio.Event()
+        release_read = asyncio.Event()
+        stored = {"height": 170.0, "weight": 60.0}
+
+        async def get(**kwargs):
+            snapshot = _snapshot(stored)
+            read_started.set()
+            await release_read.wait()
+            return snapshot
+
+        async def update(data, **kwargs):
+            stored.update(weight=data["weight"])
+
+        db = MagicMock()
+        doc_ref = db.collection.return_value.document.return_value
+        doc_ref.get = AsyncMock(side_effect=get)
+        doc_ref.update = AsyncMock(side_effect=update)
+        repo = MedicalInfoRepository(db)
+        repo._cache = TTLCache(maxsize=10, ttl=60)
+
+        read = asyncio.create_task(repo.get_by_id("user123"))
+        await read_started.wait()
+        await repo.update("user123", {"weight": 65.0})
+        release_read.set()
+
+        assert (await read)["weight"] == 60.0
+        assert (await repo.get_by_id("user123"))["weight"] == 65.0
+        assert doc_ref.get.await_count == 2
@@ -0,0 +1,176 @@
+"""
+Unit tests for Realtime Database write batching.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+
+def assert_unlocked(lock) -> None:
+    """Side effect for mocked writes: fail if lock is held during the write."""
+    assert not lock.locked()
+
+
+class TestRealtimeDBBatching:
+    """Test suite for batched RealtimeDBOperations writes."""
+
+    @pytest.fixture
+    def rtdb(self):
+        """RealtimeDBOperations with a long window and a mocked base reference."""
+        from app.db.realtime_db import RealtimeDBOperations
+
+        ops = RealtimeDBOperations(base_path="medical_dashboard", batch_window_ms=60_000)
+        ops._base_ref = MagicMock()
+        yield ops
+        ops._pending.clear()
+        ops._failed.clear()
+        ops.flush()
+
+    def test_writes_coalesce_into_one_update(self, rtdb):
+        """Set, update and delete are sent as a single multi-path update."""
+        rtdb.set("users/a/vitals", {"hr": 70})
+        rtdb.update("users/b", {"vitals": {"hr": 80}})
+        rtdb.delete("users/c")
+
+        rtdb._base_ref.update.assert_not_called()
+        rtdb.flush()
+
+        rtdb._base_ref.update.assert_called_once_with(
+            {"users/a/vitals": {"hr": 70}, "users/b/vitals": {"hr": 80}, "users/c": None}
+        )
+
+    def test_overlapping_path_flushes_pending_first(self, rtdb):
+        """A write under a pending path flushes the earlier batch first."""
+        rtdb.set("users/a", {"name": "A"})
+        rtdb.set("users/a/vitals", {"hr": 70})
+
+        rtdb._base_ref.update.assert_called_once_with({"users/a": {"name": "A"}})
+
+    async def test_async_context_exit_flushes(self, rtdb):
+        """Leaving the async context manager writes buffered changes."""
+        async with rtdb:
+            rtdb.set("users/a", 1)
+
+        rtdb._base_ref.update.assert_called_once_with({"users/a": 1})
+
+    def test_root_set_flushes_pending_first(self, rtdb):
+        """An unbuffered write of the root lands after earlier queued writes."""
+        rtdb.set("users/a", 1)
+        rtdb.set("", {"users": {}})
+
+        assert [c[0] for c in rtdb._base_ref.mock_calls] == ["update", "set"]
+        rtdb._base_ref.update.assert_called_once_with({"users/a": 1})
+
+    def test_push_flushes_pending_first(self, rtdb):
+        """A push lands after earlier queued writes."""
+        rtdb.set("users/a", 1)
+        rtdb.push("users", {"name": "B"})
+
+        names = [c[0] for c in rtdb._base_ref.mock_calls]
+        assert names.index("update") < names.index("child().push")
+
+    def test_failed_timed_flush_keeps_writes_queued(self, rtdb):
+        """Writes from a failed timed flush are retried by the next flush."""
+        rtdb._base_ref.update.side_effect = [RuntimeError("unavailable"), None]
+        rtdb.set("users/a", 1)
+
+        rtdb._flush_on_timer()
+        assert rtdb._failed == [{"users/a": 1}]
+
+        rtdb.flush()
+        assert rtdb._failed == []
+        rtdb._base_ref.update.assert_called_with({"users/a": 1})
+
+    def test_failed_batch_is_written_before_newer_writes(self, rtdb):
+        """A retried batch is written on its own, ahead of writes queued after it failed."""
+        rtdb._base_ref.update.side_effect = [RuntimeError("unavailable"), None, None]
+        rtdb.set("users/a", {"name": "A"})
+        rtdb._flush_on_timer()
+
+        # Overlaps the failed write, so it must not be merged into the same update
+        rtdb.set("users/a/vitals", {"hr": 70})
+        rtdb.flush()
+
+        assert [c.args[0] for c in rtdb._base_ref.update.call_args_list] == [
+            {"users/a": {"name": "A"}},
+            {"users/a": {"name": "A"}},
+            {"users/a/vitals": {"hr": 70}},
+        ]
+
+    def test_update_is_never_split_across_flushes(self, rtdb):
+        """All paths of one update() go out in the same multi-path update."""
+        rtdb.max_batch_size = 2
+        rtdb.set("users/a/name", "A")
+        rtdb.update("users/b/vitals", {"hr": 70, "bp": 120})
+
+        rtdb._base_ref.update.assert_called_once_with(
+            {"users/a/name": "A", "users/b/vitals/hr": 70, "users/b/vitals/bp": 120}
+        )
+
+    def test_flush_writes_outside_the_pending_lock(self, rtdb):
+        """Other writers can queue while a flush is on the network."""
+        rtdb._base_ref.update.side_effect = lambda _: assert_unlocked(rtdb._pending_lock)
+        rtdb.set("users/a", 1)
+        rtdb.flush()
+
+        rtdb._base_ref.update.assert_called_once()
+
+    def test_write_after_failed_timed_flush_raises(self, rtdb):
+        """A write after a failed timed flush reports the failure to its caller."""
+        rtdb._base_ref.update.side_effect = RuntimeError("unavailable")
+        rtdb.set("users/a", 1)
+        rtdb._flush_on_timer()
+
+        with pytest.raises(RuntimeError):
+            rtdb.set("users/b", 2)
+
+        with pytest.raises(RuntimeError):
+            rtdb.close()
+
+
+class TestRealtimeDBUnbatched:
+    """Test suite for RealtimeDBOperations with batching disabled."""
+
+    def test_direct_writes_skip_the_batch_lock(self):
+        """With no batch window, writes don't flush or take the pending lock."""
+        from app.db.realtime_db import RealtimeDBOperations
+
+        ops = RealtimeDBOperations(base_path="medical_dashboard")
+        ops._base_ref = MagicMock()
+        ops._pending_lock = MagicMock()
+
+        ops.set("users/a", 1)
+        ops.push("users", {"name": "B"})
+        ops.update("users/a", {"hr": 70})
+
+        ops._pending_lock.__enter__.assert_not_called()
+        ops._base_ref.update.assert_not_called()
+
+
+class TestRealtimeDBReads:
+    """Test suite for RealtimeDBOperations reads."""
+
+    def test_get_first_limits_server_side(self):
+        """get_first asks the database for only limit children, ordered by key."""
+        from app.db.realtime_db import RealtimeDBOperations
+
+        ops = RealtimeDBOperations(base_path="medical_dashboard")
+        ops._base_ref = MagicMock()
+        query = ops._base_ref.child.return_value.order_by_key.return_value
+        query.limit_to_first.return_value.get.return_value = None
+
+        assert ops.get_first("users", limit=10) == {}
+        ops._base_ref.child.assert_called_once_with("users")
+        query.limit_to_first.assert_called_once_with(10)
+
+    def test_exists_reads_shallow(self):
+        """exists downloads only the top-level keys of the path."""
+        from app.db.realtime_db import RealtimeDBOperations
+
+        ops = RealtimeDBOperations(base_path="medical_dashboard")
+        ops._base_ref = MagicMock()
+        ops._base_ref.child.return_value.get.return_value = {"heartrate": True}
+
+        assert ops.exists("users/a/vitals") is True
+        ops._base_ref.child.return_value.get.assert_called_once_with(shallow=True)
@@ -0,0 +1,28 @@
+"""
+Tests for API schema definitions.
+"""
+
+import importlib
+
+import pytest
+from pydantic_core import SchemaValidator
+
+
+class TestSchemaValidators:
+    """Request/response schemas must be ready to validate as soon as they are imported."""
+
+    @pytest.mark.parametrize(
+        "module, name",
+        [
+            ("app.schemas.authentication", "RegistrationRequest"),
+            ("app.schemas.medical_info", "MedicalInfoRequest"),
+            ("app.schemas.medical_info", "MedicalInfoResponse"),
+            ("app.schemas.symptom_checker", "SymptomCheckerSubmitInput"),
+            ("app.schemas.vitals", "VitalUpdateRequest"),
+        ],
+    )
+    def test_validator_built_at_import(self, module, name):
+        """A deferred (lazily built) validator would move schema compilation onto a request."""
+        model = getattr(importlib.import_module(module), name)
+
+        assert isinstance(model.__pydantic_validator__, SchemaValidator)
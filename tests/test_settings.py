@@ -2,29 +2,31 @@
 Tests for application configuration and settings.
 """
 
-import os
-
 import pytest
 
 
+@pytest.fixture(scope="module")
+def default_settings():
+    """Settings built once from the test environment and shared by read-only tests."""
+    from app.config.settings import Settings
+
+    return Settings()
+
+
 class TestSettings:
     """Test suite for application settings."""
 
-    def test_settings_defaults(self):
+    def test_settings_defaults(self, default_settings):
         """Test default settings values."""
-        from app.config.settings import Settings
+        assert default_settings.environment.value == "development"
+        assert default_settings.port == 8080
+        assert default_settings.api_prefix == "/api/v1"
+        assert default_settings.firestore_database_id == "(default)"
 
-        settings = Settings()
-
-        assert settings.environment.value == "development"
-        assert settings.port == 8080
-        assert settings.api_prefix == "/api/v1"
-        assert settings.firestore_database_id == "(default)"
-
-    def test_settings_from_env(self):
+    def test_settings_from_env(self, monkeypatch):
         """Test settings can be loaded from environment variables."""
-        os.environ["APP_NAME"] = "Test API"
-        os.environ["PORT"] = "9000"
+        monkeypatch.setenv("APP_NAME", "Test API")
+        monkeypatch.setenv("PORT", "9000")
 
         from app.config.settings import Settings
 
@@ -33,14 +35,11 @@ class TestSettings:
         assert settings.app_name == "Test API"
         assert settings.port == 9000
 
-        # Cleanup
-        del os.environ["APP_NAME"]
-        del os.environ["PORT"]
-
     def test_cors_origins_list(self):
         """Test CORS origins parsing."""
         from app.config.settings import Settings
 
+        # Constructed: model_copy would skip model_post_init, where the list is parsed
         settings = Settings(cors_origins="http://localhost:3000,http://localhost:8080")
 
         origins = settings.cors_origins_list
@@ -69,6 +68,7 @@ class TestSettings:
         """Test environment check properties."""
         from app.config.settings import Environment, Settings
 
+        # Constructed: the environment flags are derived in model_post_init
         dev_settings = Settings(environment=Environment.DEVELOPMENT)
         assert dev_settings.is_development is True
         assert dev_settings.is_production is False
@@ -76,3 +76,5 @@ class TestSettings:
         prod_settings = Settings(environment=Environment.PRODUCTION)
         assert prod_settings.is_production is True
         assert prod_settings.is_development is False
+        assert prod_settings.environment_name == "production"
+        assert type(prod_settings.environment_name) is str
@@ -2,7 +2,33 @@
 Tests for symptom checker API endpoints.
 """
 
-from unittest.mock import patch
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.api.v1.endpoints.symptom_checker import get_symptom_checker_service
+from app.core.exceptions import APIException, DatabaseError
+from app.services.symptom_checker import SymptomCheckerService
+
+
+@pytest.fixture(scope="module")
+def symptom_service_prototype():
+    """Spec'd service mock built once for the module."""
+    return MagicMock(spec=SymptomCheckerService)
+
+
+@pytest.fixture
+def symptom_service_mock(app, symptom_service_prototype):
+    """
+    Serve the symptom checker dependency from the module's service mock.
+
+    The mock is reset for each test, so return values and side effects set
+    by one test do not reach the next.
+    """
+    symptom_service_prototype.reset_mock(return_value=True, side_effect=True)
+    app.dependency_overrides[get_symptom_checker_service] = lambda: symptom_service_prototype
+    return symptom_service_prototype
 
 
 class TestSymptomCheckerEndpoints:
@@ -12,52 +38,49 @@ class TestSymptomCheckerEndpoints:
     # /init endpoint tests
     # -------------------------------------------------------------------------
 
-    def test_init_success(self, client):
+    def test_init_success(self, client, symptom_service_mock):
         """Test successful symptom checker initialization."""
         mock_response = {"conversation_id": "conv-123"}
 
-        with patch(
-            "app.services.symptom_checker.SymptomCheckerService.init",
-            return_value=mock_response,
-        ):
-            response = client.post("/api/v1/symptom-checker/init")
+        symptom_service_mock.init.return_value = mock_response
 
-            assert response.status_code == 200
-            data = response.json()
-            assert data["conversation_id"] == "conv-123"
+        response = client.post("/api/v1/symptom-checker/init")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["conversation_id"] == "conv-123"
 
-    def test_init_returns_conversation_id(self, client):
+    def test_init_returns_conversation_id(self, client, symptom_service_mock):
         """Test that init endpoint returns a conversation_id."""
         mock_response = {"conversation_id": "test-conv-id"}
 
-        with patch(
-            "app.services.symptom_checker.SymptomCheckerService.init",
-            return_value=mock_response,
-        ):
-            response = client.post("/api/v1/symptom-checker/init")
+        symptom_service_mock.init.return_value = mock_response
 
-            assert response.status_code == 200
-            data = response.json()
-            assert "conversation_id" in data
+        response = client.post("/api/v1/symptom-checker/init")
 
-    def test_init_service_error(self, client):
-        """Test init endpoint when service raises a DatabaseError."""
-        from app.core.exceptions import DatabaseError
+        assert response.status_code == 200
+        data = response.json()
+        assert "conversation_id" in data
 
-        with patch(
-            "app.services.symptom_checker.SymptomCheckerService.init",
-            side_effect=DatabaseError(detail="Database error"),
-        ):
-            response = client.post("/api/v1/symptom-checker/init")
+    @pytest.mark.parametrize(
+        "error",
+        [DatabaseError(detail="Database error"), APIException(detail="Custom API error")],
+        ids=["database-error", "api-exception"],
+    )
+    def test_init_service_error(self, client, symptom_service_mock, error):
+        """Test init endpoint when the service raises an API error."""
+        symptom_service_mock.init.side_effect = error
 
-            # DatabaseError is handled by exception handlers
-            assert response.status_code == 500
+        response = client.post("/api/v1/symptom-checker/init")
+
+        # API errors are handled by exception handlers
+        assert response.status_code == 500
 
     # -------------------------------------------------------------------------
     # /submit endpoint tests
     # -------------------------------------------------------------------------
 
-    def test_submit_success(self, client):
+    def test_submit_success(self, client, symptom_service_mock):
         """Test successful symptom submission."""
         mock_response = {"detail": "Symptoms submitted successfully."}
         request_data = {
@@ -65,121 +88,79 @@ class TestSymptomCheckerEndpoints:
             "symptoms": ["headache", "fever"],
         }
 
-        with patch(
-            "app.services.symptom_checker.SymptomCheckerService.submit",
-            return_value=mock_response,
-        ):
-            response = client.post(
-                "/api/v1/symptom-checker/submit",
-                json=request_data,
-            )
-
-            assert response.status_code == 200
-            data = response.json()
-            assert data["detail"] == "Symptoms submitted successfully."
-
-    def test_submit_missing_conversation_id(self, client):
-        """Test validation error when conversation_id is missing."""
-        incomplete_data = {
-            "symptoms": ["headache"],
-        }
+        symptom_service_mock.submit.return_value = mock_response
 
         response = client.post(
             "/api/v1/symptom-checker/submit",
-            json=incomplete_data,
+            json=request_data,
         )
 
-        assert response.status_code == 422
-
-    def test_submit_missing_symptoms(self, client):
-        """Test validation error when symptoms list is missing."""
-        incomplete_data = {
-            "conversation_id": "conv-123",
-        }
-
+        assert response.status_code == 200
+        data = response.json()
+        assert data["detail"] == "Symptoms submitted successfully."
+
+    @pytest.mark.parametrize(
+        "request_data",
+        [
+            {"symptoms": ["headache"]},
+            {"conversation_id": "conv-123"},
+            {},
+        ],
+        ids=["missing-conversation-id", "missing-symptoms", "empty"],
+    )
+    def test_submit_invalid_data(self, client, request_data):
+        """Test validation error when required submit fields are missing."""
         response = client.post(
             "/api/v1/symptom-checker/submit",
-            json=incomplete_data,
+            json=request_data,
         )
 
         assert response.status_code == 422
 
-    def test_submit_invalid_data(self, client):
-        """Test validation error with completely invalid data."""
-        response = client.post(
-            "/api/v1/symptom-checker/submit",
-            json={},
-        )
-
-        assert response.status_code == 422
-
-    def test_submit_service_error(self, client):
-        """Test submit endpoint when service raises a DatabaseError."""
-        from app.core.exceptions import DatabaseError
-
+    @pytest.mark.parametrize(
+        "error",
+        [DatabaseError(detail="Database error"), APIException(detail="Agent error")],
+        ids=["database-error", "api-exception"],
+    )
+    def test_submit_service_error(self, client, symptom_service_mock, error):
+        """Test submit endpoint when the service raises an API error."""
         request_data = {
             "conversation_id": "conv-123",
             "symptoms": ["headache"],
         }
 
-        with patch(
-            "app.services.symptom_checker.SymptomCheckerService.submit",
-            side_effect=DatabaseError(detail="Database error"),
-        ):
-            response = client.post(
-                "/api/v1/symptom-checker/submit",
-                json=request_data,
-            )
+        symptom_service_mock.submit.side_effect = error
 
-            # DatabaseError is handled by exception handlers
-            assert response.status_code == 500
-
-    def test_submit_api_exception(self, client):
-        """Test submit endpoint when service raises an APIException."""
-        from app.core.exceptions import APIException
-
-        request_data = {
-            "conversation_id": "conv-123",
-            "symptoms": ["headache"],
-        }
-
-        with patch(
-            "app.services.symptom_checker.SymptomCheckerService.submit",
-            side_effect=APIException(detail="Agent error"),
-        ):
-            response = client.post(
-                "/api/v1/symptom-checker/submit",
-                json=request_data,
-            )
+        response = client.post(
+            "/api/v1/symptom-checker/submit",
+            json=request_data,
+        )
 
-            # APIException is handled by exception handlers
-            assert response.status_code == 500
+        # API errors are handled by exception handlers
+        assert response.status_code == 500
 
-    def test_submit_different_symptoms(self, client):
-        """Test symptom submission with different symptom lists."""
+    async def test_submit_different_symptoms(self, aclient, symptom_service_mock):
+        """Test concurrent symptom submissions with different symptom lists."""
         test_cases = [
             {"conversation_id": "conv-1", "symptoms": ["headache"]},
             {"conversation_id": "conv-2", "symptoms": ["fever", "cough", "fatigue"]},
             {"conversation_id": "conv-3", "symptoms": ["nausea", "dizziness"]},
         ]
+        symptom_service_mock.submit.return_value = {"detail": "Symptoms submitted successfully."}
 
-        for request_data in test_cases:
-            mock_response = {"detail": "Symptoms submitted successfully."}
-
-            with patch(
-                "app.services.symptom_checker.SymptomCheckerService.submit",
-                return_value=mock_response,
-            ):
-                response = client.post(
-                    "/api/v1/symptom-checker/submit",
-                    json=request_data,
-                )
+        responses = await asyncio.gather(
+            *(
+                aclient.post("/api/v1/symptom-checker/submit", json=request_data)
+                for request_data in test_cases
+            )
+        )
 
-                assert response.status_code == 200
-                data = response.json()
-                assert data["detail"] == "Symptoms submitted successfully."
+        for response in responses:
+            assert response.status_code == 200
+            assert response.json()["detail"] == "Symptoms submitted successfully."
+        assert symptom_service_mock.submit.await_count == len(test_cases)
 
-    def test_submit_empty_symptoms_list(self, client):
+    def test_submit_empty_symptoms_list(self, client, symptom_service_mock):
         """Test symptom submission with an empty symptoms list."""
         mock_response = {"detail": "Symptoms submitted successfully."}
         request_data = {
@@ -187,13 +168,11 @@ class TestSymptomCheckerEndpoints:
             "symptoms": [],
         }
 
-        with patch(
-            "app.services.symptom_checker.SymptomCheckerService.submit",
-            return_value=mock_response,
-        ):
-            response = client.post(
-                "/api/v1/symptom-checker/submit",
-                json=request_data,
-            )
+        symptom_service_mock.submit.return_value = mock_response
 
-            assert response.status_code == 200
+        response = client.post(
+            "/api/v1/symptom-checker/submit",
+            json=request_data,
+        )
+
+        assert response.status_code == 200
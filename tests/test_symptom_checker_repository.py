@@ -0,0 +1,43 @@
+"""
+Unit tests for the symptom checker repository.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+from app.repositories.base import BufferedBatchWriter
+from app.repositories.symptom_checker import SymptomCheckerRepository
+
+
+class TestCreateTurn:
+    """Test suite for SymptomCheckerRepository.create_turn."""
+
+    @staticmethod
+    def make_db() -> MagicMock:
+        """Async Firestore client mock whose conversations all exist."""
+        db = MagicMock()
+        conversation_ref = db.collection.return_value.document.return_value
+        conversation_ref.get = AsyncMock(return_value=MagicMock(exists=True))
+        db.batch.return_value.commit = AsyncMock()
+        return db
+
+    async def test_turn_is_one_batched_commit(self):
+        """Both messages of a turn go out in a single commit."""
+        db = self.make_db()
+
+        await SymptomCheckerRepository(db).create_turn("conv-1", ["fever"], ["Rest"], "result")
+
+        assert db.batch.return_value.set.call_count == 2
+        db.batch.return_value.commit.assert_awaited_once()
+
+    async def test_turn_shares_the_writer_batch(self):
+        """With a batch writer, both messages join the same buffered commit."""
+        db = self.make_db()
+        writer = BufferedBatchWriter(db, window_ms=1)
+
+        await SymptomCheckerRepository(db, writer=writer).create_turn(
+            "conv-1", ["fever"], ["Rest"], "result"
+        )
+
+        db.batch.assert_called_once()
+        assert db.batch.return_value.set.call_count == 2
+        db.batch.return_value.commit.assert_awaited_once()
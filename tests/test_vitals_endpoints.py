@@ -2,13 +2,39 @@
 Tests for vitals API endpoints.
 """
 
-from unittest.mock import patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.api.v1.endpoints.vitals import get_vitals_service
+from app.core.exceptions import DatabaseError
+from app.services.vitals import VitalsService
+
+
+@pytest.fixture(scope="module")
+def vitals_service_prototype():
+    """Spec'd service mock built once for the module."""
+    return MagicMock(spec=VitalsService)
+
+
+@pytest.fixture
+def vitals_service_mock(app, vitals_service_prototype):
+    """
+    Serve the vitals dependency from the module's service mock.
+
+    The mock is reset for each test, so return values and side effects set
+    by one test do not reach the next.
+    """
+    vitals_service_prototype.reset_mock(return_value=True, side_effect=True)
+    app.dependency_overrides[get_vitals_service] = lambda: vitals_service_prototype
+    return vitals_service_prototype
 
 
 class TestVitalsEndpoints:
     """Test suite for vitals endpoints."""
 
-    def test_update_vitals_success(self, client):
+    def test_update_vitals_success(self, client, vitals_service_mock):
         """Test successful vitals update."""
         user_id = "user123"
         mock_response = {
@@ -18,55 +44,45 @@ class TestVitalsEndpoints:
             "blood_pressure": 120,
         }
 
-        with patch(
-            "app.services.vitals.VitalsService.update_vitals",
-            return_value=mock_response,
-        ):
-            response = client.post(f"/api/v1/vitals/{user_id}")
-
-            assert response.status_code == 200
-            data = response.json()
-            assert data["status"] == "updated"
-            assert data["user_id"] == user_id
-            assert "heartrate" in data
-            assert "blood_pressure" in data
-
-    def test_update_vitals_different_users(self, client):
-        """Test vitals update for different users."""
-        for user_id in ["user1", "user2", "user3"]:
-            mock_response = {
-                "status": "updated",
-                "user_id": user_id,
-                "heartrate": 80,
-                "blood_pressure": 125,
-            }
-
-            with patch(
-                "app.services.vitals.VitalsService.update_vitals",
-                return_value=mock_response,
-            ):
-                response = client.post(f"/api/v1/vitals/{user_id}")
-
-                assert response.status_code == 200
-                data = response.json()
-                assert data["user_id"] == user_id
-
-    def test_update_vitals_service_error(self, client):
+        vitals_service_mock.update_vitals.return_value = mock_response
+
+        response = client.post(f"/api/v1/vitals/{user_id}")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "updated"
+        assert data["user_id"] == user_id
+        assert "heartrate" in data
+        assert "blood_pressure" in data
+
+    async def test_update_vitals_different_users(self, aclient, vitals_service_mock):
+        """Test concurrent vitals updates for different users."""
+        user_ids = ["user1", "user2", "user3"]
+
+        vitals_service_mock.update_vitals.side_effect = lambda user_id: {
+            "status": "updated",
+            "user_id": user_id,
+            "heartrate": 80,
+            "blood_pressure": 125,
+        }
+
+        responses = await asyncio.gather(*(aclient.post(f"/api/v1/vitals/{u}") for u in user_ids))
+
+        assert [response.status_code for response in responses] == [200] * len(user_ids)
+        assert [response.json()["user_id"] for response in responses] == user_ids
+
+    def test_update_vitals_service_error(self, client, vitals_service_mock):
         """Test vitals update when service raises a DatabaseError."""
         user_id = "user123"
 
-        from app.core.exceptions import DatabaseError
+        vitals_service_mock.update_vitals.side_effect = DatabaseError(detail="Database error")
 
-        with patch(
-            "app.services.vitals.VitalsService.update_vitals",
-            side_effect=DatabaseError(detail="Database error"),
-        ):
-            response = client.post(f"/api/v1/vitals/{user_id}")
+        response = client.post(f"/api/v1/vitals/{user_id}")
 
-            # DatabaseError is handled by exception handlers
-            assert response.status_code == 500
+        # DatabaseError is handled by exception handlers
+        assert response.status_code == 500
 
-    def test_update_vitals_with_special_characters_in_user_id(self, client):
+    def test_update_vitals_with_special_characters_in_user_id(self, client, vitals_service_mock):
         """Test vitals update with user IDs containing special characters."""
         user_id = "user-123_test.name"
         mock_response = {
@@ -76,31 +92,63 @@ class TestVitalsEndpoints:
             "blood_pressure": 118,
         }
 
-        with patch(
-            "app.services.vitals.VitalsService.update_vitals",
-            return_value=mock_response,
-        ):
-            response = client.post(f"/api/v1/vitals/{user_id}")
+        vitals_service_mock.update_vitals.return_value = mock_response
 
-            assert response.status_code == 200
-            data = response.json()
-            assert data["user_id"] == user_id
+        response = client.post(f"/api/v1/vitals/{user_id}")
 
-    def test_update_vitals_generates_random_values(self, client):
+        assert response.status_code == 200
+        data = response.json()
+        assert data["user_id"] == user_id
+
+    def test_update_vitals_generates_random_values(self, client, monkeypatch):
         """Test that vitals update generates random values within expected ranges."""
         user_id = "user123"
+        mock_getrandbits = MagicMock(return_value=74)  # Controlled random value
+
+        monkeypatch.setattr("app.services.vitals.random.getrandbits", mock_getrandbits)
+        monkeypatch.setattr(
+            "app.repositories.vitals_repository.VitalsRepository.update_user_vitals",
+            AsyncMock(return_value=None),
+        )
+
+        response = client.post(f"/api/v1/vitals/{user_id}")
+
+        assert response.status_code == 200
+        # Verify one draw covered both heartrate and blood_pressure
+        mock_getrandbits.assert_called_once_with(20)
+        assert response.json()["heartrate"] == 75
+
+    def test_bulk_update_vitals_success(self, client, monkeypatch):
+        """Test updating several users' vitals in one request."""
+        mock_bulk = AsyncMock(return_value=None)
+
+        monkeypatch.setattr(
+            "app.repositories.vitals_repository.VitalsRepository.bulk_update_vitals", mock_bulk
+        )
+
+        response = client.post("/api/v1/vitals", json={"user_ids": ["user1", "user2"]})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "updated"
+        assert [r["user_id"] for r in data["results"]] == ["user1", "user2"]
+        mock_bulk.assert_awaited_once()
+
+    def test_bulk_update_vitals_requires_user_ids(self, client):
+        """Test that an empty user list is rejected."""
+        response = client.post("/api/v1/vitals", json={"user_ids": []})
 
-        with patch("app.services.vitals.random.randint") as mock_randint:
-            mock_randint.return_value = 75  # Controlled random value
+        assert response.status_code == 422
 
-            with patch(
-                "app.repositories.vitals_repository.VitalsRepository.update_user_vitals"
-            ) as mock_update:
-                mock_update.return_value = None
+    @pytest.mark.parametrize("user_id", ["", "a/b", "a.b", "a#b", "a$b", "a[b", "a]b"])
+    def test_bulk_update_vitals_rejects_invalid_user_ids(self, client, monkeypatch, user_id):
+        """Test that empty IDs and IDs with path or key characters are rejected."""
+        mock_bulk = AsyncMock(return_value=None)
+        monkeypatch.setattr(
+            "app.repositories.vitals_repository.VitalsRepository.bulk_update_vitals", mock_bulk
+        )
 
-                response = client.post(f"/api/v1/vitals/{user_id}")
+        response = client.post("/api/v1/vitals", json={"user_ids": ["user1", user_id]})
 
-                assert response.status_code == 200
-                # Verify random was called twice (for heartrate and blood_pressure)
-                assert mock_randint.call_count == 2
-                mock_randint.assert_any_call(1, 1000)
+        assert response.status_code == 422
+        mock_bulk.assert_not_awaited()
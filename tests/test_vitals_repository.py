@@ -0,0 +1,22 @@
+"""
+Unit tests for the vitals repository.
+"""
+
+from unittest.mock import MagicMock
+
+from app.repositories.vitals_repository import UPDATE_TIMESTAMPS, VitalsRepository
+
+
+class TestVitalsRepository:
+    """Test suite for VitalsRepository."""
+
+    async def test_update_user_vitals_accepts_interface_keywords(self):
+        """update_user_vitals takes the IVitalsRepository argument names."""
+        rdb = MagicMock()
+        repo = VitalsRepository(rdb)
+
+        await repo.update_user_vitals(user_id="user1", vitals_data={"heartrate": 70})
+
+        rdb.update.assert_called_once_with(
+            "users/user1/vitals", {"heartrate": 70, **UPDATE_TIMESTAMPS}
+        )
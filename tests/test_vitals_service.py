@@ -2,134 +2,171 @@
 Unit tests for Vitals Service.
 """
 
-from unittest.mock import AsyncMock, patch
+import random
+import time
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from app.core.exceptions import DatabaseError
+from app.services.vitals import VitalsService
+
+
+def _bits(heartrate, blood_pressure):
+    """Random draw that _generate_vitals turns into the given readings."""
+    return (blood_pressure - 1) << 10 | (heartrate - 1)
+
+
+def _fix_draws(monkeypatch, *draws, now=1234567890):
+    """
+    Make random.getrandbits return each of draws in turn and time.time return now.
+
+    Returns:
+        The bit counts getrandbits was called with.
+    """
+    calls = []
+    values = iter(draws)
+
+    def getrandbits(k):
+        calls.append(k)
+        return next(values)
+
+    monkeypatch.setattr(random, "getrandbits", getrandbits)
+    monkeypatch.setattr(time, "time", lambda: now)
+    return calls
+
 
 class TestVitalsService:
     """Test suite for VitalsService."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def mock_vitals_repo(self):
-        """Mock vitals repository."""
-        mock = AsyncMock()
-        mock.update_user_vitals.return_value = None
-        return mock
+        """Mock vitals repository with awaitable write methods, built once for the class."""
+        return MagicMock(update_user_vitals=AsyncMock(), bulk_update_vitals=AsyncMock())
 
-    @pytest.fixture
-    def vitals_service(self, mock_vitals_repo):
-        """Create a VitalsService with mocked repository."""
-        from app.services.vitals import VitalsService
+    @pytest.fixture(autouse=True)
+    def _reset_vitals_repo(self, mock_vitals_repo):
+        """Reset the shared repository mock and restore its default return values."""
+        mock_vitals_repo.reset_mock(return_value=True, side_effect=True)
+        mock_vitals_repo.update_user_vitals.return_value = None
 
+    @pytest.fixture(scope="class")
+    def vitals_service(self, mock_vitals_repo):
+        """Create one VitalsService with the mocked repository for the class."""
         return VitalsService(mock_vitals_repo)
 
-    @pytest.mark.asyncio
-    async def test_update_vitals_success(self, vitals_service, mock_vitals_repo):
+    async def test_update_vitals_success(self, vitals_service, mock_vitals_repo, monkeypatch):
         """Test successful vitals update."""
         user_id = "user123"
 
-        with patch("time.time", return_value=1234567890):
-            with patch("random.randint", side_effect=[75, 120]):
-                result = await vitals_service.update_vitals(user_id)
+        _fix_draws(monkeypatch, _bits(75, 120))
 
-                assert result["status"] == "updated"
-                assert result["user_id"] == user_id
-                assert result["heartrate"] == 75
-                assert result["blood_pressure"] == 120
-                mock_vitals_repo.update_user_vitals.assert_called_once()
+        result = await vitals_service.update_vitals(user_id)
 
-    @pytest.mark.asyncio
-    async def test_update_vitals_low_heartrate(self, vitals_service, mock_vitals_repo):
+        assert result["status"] == "updated"
+        assert result["user_id"] == user_id
+        assert result["heartrate"] == 75
+        assert result["blood_pressure"] == 120
+        mock_vitals_repo.update_user_vitals.assert_called_once()
+
+    async def test_update_vitals_low_heartrate(self, vitals_service, mock_vitals_repo, monkeypatch):
         """Test vitals update with low heartrate sets status to 'Low'."""
         user_id = "user123"
 
-        with patch("time.time", return_value=1234567890):
-            with patch("random.randint", side_effect=[50, 120]):  # Low heartrate
-                _ = await vitals_service.update_vitals(user_id)
+        _fix_draws(monkeypatch, _bits(50, 120))  # Low heartrate
+
+        _ = await vitals_service.update_vitals(user_id)
 
-                # Verify repository was called with correct status
-                call_args = mock_vitals_repo.update_user_vitals.call_args[0]
-                vitals_data = call_args[1]
-                assert vitals_data["heart_rate"]["status"] == "Low"
+        # Verify repository was called with correct status
+        vitals_data = mock_vitals_repo.update_user_vitals.call_args.args[1]
+        assert vitals_data["heart_rate"]["status"] == "Low"
 
-    @pytest.mark.asyncio
-    async def test_update_vitals_normal_heartrate(self, vitals_service, mock_vitals_repo):
+    async def test_update_vitals_normal_heartrate(
+        self, vitals_service, mock_vitals_repo, monkeypatch
+    ):
         """Test vitals update with normal heartrate sets status to 'Normal'."""
         user_id = "user123"
 
-        with patch("time.time", return_value=1234567890):
-            with patch("random.randint", side_effect=[75, 120]):  # Normal heartrate
-                _ = await vitals_service.update_vitals(user_id)
+        _fix_draws(monkeypatch, _bits(75, 120))  # Normal heartrate
+
+        _ = await vitals_service.update_vitals(user_id)
 
-                call_args = mock_vitals_repo.update_user_vitals.call_args[0]
-                vitals_data = call_args[1]
-                assert vitals_data["heart_rate"]["status"] == "Normal"
+        vitals_data = mock_vitals_repo.update_user_vitals.call_args.args[1]
+        assert vitals_data["heart_rate"]["status"] == "Normal"
 
-    @pytest.mark.asyncio
-    async def test_update_vitals_high_blood_pressure(self, vitals_service, mock_vitals_repo):
+    async def test_update_vitals_high_blood_pressure(
+        self, vitals_service, mock_vitals_repo, monkeypatch
+    ):
         """Test vitals update with high blood pressure sets status to 'Watch'."""
         user_id = "user123"
 
-        with patch("time.time", return_value=1234567890):
-            with patch("random.randint", side_effect=[75, 140]):  # High blood pressure
-                _ = await vitals_service.update_vitals(user_id)
+        _fix_draws(monkeypatch, _bits(75, 140))  # High blood pressure
 
-                call_args = mock_vitals_repo.update_user_vitals.call_args[0]
-                vitals_data = call_args[1]
-                assert vitals_data["blood_pressure"]["status"] == "Watch"
+        _ = await vitals_service.update_vitals(user_id)
 
-    @pytest.mark.asyncio
-    async def test_update_vitals_normal_blood_pressure(self, vitals_service, mock_vitals_repo):
+        vitals_data = mock_vitals_repo.update_user_vitals.call_args.args[1]
+        assert vitals_data["blood_pressure"]["status"] == "Watch"
+
+    async def test_update_vitals_normal_blood_pressure(
+        self, vitals_service, mock_vitals_repo, monkeypatch
+    ):
         """Test vitals update with normal blood pressure sets status to 'Normal'."""
         user_id = "user123"
 
-        with patch("time.time", return_value=1234567890):
-            with patch("random.randint", side_effect=[75, 120]):  # Normal blood pressure
-                _ = await vitals_service.update_vitals(user_id)
+        _fix_draws(monkeypatch, _bits(75, 120))  # Normal blood pressure
+
+        _ = await vitals_service.update_vitals(user_id)
 
-                call_args = mock_vitals_repo.update_user_vitals.call_args[0]
-                vitals_data = call_args[1]
-                assert vitals_data["blood_pressure"]["status"] == "Normal"
+        vitals_data = mock_vitals_repo.update_user_vitals.call_args.args[1]
+        assert vitals_data["blood_pressure"]["status"] == "Normal"
 
-    @pytest.mark.asyncio
-    async def test_update_vitals_includes_timestamp(self, vitals_service, mock_vitals_repo):
+    async def test_update_vitals_includes_timestamp(
+        self, vitals_service, mock_vitals_repo, monkeypatch
+    ):
         """Test vitals update includes timestamp in data."""
         user_id = "user123"
         mock_timestamp = 1234567890
 
-        with patch("time.time", return_value=mock_timestamp):
-            with patch("random.randint", side_effect=[75, 120]):
-                await vitals_service.update_vitals(user_id)
+        _fix_draws(monkeypatch, _bits(75, 120), now=mock_timestamp)
 
-                call_args = mock_vitals_repo.update_user_vitals.call_args[0]
-                vitals_data = call_args[1]
-                assert vitals_data["heart_rate"]["updated_at"] == mock_timestamp
-                assert vitals_data["blood_pressure"]["updated_at"] == mock_timestamp
+        await vitals_service.update_vitals(user_id)
+
+        vitals_data = mock_vitals_repo.update_user_vitals.call_args.args[1]
+        assert vitals_data["heart_rate"]["updated_at"] == mock_timestamp
+        assert vitals_data["blood_pressure"]["updated_at"] == mock_timestamp
 
-    @pytest.mark.asyncio
     async def test_update_vitals_repository_error(self, vitals_service, mock_vitals_repo):
         """Test database error handling."""
         user_id = "user123"
 
         mock_vitals_repo.update_user_vitals.side_effect = Exception("Database error")
 
-        from app.core.exceptions import DatabaseError
-
         with pytest.raises(DatabaseError):
             await vitals_service.update_vitals(user_id)
 
-    @pytest.mark.asyncio
-    async def test_update_vitals_random_range(self, vitals_service):
+    async def test_update_vitals_random_range(self, vitals_service, monkeypatch):
         """Test that random values are generated within expected range."""
         user_id = "user123"
 
-        with patch("random.randint") as mock_randint:
-            mock_randint.return_value = 500
+        calls = _fix_draws(monkeypatch, (1 << 20) - 1)
+
+        result = await vitals_service.update_vitals(user_id)
+
+        # One 20-bit draw covers both readings, each in 1..1024
+        assert calls == [20]
+        assert result["heartrate"] == 1024
+        assert result["blood_pressure"] == 1024
+
+    async def test_bulk_update_vitals_single_write(
+        self, vitals_service, mock_vitals_repo, monkeypatch
+    ):
+        """Test that a bulk update stores every user's vitals in one repository call."""
+        _fix_draws(monkeypatch, _bits(75, 120), _bits(50, 140))
 
-            with patch("time.time", return_value=1234567890):
-                await vitals_service.update_vitals(user_id)
+        result = await vitals_service.bulk_update_vitals(["user1", "user2"])
 
-                # Verify random.randint was called with correct range
-                assert mock_randint.call_count == 2
-                mock_randint.assert_called_with(1, 1000)
+        mock_vitals_repo.bulk_update_vitals.assert_awaited_once()
+        updates = mock_vitals_repo.bulk_update_vitals.call_args.args[0]
+        assert set(updates) == {"user1", "user2"}
+        assert updates["user2"]["heart_rate"]["status"] == "Low"
+        assert result["results"][0] == {"user_id": "user1", "heartrate": 75, "blood_pressure": 120}